@@ -4,28 +4,74 @@ FastAPI의 Depends를 통해 서비스 인스턴스를 라우트에 주입한다
 """
 
 import logging
+from typing import Optional
 
 from fastapi import Depends, Header, HTTPException
 
+from api.middleware import is_admin_token
 from services.korail_service import KorailService
+from services.session_registry import KorailSessionRegistry
+from services.single_flight import SingleFlight
 from services.tago_service import TaGoService
+from services.timetable_index import TimetableIndex, TimetablePrefetcher
+from services.watch_service import WatchService
 
 logger = logging.getLogger(__name__)
 
 # ──────────────────────────────────────────────
 # 싱글톤 서비스 인스턴스
 # ──────────────────────────────────────────────
-_korail_service = KorailService()
-_tago_service = TaGoService()
+# 코레일 세션은 사용자마다 독립적이므로 session_token별로 레지스트리에 보관한다.
+_session_registry = KorailSessionRegistry()
+# TAGO_INDEX_PATH가 설정된 경우에만 로컬 시간표 인덱스와 일괄 수집 작업을 사용한다.
+_timetable_index = TimetableIndex.from_env()
+_tago_service = TaGoService(index=_timetable_index)
+_timetable_prefetcher = (
+    TimetablePrefetcher(_tago_service, _timetable_index)
+    if _timetable_index is not None
+    else None
+)
+_watch_service = WatchService()
+# 동일 조건 열차 조회의 in-flight 중복 제거 (provider, dep, arr, date, time)
+_search_flight = SingleFlight("train-search")
+
+
+def _extract_bearer_token(authorization: Optional[str]) -> Optional[str]:
+    """Authorization 헤더에서 Bearer 토큰을 추출한다. 형식이 잘못되면 None."""
+    if not authorization:
+        return None
+    parts = authorization.split(" ")
+    if len(parts) != 2 or parts[0].lower() != "bearer" or not parts[1]:
+        return None
+    return parts[1]
+
+
+async def get_session_registry() -> KorailSessionRegistry:
+    """
+    세션 레지스트리 싱글톤 인스턴스를 반환한다.
+
+    로그인 시 발급된 session_token → KorailService 매핑을 관리한다.
+    """
+    return _session_registry
 
 
-async def get_korail_service() -> KorailService:
+async def get_korail_service(
+    authorization: str = Header(None, description="Bearer {session_token}"),
+    registry: KorailSessionRegistry = Depends(get_session_registry),
+) -> KorailService:
     """
-    KorailService 싱글톤 인스턴스를 반환한다.
+    요청자의 KorailService 인스턴스를 반환한다.
 
+    Bearer 토큰에 해당하는 세션이 있으면 해당 사용자의 서비스를,
+    없으면 로그인 전 상태의 새 서비스를 반환한다.
     FastAPI의 Depends()를 통해 라우트 함수에 주입된다.
     """
-    return _korail_service
+    token = _extract_bearer_token(authorization)
+    if token:
+        service = registry.get(token)
+        if service is not None:
+            return service
+    return KorailService()
 
 
 async def get_tago_service() -> TaGoService:
@@ -37,22 +83,40 @@ async def get_tago_service() -> TaGoService:
     return _tago_service
 
 
+async def get_search_flight() -> SingleFlight:
+    """
+    열차 조회용 SingleFlight 싱글톤 인스턴스를 반환한다.
+
+    같은 조건으로 동시에 들어온 조회는 업스트림 호출 하나를 공유한다.
+    """
+    return _search_flight
+
+
+async def get_watch_service() -> WatchService:
+    """
+    WatchService 싱글톤 인스턴스를 반환한다.
+
+    서버 측 좌석 감시 및 자동 예약에 사용된다.
+    """
+    return _watch_service
+
+
 async def verify_session(
     authorization: str = Header(None, description="Bearer {session_token}"),
-    service: KorailService = Depends(get_korail_service),
+    registry: KorailSessionRegistry = Depends(get_session_registry),
 ) -> KorailService:
     """
     세션 토큰을 검증하는 의존성.
 
     Authorization 헤더에서 Bearer 토큰을 추출하고,
-    KorailService의 세션 유효성을 확인한다.
+    세션 레지스트리에서 토큰에 해당하는 사용자 세션을 찾아 유효성을 확인한다.
 
     Args:
         authorization: Authorization 헤더 값
-        service: KorailService 인스턴스
+        registry: 세션 레지스트리
 
     Returns:
-        KorailService: 세션이 유효한 서비스 인스턴스
+        KorailService: 토큰 소유자의 세션이 유효한 서비스 인스턴스
 
     Raises:
         HTTPException(401): 세션이 없거나 만료된 경우
@@ -69,8 +133,8 @@ async def verify_session(
         )
 
     # Bearer 토큰 추출
-    parts = authorization.split(" ")
-    if len(parts) != 2 or parts[0].lower() != "bearer":
+    token = _extract_bearer_token(authorization)
+    if token is None:
         logger.warning("[Auth] 잘못된 Authorization 형식: %s", authorization[:20])
         raise HTTPException(
             status_code=401,
@@ -81,8 +145,9 @@ async def verify_session(
             },
         )
 
-    if not service.is_session_valid():
-        logger.warning("[Auth] 세션이 만료되었습니다")
+    service = registry.get(token)
+    if service is None or not service.is_session_valid():
+        logger.warning("[Auth] 세션이 없거나 만료되었습니다")
         raise HTTPException(
             status_code=401,
             detail={
@@ -93,3 +158,26 @@ async def verify_session(
         )
 
     return service
+
+
+async def verify_admin(
+    x_admin_token: str = Header(None, description="PROFILE_ADMIN_TOKEN"),
+) -> None:
+    """
+    관리자 토큰을 검증하는 의존성.
+
+    PROFILE_ADMIN_TOKEN이 설정되지 않았거나 X-Admin-Token 헤더가 일치하지 않으면 거부한다.
+
+    Raises:
+        HTTPException(403): 관리자 토큰이 없거나 일치하지 않는 경우
+    """
+    if not is_admin_token(x_admin_token):
+        logger.warning("[Admin] 관리자 토큰 불일치")
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "error": "FORBIDDEN",
+                "code": "ADMIN_001",
+                "detail": "관리자 권한이 필요합니다",
+            },
+        )
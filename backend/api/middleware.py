@@ -0,0 +1,282 @@
+"""
+요청 로깅 / 프로파일링 미들웨어 (순수 ASGI)
+요청 본문을 버퍼링하지 않고 응답 상태 코드와 처리 시간만 기록한다.
+라우트 템플릿(/api/reservation/{reservation_id})별 지연 시간을 /metrics 지표로 집계하고,
+로그는 샘플링하되 느린 요청과 오류 응답은 항상 남긴다.
+관리자 토큰이 설정된 경우에만 요청 단위 cProfile 프로파일링을 지원한다.
+"""
+
+import cProfile
+import hmac
+import io
+import logging
+import os
+import pstats
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from services.cache_service import TTLCache
+from services.metrics import (
+    HTTP_IN_FLIGHT,
+    HTTP_REQUEST_DURATION,
+    HTTP_RESPONSES,
+    Counter,
+    Histogram,
+)
+
+logger = logging.getLogger(__name__)
+
+# 라우트에 매칭되지 않은 요청 (404 스캔 등)은 경로별로 나누지 않는다
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RouteLatencyRecorder:
+    """
+    (메서드, 라우트 템플릿) → 지연 시간 집계.
+
+    경로 파라미터가 들어간 실제 경로 대신 라우트 템플릿을 키로 쓰므로
+    항목 수는 등록된 라우트 수를 넘지 않는다.
+    지연 시간과 응답 수는 /metrics의 히스토그램/카운터에 그대로 기록된다.
+    """
+
+    def __init__(
+        self,
+        durations: Histogram = HTTP_REQUEST_DURATION,
+        responses: Counter = HTTP_RESPONSES,
+    ):
+        self._durations = durations
+        self._responses = responses
+
+    def record(self, method: str, route: str, elapsed_ms: float, status: int) -> None:
+        self._durations.observe(elapsed_ms / 1000, method, route)
+        self._responses.inc(method, route, str(status))
+
+    def stats(self) -> dict:
+        """"METHOD /route" → 요청 수, 오류 수, 평균/p50/p95/최대 지연 시간 (ms)."""
+        errors: dict[tuple[str, str], float] = {}
+        for (method, route, status), n in self._responses.items():
+            if status.startswith("5"):
+                errors[(method, route)] = errors.get((method, route), 0) + n
+
+        def ms(seconds: Optional[float]) -> Optional[float]:
+            return round(seconds * 1000, 1) if seconds is not None else None
+
+        return {
+            f"{method} {route}": {
+                "count": series.count,
+                "errors": int(errors.get((method, route), 0)),
+                "avg_ms": ms(series.sum / series.count),
+                "p50_ms": ms(self._durations.quantile(0.5, method, route)),
+                "p95_ms": ms(self._durations.quantile(0.95, method, route)),
+                "max_ms": ms(series.max),
+            }
+            for (method, route), series in self._durations.items()
+        }
+
+    def clear(self) -> None:
+        self._durations.clear()
+        self._responses.clear()
+
+
+_route_latency = RouteLatencyRecorder()
+
+
+def get_route_latency() -> RouteLatencyRecorder:
+    """프로세스 전역 라우트별 지연 시간 집계를 반환한다."""
+    return _route_latency
+
+
+def route_template(scope) -> str:
+    """
+    요청이 매칭된 라우트 템플릿 (/api/reservation/{reservation_id}).
+
+    라우터가 매칭한 라우트는 scope["route"]에 남는다. FastAPI 버전에 따라
+    include_router의 prefix가 빠진 경로일 수 있으므로, prefix는 실제 요청 경로의
+    앞부분 세그먼트로 채운다 (경로 파라미터는 세그먼트 하나씩이라고 가정).
+    """
+    path = getattr(scope.get("route"), "path", None)
+    if not path:
+        return UNMATCHED_ROUTE
+    request_segments = scope["path"].rstrip("/").split("/")
+    route_segments = path.rstrip("/").split("/")
+    prefix_len = len(request_segments) - len(route_segments)
+    if prefix_len <= 0:
+        return path
+    return "/".join(request_segments[: prefix_len + 1]) + path
+
+
+class RequestLoggingMiddleware:
+    """
+    요청 로깅 및 라우트별 지연 시간 기록 미들웨어.
+
+    - REQUEST_LOG_SAMPLE_RATE (기본 0.1): 정상 응답 로그를 남기는 비율 (0~1)
+    - REQUEST_LOG_SLOW_MS (기본 1000): 이 시간 이상 걸린 요청은 항상 경고 로그
+
+    4xx/5xx 응답도 샘플링과 관계없이 항상 로그를 남긴다.
+    요청당 로그는 응답 시점의 한 줄이며, 요청 본문은 읽지 않는다.
+    """
+
+    def __init__(
+        self,
+        app,
+        sample_rate: Optional[float] = None,
+        slow_ms: Optional[float] = None,
+        recorder: Optional[RouteLatencyRecorder] = None,
+    ):
+        self.app = app
+        self._sample_rate = (
+            sample_rate
+            if sample_rate is not None
+            else float(os.getenv("REQUEST_LOG_SAMPLE_RATE", "0.1"))
+        )
+        self._slow_ms = (
+            slow_ms
+            if slow_ms is not None
+            else float(os.getenv("REQUEST_LOG_SLOW_MS", "1000"))
+        )
+        self._recorder = recorder or _route_latency
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        HTTP_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            method = scope["method"]
+            self._recorder.record(method, route_template(scope), elapsed_ms, status)
+            self._log(method, scope["path"], status, elapsed_ms)
+
+    def _log(self, method: str, path: str, status: int, elapsed_ms: float) -> None:
+        if elapsed_ms >= self._slow_ms:
+            logger.warning(
+                "[REQ] %s %s → %d (%.0fms, 느린 요청)", method, path, status, elapsed_ms,
+            )
+        elif status >= 400 or random.random() < self._sample_rate:
+            logger.info("[REQ] %s %s → %d (%.0fms)", method, path, status, elapsed_ms)
+
+
+# ──────────────────────────────────────────────
+# 요청 단위 프로파일링 (PROFILE_ADMIN_TOKEN 설정 시에만 사용)
+# ──────────────────────────────────────────────
+
+KST = timezone(timedelta(hours=9))
+
+# 프로파일링 요청 헤더 (값은 PROFILE_ADMIN_TOKEN)
+PROFILE_HEADER = b"x-profile-token"
+# 저장된 프로파일 ID를 알려주는 응답 헤더
+PROFILE_ID_HEADER = b"x-profile-id"
+
+# 프로파일 ID -> 결과. 메모리를 무한히 쓰지 않도록 개수와 보관 시간을 제한한다.
+_profiles = TTLCache(
+    max_entries=int(os.getenv("PROFILE_MAX_ENTRIES", "20")),
+    ttl_seconds=float(os.getenv("PROFILE_TTL_SECONDS", "600")),
+    name="request-profiles",
+)
+
+
+def get_profile_store() -> TTLCache:
+    """프로파일 결과 저장소를 반환한다."""
+    return _profiles
+
+
+def admin_token() -> str:
+    """프로파일링 관리자 토큰 (비어 있으면 프로파일링 비활성화)."""
+    return os.getenv("PROFILE_ADMIN_TOKEN", "")
+
+
+def is_admin_token(value: Optional[str]) -> bool:
+    """관리자 토큰과 일치하는지 확인한다 (토큰이 설정되지 않았으면 항상 False)."""
+    token = admin_token()
+    if not token or not value:
+        return False
+    return hmac.compare_digest(value.encode("utf-8"), token.encode("utf-8"))
+
+
+class ProfilingMiddleware:
+    """
+    요청 단위 cProfile 프로파일링 미들웨어.
+
+    X-Profile-Token 헤더가 PROFILE_ADMIN_TOKEN과 일치하는 요청만 cProfile로 실행하고,
+    pstats 결과(누적 시간 순 상위 PROFILE_TOP_N개)를 프로파일 ID로 저장한다.
+    응답의 X-Profile-Id 헤더로 ID를 알려 주며,
+    GET /api/admin/profiles/{profile_id}로 결과를 조회한다.
+
+    - 토큰이 설정되지 않으면 main.py에서 미들웨어 자체를 등록하지 않는다 (비활성 시 비용 없음)
+    - cProfile은 이벤트 루프 스레드 전체를 기록하므로 같은 시간에 실행된 다른 요청도
+      섞일 수 있다. 동시에 하나의 요청만 프로파일링하고, 나머지는 그대로 실행한다
+    - korail2 호출은 워커 스레드에서 실행되므로 대기 시간으로만 나타난다
+    """
+
+    def __init__(self, app, store: Optional[TTLCache] = None, top_n: Optional[int] = None):
+        self.app = app
+        self._store = store if store is not None else _profiles
+        self._top_n = top_n or int(os.getenv("PROFILE_TOP_N", "40"))
+        self._active = False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self._active or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex[:16]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (PROFILE_ID_HEADER, profile_id.encode("ascii")),
+                ]
+            await send(message)
+
+        profiler = cProfile.Profile()
+        self._active = True
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.disable()
+            self._active = False
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._store.set(profile_id, {
+                "profile_id": profile_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "elapsed_ms": round(elapsed_ms, 1),
+                "created_at": datetime.now(KST).isoformat(),
+                "stats": self._format(profiler),
+            })
+            logger.info(
+                "[Profile] %s %s 프로파일 저장 - ID: %s (%.0fms)",
+                scope["method"], scope["path"], profile_id, elapsed_ms,
+            )
+
+    @staticmethod
+    def _requested(scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                return is_admin_token(value.decode("latin-1"))
+        return False
+
+    def _format(self, profiler: cProfile.Profile) -> str:
+        out = io.StringIO()
+        stats = pstats.Stats(profiler, stream=out)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self._top_n)
+        return out.getvalue()
@@ -0,0 +1,54 @@
+"""
+관리자 API 라우트
+GET /api/admin/profiles/{id} - 요청 프로파일 결과 조회 (pstats 텍스트)
+"""
+
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from api.deps import verify_admin
+from api.middleware import get_profile_store
+from models.schemas import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    response_class=PlainTextResponse,
+    responses={
+        403: {"model": ErrorResponse, "description": "관리자 권한 없음"},
+        404: {"model": ErrorResponse, "description": "프로파일 없음"},
+    },
+    summary="요청 프로파일 조회",
+    description="X-Profile-Token 헤더로 프로파일링한 요청의 cProfile 결과를 반환한다.",
+    dependencies=[Depends(verify_admin)],
+)
+async def get_profile(profile_id: str):
+    """
+    프로파일 ID로 pstats 결과(누적 시간 순)를 조회한다.
+
+    - **profile_id**: 프로파일링한 요청 응답의 X-Profile-Id 헤더 값
+
+    X-Admin-Token: {PROFILE_ADMIN_TOKEN} 헤더가 필요하다.
+    """
+    profile = get_profile_store().get(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "NOT_FOUND",
+                "code": "ADMIN_002",
+                "detail": "프로파일을 찾을 수 없습니다 (보관 기간이 지났을 수 있습니다)",
+            },
+        )
+
+    header = (
+        f"# {profile['method']} {profile['path']} "
+        f"({profile['elapsed_ms']}ms, {profile['created_at']})\n"
+    )
+    return PlainTextResponse(header + profile["stats"])
@@ -1,20 +1,27 @@
 """
 인증 API 라우트
-POST /api/auth/login - 코레일 계정 로그인
+POST /api/auth/login      - 코레일 계정 로그인
+GET  /api/auth/rate-limit - 계정별 호출량 제한 상태 조회
 """
 
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
 
-from api.deps import get_korail_service
-from models.schemas import LoginRequest, LoginResponse, ErrorResponse
+from api.deps import get_korail_service, get_session_registry, verify_session
+from models.schemas import (
+    ErrorResponse,
+    LoginRequest,
+    LoginResponse,
+    RateLimitResponse,
+)
 from services.korail_service import (
     KorailService,
     LoginFailedError,
     AccountBlockedError,
     KorailServerError,
 )
+from services.session_registry import KorailSessionRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +42,7 @@ router = APIRouter()
 async def login(
     request: LoginRequest,
     service: KorailService = Depends(get_korail_service),
+    registry: KorailSessionRegistry = Depends(get_session_registry),
 ):
     """
     코레일 계정으로 로그인한다.
@@ -44,12 +52,14 @@ async def login(
 
     성공 시 session_token을 발급하며, 이후 API 호출 시
     Authorization: Bearer {session_token} 헤더에 포함해야 한다.
+    세션은 사용자별로 분리되어 토큰 소유자의 코레일 세션만 사용된다.
     """
     logger.info("[Auth] 로그인 요청 - ID: %s", request.korail_id[:3] + "***")
 
     try:
         result = await service.login(request.korail_id, request.korail_pw)
-        logger.info("[Auth] 로그인 성공")
+        registry.register(result["session_token"], service)
+        logger.info("[Auth] 로그인 성공 - 활성 세션: %d", len(registry))
         return LoginResponse(**result)
 
     except LoginFailedError as e:
@@ -95,3 +105,30 @@ async def login(
                 "detail": "서버 내부 오류가 발생했습니다",
             },
         )
+
+
+@router.get(
+    "/rate-limit",
+    response_model=RateLimitResponse,
+    responses={
+        401: {"model": ErrorResponse, "description": "세션 만료"},
+    },
+    summary="호출량 제한 상태 조회",
+    description=(
+        "현재 코레일 계정의 token bucket 상태를 조회한다. "
+        "같은 계정으로 로그인한 모든 세션이 하나의 버킷을 공유한다."
+    ),
+)
+async def get_rate_limit(service: KorailService = Depends(verify_session)):
+    """현재 계정의 호출량 제한 상태를 조회한다."""
+    stats = service.rate_limit_stats()
+    if stats is None:
+        raise HTTPException(
+            status_code=401,
+            detail={
+                "error": "SESSION_EXPIRED",
+                "code": "AUTH_003",
+                "detail": "세션이 만료되었습니다. 다시 로그인해주세요",
+            },
+        )
+    return RateLimitResponse(**stats)
@@ -3,6 +3,8 @@
 POST   /api/reservation           - 예약 생성
 GET    /api/reservation/{id}      - 예약 상세 조회
 DELETE /api/reservation/{id}      - 예약 취소
+GET    /api/reservation/{id}/cancellation - 예약 취소 확인 상태
+POST   /api/reservation/cancel-batch - 예약 일괄 취소
 """
 
 import logging
@@ -16,13 +18,20 @@ from models.schemas import (
     ReservationDetailResponse,
     ReservationListResponse,
     CancellationResponse,
+    CancellationStatusResponse,
+    BatchCancellationRequest,
+    BatchCancellationResult,
+    BatchCancellationResponse,
     ErrorResponse,
 )
+from services.metrics import record_error
 from services.korail_service import (
     KorailService,
+    KorailServiceError,
     SessionExpiredError,
     SoldOutError,
     KorailServerError,
+    RateLimitExceededError,
     ReservationNotFoundError,
     CancellationFailedError,
     NoTrainsError,
@@ -38,6 +47,7 @@ router = APIRouter()
     response_model=ReservationResponse,
     responses={
         401: {"model": ErrorResponse, "description": "세션 만료"},
+        429: {"model": ErrorResponse, "description": "호출량 초과"},
         409: {"model": ErrorResponse, "description": "매진"},
         503: {"model": ErrorResponse, "description": "코레일 서버 오류"},
     },
@@ -53,6 +63,7 @@ async def create_reservation(
 
     - **train_no**: 예약할 열차 번호 (조회 결과의 train_no)
     - **seat_type**: 좌석 유형 ("general" 또는 "special")
+    - **handle**: 조회 결과의 handle (있으면 재조회 없이 즉시 예약)
 
     Authorization: Bearer {session_token} 헤더가 필요하다.
     예약만 생성하며, 결제는 별도로 진행해야 한다 (10분 내 결제 필요).
@@ -71,6 +82,7 @@ async def create_reservation(
             arr=request.arr_station,
             date=request.date,
             time=request.time,
+            handle=request.handle,
         )
 
         logger.info(
@@ -111,6 +123,17 @@ async def create_reservation(
             },
         )
 
+    except RateLimitExceededError as e:
+        logger.warning("[Reservation] 호출량 초과: %s", e.detail)
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "error": e.error,
+                "code": e.code,
+                "detail": e.detail,
+            },
+        )
+
     except KorailServerError as e:
         logger.error("[Reservation] 코레일 서버 오류: %s", e.detail)
         raise HTTPException(
@@ -139,6 +162,7 @@ async def create_reservation(
     response_model=ReservationListResponse,
     responses={
         401: {"model": ErrorResponse, "description": "세션 만료"},
+        429: {"model": ErrorResponse, "description": "호출량 초과"},
         503: {"model": ErrorResponse, "description": "코레일 서버 오류"},
     },
     summary="예약 목록 조회",
@@ -174,6 +198,17 @@ async def list_reservations(
             },
         )
 
+    except RateLimitExceededError as e:
+        logger.warning("[Reservation] 호출량 초과: %s", e.detail)
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "error": e.error,
+                "code": e.code,
+                "detail": e.detail,
+            },
+        )
+
     except KorailServerError as e:
         logger.error("[Reservation] 코레일 서버 오류: %s", e.detail)
         raise HTTPException(
@@ -202,6 +237,7 @@ async def list_reservations(
     response_model=ReservationDetailResponse,
     responses={
         401: {"model": ErrorResponse, "description": "세션 만료"},
+        429: {"model": ErrorResponse, "description": "호출량 초과"},
         404: {"model": ErrorResponse, "description": "예약 없음"},
     },
     summary="예약 상세 조회",
@@ -248,6 +284,17 @@ async def get_reservation(
             },
         )
 
+    except RateLimitExceededError as e:
+        logger.warning("[Reservation] 호출량 초과: %s", e.detail)
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "error": e.error,
+                "code": e.code,
+                "detail": e.detail,
+            },
+        )
+
     except KorailServerError as e:
         logger.error("[Reservation] 코레일 서버 오류: %s", e.detail)
         raise HTTPException(
@@ -278,10 +325,12 @@ async def get_reservation(
         401: {"model": ErrorResponse, "description": "세션 만료"},
         404: {"model": ErrorResponse, "description": "예약 없음"},
         422: {"model": ErrorResponse, "description": "취소 실패"},
+        429: {"model": ErrorResponse, "description": "호출량 초과"},
         503: {"model": ErrorResponse, "description": "코레일 서버 오류"},
     },
     summary="예약 취소",
-    description="예약 번호로 예약을 취소한다.",
+    description="예약 번호로 예약을 취소한다. 코레일이 취소를 접수하면 바로 응답하고, "
+                "취소 확인(예약 목록 재조회)은 백그라운드에서 진행한다.",
 )
 async def cancel_reservation(
     reservation_id: str,
@@ -335,6 +384,17 @@ async def cancel_reservation(
             },
         )
 
+    except RateLimitExceededError as e:
+        logger.warning("[Reservation] 호출량 초과: %s", e.detail)
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "error": e.error,
+                "code": e.code,
+                "detail": e.detail,
+            },
+        )
+
     except KorailServerError as e:
         logger.error("[Reservation] 코레일 서버 오류: %s", e.detail)
         raise HTTPException(
@@ -356,3 +416,148 @@ async def cancel_reservation(
                 "detail": "서버 내부 오류가 발생했습니다",
             },
         )
+
+
+@router.get(
+    "/reservation/{reservation_id}/cancellation",
+    response_model=CancellationStatusResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "취소 기록 없음"},
+    },
+    summary="예약 취소 확인 상태",
+    description="이 세션에서 취소한 예약의 취소 확인 결과를 조회한다.",
+)
+async def get_cancellation_status(
+    reservation_id: str,
+    service: KorailService = Depends(verify_session),
+):
+    """
+    예약 취소 후 백그라운드 확인 결과를 조회한다.
+
+    - **reservation_id**: 취소한 예약 번호
+
+    Authorization: Bearer {session_token} 헤더가 필요하다.
+    """
+    verification = service.get_cancel_verification(reservation_id)
+    if verification is None:
+        e = ReservationNotFoundError(detail=f"예약 {reservation_id}의 취소 기록이 없습니다")
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": e.error,
+                "code": e.code,
+                "detail": e.detail,
+            },
+        )
+    return CancellationStatusResponse(
+        reservation_id=reservation_id, verification=verification,
+    )
+
+
+# 일괄 취소의 개별 실패를 단건 취소와 같은 HTTP 상태 코드로 표시한다
+_CANCEL_ERROR_STATUS = {
+    ReservationNotFoundError: 404,
+    CancellationFailedError: 422,
+    RateLimitExceededError: 429,
+    KorailServerError: 503,
+}
+
+
+def _batch_cancel_result(reservation_id: str, outcome) -> BatchCancellationResult:
+    if isinstance(outcome, KorailServiceError):
+        record_error(outcome.code)
+        return BatchCancellationResult(
+            reservation_id=reservation_id,
+            status_code=_CANCEL_ERROR_STATUS.get(type(outcome), 500),
+            error=ErrorResponse(
+                error=outcome.error, code=outcome.code, detail=outcome.detail,
+            ),
+        )
+    return BatchCancellationResult(
+        reservation_id=reservation_id,
+        status_code=200,
+        result=CancellationResponse(**outcome),
+    )
+
+
+@router.post(
+    "/reservation/cancel-batch",
+    response_model=BatchCancellationResponse,
+    responses={
+        401: {"model": ErrorResponse, "description": "세션 만료"},
+        429: {"model": ErrorResponse, "description": "호출량 초과"},
+        503: {"model": ErrorResponse, "description": "코레일 서버 오류"},
+    },
+    summary="예약 일괄 취소",
+    description="여러 예약을 한 번에 취소한다. 예약 목록은 한 번만 조회하고 "
+                "취소 요청은 동시에 보낸다. 개별 실패는 항목별 error로 반환한다.",
+)
+async def cancel_reservations_batch(
+    request: BatchCancellationRequest,
+    service: KorailService = Depends(verify_session),
+):
+    """
+    예약 번호 목록을 한 번에 취소한다.
+
+    - **reservation_ids**: 취소할 예약 번호 목록 (최대 20건)
+
+    Authorization: Bearer {session_token} 헤더가 필요하다.
+    """
+    logger.info(
+        "[Reservation] 예약 일괄 취소 요청 - %d건", len(request.reservation_ids),
+    )
+
+    try:
+        outcomes = await service.cancel_reservations(request.reservation_ids)
+
+    except SessionExpiredError as e:
+        logger.warning("[Reservation] 세션 만료: %s", e.detail)
+        raise HTTPException(
+            status_code=401,
+            detail={
+                "error": "SESSION_EXPIRED",
+                "code": "RESERVE_002",
+                "detail": "세션이 만료되었습니다",
+            },
+        )
+
+    except RateLimitExceededError as e:
+        logger.warning("[Reservation] 호출량 초과: %s", e.detail)
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "error": e.error,
+                "code": e.code,
+                "detail": e.detail,
+            },
+        )
+
+    except KorailServerError as e:
+        logger.error("[Reservation] 코레일 서버 오류: %s", e.detail)
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error": "KORAIL_SERVER_ERROR",
+                "code": "SYSTEM_002",
+                "detail": "코레일 서버와 통신할 수 없습니다",
+            },
+        )
+
+    except Exception as e:
+        logger.error("[Reservation] 알 수 없는 오류: %s", str(e))
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "INTERNAL_ERROR",
+                "code": "SYSTEM_001",
+                "detail": "서버 내부 오류가 발생했습니다",
+            },
+        )
+
+    results = [_batch_cancel_result(rid, outcome) for rid, outcome in outcomes]
+    cancelled = sum(1 for r in results if r.error is None)
+
+    logger.info(
+        "[Reservation] 일괄 취소 완료 - 성공 %d건 / 전체 %d건", cancelled, len(results),
+    )
+    return BatchCancellationResponse(results=results, cancelled=cancelled)
@@ -1,30 +1,48 @@
 """
 열차 조회 API 라우트
-GET /api/trains/search - korail2를 통한 열차 조회 (로그인 필요)
-                         미로그인 시 TAGO 공공데이터 폴백
+GET  /api/trains/search       - korail2를 통한 열차 조회 (로그인 필요)
+                               미로그인 시 TAGO 공공데이터 폴백
+GET  /api/trains/search/range - 날짜 범위 조회 (날짜별 결과를 NDJSON으로 스트리밍)
+POST /api/trains/search/batch - 여러 조건 일괄 조회
 """
 
+import asyncio
 import logging
+import os
 import re
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query
-
-from api.deps import get_korail_service, get_tago_service
-from models.schemas import TrainSearchResponse, ErrorResponse
+from fastapi.responses import StreamingResponse
+
+from api.deps import get_korail_service, get_search_flight, get_tago_service
+from api.validation import validate_search_params
+from models.schemas import (
+    BatchSearchRequest,
+    BatchSearchResponse,
+    BatchSearchResult,
+    DateSearchResult,
+    ErrorResponse,
+    TrainInfo,
+    TrainSearchQuery,
+    TrainSearchResponse,
+)
 from services.korail_service import (
     KorailService,
     KorailServiceError,
     NoTrainsError,
     SessionExpiredError,
     KorailServerError,
+    RateLimitExceededError,
 )
+from services.metrics import SEARCH_FALLBACKS, record_error
 from services.tago_service import (
     TaGoService,
     StationNotFoundError,
     TaGoApiError,
     NoTrainsFoundError,
 )
+from services.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -33,73 +51,190 @@ router = APIRouter()
 # 한국 시간대
 KST = timezone(timedelta(hours=9))
 
-# 유효한 역 목록
-VALID_STATIONS = {
-    "서울", "용산", "영등포", "광명", "수서", "수원", "동탄", "평택지제",
-    "천안아산", "오송", "대전", "김천구미", "서대구", "동대구", "경산",
-    "신경주", "경주", "울산", "물금", "구포", "밀양", "부산",
-    "창원중앙", "마산",
-    "공주", "익산", "정읍", "광주송정", "나주", "목포",
-    "전주", "남원", "순천", "여수엑스포",
-    "강릉", "만종", "둔내", "평창", "진부",
-    "행신", "청량리", "상봉", "양평",
-    "포항",
-}
-
-
-def _validate_params(dep: str, arr: str, date: str, time: str) -> None:
-    """검색 파라미터 유효성을 검사한다."""
-    if not dep or not dep.strip():
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": "INVALID_PARAMS",
-                "code": "SEARCH_001",
-                "detail": "출발역은 필수 입력값입니다",
-            },
+# 일괄/날짜 범위 조회 시 동시에 실행할 최대 조회 수
+TRAIN_BATCH_CONCURRENCY = int(os.getenv("TRAIN_BATCH_CONCURRENCY", "4"))
+
+# 날짜 범위 조회에서 허용하는 최대 일 수
+TRAIN_RANGE_MAX_DAYS = int(os.getenv("TRAIN_RANGE_MAX_DAYS", "7"))
+
+
+async def _search(
+    dep: str,
+    arr: str,
+    date: str,
+    time: str,
+    use_korail: bool,
+    korail_service: KorailService,
+    tago_service: TaGoService,
+    search_flight: SingleFlight,
+) -> list[TrainInfo]:
+    """
+    열차 조회 공통 로직 (단건/일괄 조회에서 공유).
+
+    use_korail이면 korail2로 조회하고, 실패 시 TAGO 공공데이터로 폴백한다.
+    같은 조건으로 동시에 들어온 조회는 업스트림 호출 하나의 결과를 공유한다
+    (korail2는 같은 세션끼리만, TAGO는 모든 사용자 간에).
+
+    Raises:
+        HTTPException: 열차 없음, 역명 오류, API 오류 등
+    """
+    # korail2 세션이 유효하면 korail2로 조회 (예약과 동일한 열차번호 체계)
+    if use_korail:
+        try:
+            # korail2 조회는 세션마다 따로 합친다 (세션 만료/호출량 초과, 호출량 예산,
+            # 예약 핸들이 조회한 세션에 속하므로). 계정과 무관한 TAGO 조회만 사용자 간에 합친다.
+            trains = await search_flight.do(
+                ("korail", korail_service.session_token, dep, arr, date, time),
+                lambda: korail_service.search_trains(dep, arr, date, time),
+            )
+
+            logger.info("[Trains] korail2 조회 성공 - %d건", len(trains))
+            return trains
+
+        except NoTrainsError as e:
+            logger.info("[Trains] korail2 열차 없음: %s", e.detail)
+            raise HTTPException(
+                status_code=404,
+                detail={
+                    "error": e.error,
+                    "code": e.code,
+                    "detail": e.detail,
+                },
+            )
+
+        except SessionExpiredError as e:
+            logger.warning("[Trains] korail2 세션 만료, TAGO 폴백: %s", e.detail)
+            # 세션 만료 시 TAGO로 폴백
+            SEARCH_FALLBACKS.inc("session_expired")
+
+        except RateLimitExceededError as e:
+            logger.warning("[Trains] korail2 호출량 초과, TAGO 폴백: %s", e.detail)
+            # 최근 조회 결과도 없으면 TAGO로 폴백
+            SEARCH_FALLBACKS.inc("rate_limited")
+
+        except KorailServerError as e:
+            logger.warning("[Trains] korail2 서버 오류, TAGO 폴백: %s", e.detail)
+            # 코레일 서버 오류 시 TAGO로 폴백
+            SEARCH_FALLBACKS.inc("korail_error")
+
+        except Exception as e:
+            logger.warning("[Trains] korail2 조회 실패, TAGO 폴백: %s", str(e))
+            # 기타 오류 시 TAGO로 폴백
+            SEARCH_FALLBACKS.inc("unexpected")
+
+    # TAGO 공공데이터 폴백
+    logger.info("[Trains] TAGO 폴백 조회")
+    try:
+        trains = await search_flight.do(
+            ("tago", dep, arr, date, time),
+            lambda: tago_service.search_trains(dep, arr, date, time),
         )
 
-    if not arr or not arr.strip():
+        logger.info("[Trains] TAGO 조회 성공 - %d건", len(trains))
+        return trains
+
+    except StationNotFoundError as e:
+        logger.warning("[Trains] 역명 오류: %s", e.detail)
         raise HTTPException(
             status_code=400,
             detail={
-                "error": "INVALID_PARAMS",
-                "code": "SEARCH_001",
-                "detail": "도착역은 필수 입력값입니다",
+                "error": e.error,
+                "code": e.code,
+                "detail": e.detail,
             },
         )
 
-    if dep.strip() == arr.strip():
+    except NoTrainsFoundError as e:
+        logger.info("[Trains] 열차 없음: %s", e.detail)
         raise HTTPException(
-            status_code=400,
+            status_code=404,
             detail={
-                "error": "INVALID_PARAMS",
-                "code": "SEARCH_001",
-                "detail": "출발역과 도착역이 같을 수 없습니다",
+                "error": e.error,
+                "code": e.code,
+                "detail": e.detail,
             },
         )
 
-    if dep.strip() not in VALID_STATIONS:
+    except TaGoApiError as e:
+        logger.error("[Trains] TAGO API 오류: %s", e.detail)
         raise HTTPException(
-            status_code=400,
+            status_code=503,
             detail={
-                "error": "INVALID_PARAMS",
-                "code": "SEARCH_001",
-                "detail": f"유효하지 않은 역명입니다: {dep}",
+                "error": e.error,
+                "code": e.code,
+                "detail": e.detail,
             },
         )
 
-    if arr.strip() not in VALID_STATIONS:
+    except Exception as e:
+        logger.error("[Trains] 알 수 없는 오류: %s", str(e))
         raise HTTPException(
-            status_code=400,
+            status_code=500,
             detail={
-                "error": "INVALID_PARAMS",
-                "code": "SEARCH_001",
-                "detail": f"유효하지 않은 역명입니다: {arr}",
+                "error": "INTERNAL_ERROR",
+                "code": "SYSTEM_001",
+                "detail": "서버 내부 오류가 발생했습니다",
             },
         )
 
-    if not re.match(r"^\d{8}$", date):
+
+@router.get(
+    "/search",
+    response_model=TrainSearchResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "잘못된 파라미터"},
+        401: {"model": ErrorResponse, "description": "세션 만료 (korail2 모드)"},
+        404: {"model": ErrorResponse, "description": "열차 없음"},
+        503: {"model": ErrorResponse, "description": "서버 오류"},
+    },
+    summary="열차 시간표 조회",
+    description=(
+        "korail2를 통해 열차를 조회한다 (로그인 필요). "
+        "미로그인 시 TAGO 공공데이터로 폴백하지만, "
+        "예약을 위해서는 korail2 조회 결과를 사용해야 한다."
+    ),
+)
+async def search_trains(
+    dep: str = Query(..., description="출발역 이름 (한글)", examples=["서울"]),
+    arr: str = Query(..., description="도착역 이름 (한글)", examples=["부산"]),
+    date: str = Query(
+        ..., description="출발 날짜 (YYYYMMDD)", examples=["20260205"]
+    ),
+    time: str = Query(
+        ..., description="출발 시간 (HHmmss)", examples=["090000"]
+    ),
+    authorization: str = Header(None),
+    korail_service: KorailService = Depends(get_korail_service),
+    tago_service: TaGoService = Depends(get_tago_service),
+    search_flight: SingleFlight = Depends(get_search_flight),
+):
+    """
+    열차 시간표를 조회한다.
+
+    로그인 상태이면 korail2를 통해 조회 (좌석 정보 포함, 예약 가능).
+    미로그인 상태이면 TAGO 공공데이터로 폴백 (좌석 정보 없음).
+    같은 조건으로 동시에 들어온 조회는 업스트림 호출 하나의 결과를 공유한다.
+    """
+    validate_search_params(dep, arr, date, time)
+
+    logger.info(
+        "[Trains] 열차 조회 요청 - %s -> %s, %s %s",
+        dep, arr, date, time,
+    )
+
+    now = datetime.now(KST)
+    use_korail = bool(authorization) and korail_service.is_session_valid()
+
+    trains = await _search(
+        dep, arr, date, time, use_korail,
+        korail_service, tago_service, search_flight,
+    )
+    return TrainSearchResponse(trains=trains, searched_at=now.isoformat())
+
+
+def _date_range(date_from: str, date_to: str) -> list[str]:
+    """date_from ~ date_to (양 끝 포함) 날짜 목록을 반환한다."""
+    if not re.match(r"^\d{8}$", date_to):
         raise HTTPException(
             status_code=400,
             detail={
@@ -110,7 +245,8 @@ def _validate_params(dep: str, arr: str, date: str, time: str) -> None:
         )
 
     try:
-        search_date = datetime.strptime(date, "%Y%m%d").date()
+        start = datetime.strptime(date_from, "%Y%m%d").date()
+        end = datetime.strptime(date_to, "%Y%m%d").date()
     except ValueError:
         raise HTTPException(
             status_code=400,
@@ -121,173 +257,167 @@ def _validate_params(dep: str, arr: str, date: str, time: str) -> None:
             },
         )
 
-    today = datetime.now(KST).date()
-    if search_date < today:
+    if end < start:
         raise HTTPException(
             status_code=400,
             detail={
                 "error": "INVALID_PARAMS",
                 "code": "SEARCH_001",
-                "detail": "과거 날짜는 조회할 수 없습니다",
+                "detail": "종료 날짜는 시작 날짜보다 빠를 수 없습니다",
             },
         )
 
-    if not re.match(r"^\d{6}$", time):
+    days = (end - start).days + 1
+    if days > TRAIN_RANGE_MAX_DAYS:
         raise HTTPException(
             status_code=400,
             detail={
                 "error": "INVALID_PARAMS",
                 "code": "SEARCH_001",
-                "detail": "시간 형식이 올바르지 않습니다 (HHmmss)",
+                "detail": f"날짜 범위는 최대 {TRAIN_RANGE_MAX_DAYS}일까지 조회할 수 있습니다",
             },
         )
 
-    hour = int(time[:2])
-    minute = int(time[2:4])
-    if hour > 23 or minute > 59:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": "INVALID_PARAMS",
-                "code": "SEARCH_001",
-                "detail": "시간 형식이 올바르지 않습니다 (HHmmss)",
-            },
-        )
+    return [
+        (start + timedelta(days=offset)).strftime("%Y%m%d")
+        for offset in range(days)
+    ]
 
 
 @router.get(
-    "/search",
-    response_model=TrainSearchResponse,
+    "/search/range",
+    response_class=StreamingResponse,
     responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": "날짜별 조회 결과 (DateSearchResult, 완료 순서대로 한 줄씩)",
+        },
         400: {"model": ErrorResponse, "description": "잘못된 파라미터"},
-        401: {"model": ErrorResponse, "description": "세션 만료 (korail2 모드)"},
-        404: {"model": ErrorResponse, "description": "열차 없음"},
-        503: {"model": ErrorResponse, "description": "서버 오류"},
     },
-    summary="열차 시간표 조회",
+    summary="날짜 범위 열차 조회",
     description=(
-        "korail2를 통해 열차를 조회한다 (로그인 필요). "
-        "미로그인 시 TAGO 공공데이터로 폴백하지만, "
-        "예약을 위해서는 korail2 조회 결과를 사용해야 한다."
+        "date_from ~ date_to 기간의 날짜별 열차를 동시에 조회하고, "
+        "끝난 날짜부터 NDJSON 한 줄씩 스트리밍한다."
     ),
 )
-async def search_trains(
+async def search_trains_range(
     dep: str = Query(..., description="출발역 이름 (한글)", examples=["서울"]),
     arr: str = Query(..., description="도착역 이름 (한글)", examples=["부산"]),
-    date: str = Query(
-        ..., description="출발 날짜 (YYYYMMDD)", examples=["20260205"]
+    date_from: str = Query(
+        ..., description="시작 날짜 (YYYYMMDD)", examples=["20260205"]
+    ),
+    date_to: str = Query(
+        ..., description="종료 날짜 (YYYYMMDD, 포함)", examples=["20260208"]
     ),
     time: str = Query(
-        ..., description="출발 시간 (HHmmss)", examples=["090000"]
+        "000000", description="출발 시간 (HHmmss)", examples=["090000"]
     ),
     authorization: str = Header(None),
     korail_service: KorailService = Depends(get_korail_service),
     tago_service: TaGoService = Depends(get_tago_service),
+    search_flight: SingleFlight = Depends(get_search_flight),
 ):
     """
-    열차 시간표를 조회한다.
+    날짜 범위의 열차 시간표를 조회한다.
 
-    로그인 상태이면 korail2를 통해 조회 (좌석 정보 포함, 예약 가능).
-    미로그인 상태이면 TAGO 공공데이터로 폴백 (좌석 정보 없음).
+    날짜마다 단건 조회와 같은 경로(_search: TAGO 캐시, single-flight 포함)를 사용하며,
+    동시 실행 수는 TRAIN_BATCH_CONCURRENCY로 제한한다.
+    각 날짜의 결과는 완료되는 즉시 한 줄의 JSON으로 전송된다.
     """
-    _validate_params(dep, arr, date, time)
+    validate_search_params(dep, arr, date_from, time)
+    dates = _date_range(date_from, date_to)
 
     logger.info(
-        "[Trains] 열차 조회 요청 - %s -> %s, %s %s",
-        dep, arr, date, time,
+        "[Trains] 날짜 범위 조회 요청 - %s -> %s, %s ~ %s (%d일)",
+        dep, arr, date_from, date_to, len(dates),
     )
 
-    now = datetime.now(KST)
+    use_korail = bool(authorization) and korail_service.is_session_valid()
+    semaphore = asyncio.Semaphore(TRAIN_BATCH_CONCURRENCY)
 
-    # korail2 세션이 유효하면 korail2로 조회 (예약과 동일한 열차번호 체계)
-    if authorization and korail_service.is_session_valid():
+    async def run(date: str) -> DateSearchResult:
         try:
-            trains = await korail_service.search_trains(dep, arr, date, time)
-
-            response = TrainSearchResponse(
-                trains=trains,
-                searched_at=now.isoformat(),
-            )
-
-            logger.info("[Trains] korail2 조회 성공 - %d건", len(trains))
-            return response
-
-        except NoTrainsError as e:
-            logger.info("[Trains] korail2 열차 없음: %s", e.detail)
-            raise HTTPException(
-                status_code=404,
-                detail={
-                    "error": e.error,
-                    "code": e.code,
-                    "detail": e.detail,
-                },
+            async with semaphore:
+                trains = await _search(
+                    dep, arr, date, time, use_korail,
+                    korail_service, tago_service, search_flight,
+                )
+            return DateSearchResult(date=date, status_code=200, trains=trains)
+
+        except HTTPException as e:
+            # 개별 실패는 에러 응답으로 나가지 않으므로 여기서 에러 코드를 기록한다
+            record_error(e.detail.get("code"))
+            return DateSearchResult(
+                date=date, status_code=e.status_code, error=e.detail,
             )
 
-        except SessionExpiredError as e:
-            logger.warning("[Trains] korail2 세션 만료, TAGO 폴백: %s", e.detail)
-            # 세션 만료 시 TAGO로 폴백
-
-        except KorailServerError as e:
-            logger.warning("[Trains] korail2 서버 오류, TAGO 폴백: %s", e.detail)
-            # 코레일 서버 오류 시 TAGO로 폴백
+    async def stream():
+        tasks = [asyncio.ensure_future(run(date)) for date in dates]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                yield result.model_dump_json() + "\n"
+        finally:
+            # 클라이언트 연결이 끊기면 남은 조회를 취소한다
+            for task in tasks:
+                task.cancel()
 
-        except Exception as e:
-            logger.warning("[Trains] korail2 조회 실패, TAGO 폴백: %s", str(e))
-            # 기타 오류 시 TAGO로 폴백
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
 
-    # TAGO 공공데이터 폴백
-    logger.info("[Trains] TAGO 폴백 조회")
-    try:
-        trains = await tago_service.search_trains(dep, arr, date, time)
 
-        response = TrainSearchResponse(
-            trains=trains,
-            searched_at=now.isoformat(),
-        )
+@router.post(
+    "/search/batch",
+    response_model=BatchSearchResponse,
+    responses={
+        422: {"description": "조회 조건 목록 형식 오류 (1~20건)"},
+    },
+    summary="열차 시간표 일괄 조회",
+    description=(
+        "여러 (출발역, 도착역, 날짜, 시간) 조건을 한 번에 동시 조회한다. "
+        "각 조건의 결과 또는 에러를 요청 순서대로 반환한다."
+    ),
+)
+async def search_trains_batch(
+    request: BatchSearchRequest,
+    authorization: str = Header(None),
+    korail_service: KorailService = Depends(get_korail_service),
+    tago_service: TaGoService = Depends(get_tago_service),
+    search_flight: SingleFlight = Depends(get_search_flight),
+):
+    """
+    열차 시간표를 일괄 조회한다.
 
-        logger.info("[Trains] TAGO 조회 성공 - %d건", len(trains))
-        return response
+    조건마다 단건 조회와 같은 규칙(korail2 우선, TAGO 폴백)을 적용하며,
+    동시 실행 수는 TRAIN_BATCH_CONCURRENCY로 제한한다.
+    개별 조건의 실패는 전체 요청을 실패시키지 않고 해당 항목의 error로 반환된다.
+    """
+    logger.info("[Trains] 열차 일괄 조회 요청 - %d건", len(request.queries))
 
-    except StationNotFoundError as e:
-        logger.warning("[Trains] 역명 오류: %s", e.detail)
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": e.error,
-                "code": e.code,
-                "detail": e.detail,
-            },
-        )
+    now = datetime.now(KST)
+    use_korail = bool(authorization) and korail_service.is_session_valid()
+    semaphore = asyncio.Semaphore(TRAIN_BATCH_CONCURRENCY)
 
-    except NoTrainsFoundError as e:
-        logger.info("[Trains] 열차 없음: %s", e.detail)
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": e.error,
-                "code": e.code,
-                "detail": e.detail,
-            },
-        )
+    async def run(query: TrainSearchQuery) -> BatchSearchResult:
+        try:
+            validate_search_params(query.dep, query.arr, query.date, query.time)
+            async with semaphore:
+                trains = await _search(
+                    query.dep, query.arr, query.date, query.time, use_korail,
+                    korail_service, tago_service, search_flight,
+                )
+            return BatchSearchResult(query=query, status_code=200, trains=trains)
+
+        except HTTPException as e:
+            # 개별 실패는 에러 응답으로 나가지 않으므로 여기서 에러 코드를 기록한다
+            record_error(e.detail.get("code"))
+            return BatchSearchResult(
+                query=query, status_code=e.status_code, error=e.detail,
+            )
 
-    except TaGoApiError as e:
-        logger.error("[Trains] TAGO API 오류: %s", e.detail)
-        raise HTTPException(
-            status_code=503,
-            detail={
-                "error": e.error,
-                "code": e.code,
-                "detail": e.detail,
-            },
-        )
+    results = await asyncio.gather(*(run(query) for query in request.queries))
 
-    except Exception as e:
-        logger.error("[Trains] 알 수 없는 오류: %s", str(e))
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": "INTERNAL_ERROR",
-                "code": "SYSTEM_001",
-                "detail": "서버 내부 오류가 발생했습니다",
-            },
-        )
+    logger.info(
+        "[Trains] 일괄 조회 완료 - 성공 %d건 / 전체 %d건",
+        sum(1 for r in results if r.error is None), len(results),
+    )
+    return BatchSearchResponse(results=results, searched_at=now.isoformat())
@@ -0,0 +1,155 @@
+"""
+좌석 감시 API 라우트
+POST   /api/watches             - 좌석 감시 등록 (서버 측 폴링 + 자동 예약)
+GET    /api/watches             - 감시 목록 조회
+GET    /api/watches/{watch_id}  - 감시 상태 조회
+DELETE /api/watches/{watch_id}  - 감시 중단
+"""
+
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from api.deps import get_watch_service, verify_session
+from api.validation import validate_search_params
+from models.schemas import (
+    ErrorResponse,
+    WatchListResponse,
+    WatchRequest,
+    WatchResponse,
+)
+from services.korail_service import KorailService
+from services.watch_service import (
+    WatchLimitExceededError,
+    WatchNotFoundError,
+    WatchService,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.post(
+    "/watches",
+    response_model=WatchResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "잘못된 파라미터"},
+        401: {"model": ErrorResponse, "description": "세션 만료"},
+        429: {"model": ErrorResponse, "description": "감시 작업 수 초과"},
+    },
+    summary="좌석 감시 등록",
+    description=(
+        "서버가 설정된 주기로 열차를 조회하고, 좌석이 생기면 "
+        "상태를 갱신하거나 (auto_reserve=true) 즉시 예약한다."
+    ),
+)
+async def create_watch(
+    request: WatchRequest,
+    service: KorailService = Depends(verify_session),
+    watch_service: WatchService = Depends(get_watch_service),
+):
+    """
+    좌석 감시를 등록한다.
+
+    - **train_nos**: 감시할 열차 번호 (생략 시 조건에 맞는 모든 열차)
+    - **interval_seconds**: 조회 주기 (3~300초)
+    - **auto_reserve**: 좌석 발견 즉시 예약 여부
+
+    Authorization: Bearer {session_token} 헤더가 필요하다.
+    """
+    validate_search_params(
+        request.dep_station, request.arr_station, request.date, request.time,
+    )
+
+    try:
+        return await watch_service.create_watch(service, request)
+
+    except WatchLimitExceededError as e:
+        logger.warning("[Watches] 감시 작업 수 초과: %s", e.detail)
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "error": e.error,
+                "code": e.code,
+                "detail": e.detail,
+            },
+        )
+
+
+@router.get(
+    "/watches",
+    response_model=WatchListResponse,
+    responses={
+        401: {"model": ErrorResponse, "description": "세션 만료"},
+    },
+    summary="좌석 감시 목록 조회",
+    description="현재 세션의 좌석 감시 목록을 조회한다.",
+)
+async def list_watches(
+    service: KorailService = Depends(verify_session),
+    watch_service: WatchService = Depends(get_watch_service),
+):
+    """현재 세션의 좌석 감시 목록을 조회한다."""
+    watches = watch_service.list_watches(service)
+    return WatchListResponse(watches=watches, count=len(watches))
+
+
+@router.get(
+    "/watches/{watch_id}",
+    response_model=WatchResponse,
+    responses={
+        401: {"model": ErrorResponse, "description": "세션 만료"},
+        404: {"model": ErrorResponse, "description": "감시 작업 없음"},
+    },
+    summary="좌석 감시 상태 조회",
+    description="감시 작업의 현재 상태, 발견된 열차, 자동 예약 결과를 조회한다.",
+)
+async def get_watch(
+    watch_id: str,
+    service: KorailService = Depends(verify_session),
+    watch_service: WatchService = Depends(get_watch_service),
+):
+    """감시 작업 상태를 조회한다."""
+    try:
+        return watch_service.get_watch(service, watch_id)
+
+    except WatchNotFoundError as e:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": e.error,
+                "code": e.code,
+                "detail": e.detail,
+            },
+        )
+
+
+@router.delete(
+    "/watches/{watch_id}",
+    response_model=WatchResponse,
+    responses={
+        401: {"model": ErrorResponse, "description": "세션 만료"},
+        404: {"model": ErrorResponse, "description": "감시 작업 없음"},
+    },
+    summary="좌석 감시 중단",
+    description="실행 중인 감시 작업을 중단한다.",
+)
+async def cancel_watch(
+    watch_id: str,
+    service: KorailService = Depends(verify_session),
+    watch_service: WatchService = Depends(get_watch_service),
+):
+    """감시 작업을 중단한다."""
+    try:
+        return await watch_service.cancel_watch(service, watch_id)
+
+    except WatchNotFoundError as e:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": e.error,
+                "code": e.code,
+                "detail": e.detail,
+            },
+        )
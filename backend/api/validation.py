@@ -0,0 +1,133 @@
+"""
+API 요청 파라미터 검증
+열차 조회와 좌석 감시 라우트가 공통으로 사용하는 검색 조건 검사.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+from fastapi import HTTPException
+
+# 한국 시간대
+KST = timezone(timedelta(hours=9))
+
+# 유효한 역 목록
+VALID_STATIONS = {
+    "서울", "용산", "영등포", "광명", "수서", "수원", "동탄", "평택지제",
+    "천안아산", "오송", "대전", "김천구미", "서대구", "동대구", "경산",
+    "신경주", "경주", "울산", "물금", "구포", "밀양", "부산",
+    "창원중앙", "마산",
+    "공주", "익산", "정읍", "광주송정", "나주", "목포",
+    "전주", "남원", "순천", "여수엑스포",
+    "강릉", "만종", "둔내", "평창", "진부",
+    "행신", "청량리", "상봉", "양평",
+    "포항",
+}
+
+
+def validate_search_params(dep: str, arr: str, date: str, time: str) -> None:
+    """검색 파라미터 유효성을 검사한다."""
+    if not dep or not dep.strip():
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "INVALID_PARAMS",
+                "code": "SEARCH_001",
+                "detail": "출발역은 필수 입력값입니다",
+            },
+        )
+
+    if not arr or not arr.strip():
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "INVALID_PARAMS",
+                "code": "SEARCH_001",
+                "detail": "도착역은 필수 입력값입니다",
+            },
+        )
+
+    if dep.strip() == arr.strip():
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "INVALID_PARAMS",
+                "code": "SEARCH_001",
+                "detail": "출발역과 도착역이 같을 수 없습니다",
+            },
+        )
+
+    if dep.strip() not in VALID_STATIONS:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "INVALID_PARAMS",
+                "code": "SEARCH_001",
+                "detail": f"유효하지 않은 역명입니다: {dep}",
+            },
+        )
+
+    if arr.strip() not in VALID_STATIONS:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "INVALID_PARAMS",
+                "code": "SEARCH_001",
+                "detail": f"유효하지 않은 역명입니다: {arr}",
+            },
+        )
+
+    if not re.match(r"^\d{8}$", date):
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "INVALID_PARAMS",
+                "code": "SEARCH_001",
+                "detail": "날짜 형식이 올바르지 않습니다 (YYYYMMDD)",
+            },
+        )
+
+    try:
+        search_date = datetime.strptime(date, "%Y%m%d").date()
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "INVALID_PARAMS",
+                "code": "SEARCH_001",
+                "detail": "날짜 형식이 올바르지 않습니다 (YYYYMMDD)",
+            },
+        )
+
+    today = datetime.now(KST).date()
+    if search_date < today:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "INVALID_PARAMS",
+                "code": "SEARCH_001",
+                "detail": "과거 날짜는 조회할 수 없습니다",
+            },
+        )
+
+    if not re.match(r"^\d{6}$", time):
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "INVALID_PARAMS",
+                "code": "SEARCH_001",
+                "detail": "시간 형식이 올바르지 않습니다 (HHmmss)",
+            },
+        )
+
+    hour = int(time[:2])
+    minute = int(time[2:4])
+    if hour > 23 or minute > 59:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "INVALID_PARAMS",
+                "code": "SEARCH_001",
+                "detail": "시간 형식이 올바르지 않습니다 (HHmmss)",
+            },
+        )
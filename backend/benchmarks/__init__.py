@@ -0,0 +1,4 @@
+"""
+성능 측정 도구 (부하 테스트, 대역 서버, 마이크로 벤치마크)
+backend 디렉토리에서 python -m benchmarks.<모듈>로 실행한다.
+"""
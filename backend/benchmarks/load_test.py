@@ -0,0 +1,314 @@
+"""
+오프라인 부하 테스트
+TAGO 대역 서버와 korail2 시뮬레이터(SimulatedKorail)를 사용하는 API 서버를 각각 별도 프로세스로 띄우고,
+고정 도착률(open loop)로 요청을 보내 처리량과 p50/p95/p99 지연 시간, 오류 수를 측정한다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.load_test --scenario search --rate 50 --duration 30
+    python -m benchmarks.load_test --scenario all --json results.json
+
+지연 시간은 요청을 보내기로 예정된 시각부터 측정한다 (서버가 밀리면 대기 시간도 포함).
+TAGO 대역은 benchmarks.stand_ins의 BENCH_* 환경변수로,
+korail2 시뮬레이터의 지연/오류율/좌석 변동은 KORAIL_SIM_* 환경변수로 조정한다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = ("login", "search", "search_anonymous", "reserve")
+
+# 서버 설정 기본값 (환경변수로 지정하면 그 값을 사용한다).
+# 계정별 호출량 제한은 운영 보호용이므로 기본적으로 서버 자체의 처리량을 재도록 넉넉히 둔다.
+SERVER_ENV_DEFAULTS = {
+    "TAGO_API_KEY": "bench",
+    "KORAIL_CLIENT": "services.korail_simulator:SimulatedKorail",
+    "KORAIL_SIM_LATENCY_MS": "80",
+    "KORAIL_SIM_TRAINS_PER_DAY": "80",
+    "KORAIL_SIM_SOLD_OUT_RATIO": "0.5",
+    # 예약이 쌓여 매진되지 않도록 미결제 예약을 빨리 되돌린다
+    "KORAIL_SIM_PAY_WINDOW_SECONDS": "30",
+    "KORAIL_RATE_PER_SECOND": "1000",
+    "KORAIL_RATE_BURST": "1000",
+    "RESERVATION_STORE_PATH": ":memory:",
+    "TAGO_INDEX_PATH": "",
+    "REQUEST_LOG_SAMPLE_RATE": "0",
+    "DEBUG": "false",
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_process(app: str, port: int, env: dict) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", app,
+            "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _wait_ready(url: str, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    raise RuntimeError(f"서버가 시작되지 않았습니다: {url}")
+
+
+class Servers:
+    """TAGO 대역과 API 서버 프로세스 (with 블록이 끝나면 종료)"""
+
+    def __init__(self):
+        self.tago_port = _free_port()
+        self.api_port = _free_port()
+        self._processes: list[subprocess.Popen] = []
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.api_port}"
+
+    def __enter__(self) -> "Servers":
+        env = {**os.environ, "PYTHONPATH": BACKEND_DIR}
+        for key, value in SERVER_ENV_DEFAULTS.items():
+            env.setdefault(key, value)
+        env["TAGO_BASE_URL"] = f"http://127.0.0.1:{self.tago_port}"
+
+        self._processes.append(
+            _start_process("benchmarks.stand_ins:tago_app", self.tago_port, env)
+        )
+        _wait_ready(f"http://127.0.0.1:{self.tago_port}/")
+        self._processes.append(_start_process("main:app", self.api_port, env))
+        _wait_ready(f"{self.base_url}/health")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+# ──────────────────────────────────────────────
+# 측정
+# ──────────────────────────────────────────────
+
+
+def percentile(sorted_values: list[float], q: float) -> Optional[float]:
+    """nearest-rank 분위수 (정렬된 목록). 비어 있으면 None."""
+    if not sorted_values:
+        return None
+    rank = max(1, int(-(-q * len(sorted_values) // 1)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(name: str, rate: float, duration: float, samples: list[tuple[float, str]]) -> dict:
+    """(지연 시간 ms, 결과) 목록을 요약한다. 결과는 HTTP 상태 코드 또는 예외 이름."""
+    latencies = sorted(ms for ms, _ in samples)
+    outcomes = Counter(outcome for _, outcome in samples)
+    errors = sum(n for outcome, n in outcomes.items() if not outcome.startswith("2"))
+
+    def ms(value: Optional[float]) -> Optional[float]:
+        return round(value, 1) if value is not None else None
+
+    return {
+        "scenario": name,
+        "target_rps": rate,
+        "duration_seconds": duration,
+        "requests": len(samples),
+        "achieved_rps": round(len(samples) / duration, 1) if duration else 0.0,
+        "errors": errors,
+        "outcomes": dict(sorted(outcomes.items())),
+        "p50_ms": ms(percentile(latencies, 0.50)),
+        "p95_ms": ms(percentile(latencies, 0.95)),
+        "p99_ms": ms(percentile(latencies, 0.99)),
+        "max_ms": ms(latencies[-1] if latencies else None),
+    }
+
+
+async def run_open_loop(
+    rate: float,
+    duration: float,
+    request: Callable[[int], Awaitable[httpx.Response]],
+) -> list[tuple[float, str]]:
+    """
+    초당 rate개의 요청을 응답과 관계없이 예정된 시각에 보낸다.
+
+    Returns:
+        (예정 시각부터 잰 지연 시간 ms, 상태 코드 또는 예외 이름) 목록
+    """
+    samples: list[tuple[float, str]] = []
+    total = int(rate * duration)
+    started = time.perf_counter()
+
+    async def one(i: int, scheduled: float) -> None:
+        try:
+            response = await request(i)
+            outcome = str(response.status_code)
+        except Exception as e:
+            outcome = type(e).__name__
+        samples.append(((time.perf_counter() - scheduled) * 1000, outcome))
+
+    tasks = []
+    for i in range(total):
+        scheduled = started + i / rate
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(i, scheduled)))
+    await asyncio.gather(*tasks)
+    return samples
+
+
+# ──────────────────────────────────────────────
+# 시나리오
+# ──────────────────────────────────────────────
+
+
+def _dates(days: int) -> list[str]:
+    today = datetime.now()
+    return [(today + timedelta(days=d + 1)).strftime("%Y%m%d") for d in range(days)]
+
+
+async def _login(client: httpx.AsyncClient, account: int) -> str:
+    response = await client.post(
+        "/api/auth/login",
+        json={"korail_id": f"bench-{account:04d}", "korail_pw": "bench"},
+    )
+    response.raise_for_status()
+    return response.json()["session_token"]
+
+
+async def run_scenario(name: str, base_url: str, rate: float, duration: float,
+                       accounts: int, days: int) -> dict:
+    limits = httpx.Limits(max_connections=512, max_keepalive_connections=512)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        dates = _dates(days)
+        tokens: list[str] = []
+        if name in ("search", "reserve"):
+            tokens = list(await asyncio.gather(*(_login(client, a) for a in range(accounts))))
+
+        def auth(i: int) -> dict:
+            return {"Authorization": f"Bearer {tokens[i % len(tokens)]}"}
+
+        def search_params(i: int) -> dict:
+            return {
+                "dep": "서울", "arr": "부산",
+                "date": dates[i % len(dates)], "time": "000000",
+            }
+
+        async def login(i: int) -> httpx.Response:
+            return await client.post(
+                "/api/auth/login",
+                json={"korail_id": f"bench-{i % accounts:04d}", "korail_pw": "bench"},
+            )
+
+        async def search(i: int) -> httpx.Response:
+            return await client.get(
+                "/api/trains/search", params=search_params(i), headers=auth(i),
+            )
+
+        async def search_anonymous(i: int) -> httpx.Response:
+            return await client.get("/api/trains/search", params=search_params(i))
+
+        async def reserve(i: int) -> httpx.Response:
+            # 조회 결과의 handle로 예약 (실제 앱의 조회 → 예약 흐름)
+            params = search_params(i)
+            found = await client.get("/api/trains/search", params=params, headers=auth(i))
+            if found.status_code != 200:
+                return found
+            train = random.choice(found.json()["trains"])
+            return await client.post(
+                "/api/reservation",
+                headers=auth(i),
+                json={
+                    "train_no": train["train_no"],
+                    "dep_station": params["dep"],
+                    "arr_station": params["arr"],
+                    "date": params["date"],
+                    "time": params["time"],
+                    "handle": train.get("handle"),
+                },
+            )
+
+        request = {
+            "login": login,
+            "search": search,
+            "search_anonymous": search_anonymous,
+            "reserve": reserve,
+        }[name]
+        samples = await run_open_loop(rate, duration, request)
+    return summarize(name, rate, duration, samples)
+
+
+def _print_table(results: list[dict]) -> None:
+    header = (
+        f"{'scenario':<18}{'rps':>8}{'reqs':>8}{'errors':>8}"
+        f"{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['scenario']:<18}{r['achieved_rps']:>8}{r['requests']:>8}{r['errors']:>8}"
+            f"{r['p50_ms'] or '-':>9}{r['p95_ms'] or '-':>9}"
+            f"{r['p99_ms'] or '-':>9}{r['max_ms'] or '-':>9}"
+        )
+    for r in results:
+        print(f"{r['scenario']}: {r['outcomes']}")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="오프라인 부하 테스트 (대역 서버 사용)")
+    parser.add_argument("--scenario", choices=SCENARIOS + ("all",), default="all")
+    parser.add_argument("--rate", type=float, default=20.0, help="초당 요청 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="시나리오별 측정 시간 (초)")
+    parser.add_argument("--accounts", type=int, default=20, help="로그인할 대역 계정 수")
+    parser.add_argument("--days", type=int, default=7, help="조회 날짜 수 (캐시 분산)")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    scenarios = SCENARIOS if args.scenario == "all" else (args.scenario,)
+    results = []
+    with Servers() as servers:
+        for name in scenarios:
+            results.append(asyncio.run(run_scenario(
+                name, servers.base_url, args.rate, args.duration, args.accounts, args.days,
+            )))
+
+    _print_table(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"results": results}, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
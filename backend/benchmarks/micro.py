@@ -0,0 +1,308 @@
+"""
+조회 경로 마이크로 벤치마크
+감시/조회 요청마다 실행되는 파라미터 검증, TAGO/korail2 응답 파싱,
+TrainInfo/TrainSearchResponse 생성과 직렬화를 열차 120건 기준으로 측정한다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.micro run                 # 측정 결과 출력
+    python -m benchmarks.micro save                # 측정 결과를 기준값 파일로 저장
+    python -m benchmarks.micro compare             # 기준값보다 20% 이상 느려진 항목이 있으면 종료 코드 1
+    python -m benchmarks.micro compare --threshold 0.1 -k tago
+
+각 항목은 timeit으로 반복 측정한 뒤 가장 빠른 회차의 1회 호출 시간(µs)을 기록한다.
+기준값은 측정한 머신에 따라 다르므로, 비교는 같은 머신에서 저장한 기준값으로 한다.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from api.validation import validate_search_params  # noqa: E402
+from models.schemas import TrainInfo, TrainSearchResponse  # noqa: E402
+from services.korail_service import KorailService  # noqa: E402
+from services.korail_simulator import SeatWorld, SimulatedKorail  # noqa: E402
+from services.tago_service import TaGoService  # noqa: E402
+
+KST = timezone(timedelta(hours=9))
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "micro_baseline.json")
+DEFAULT_THRESHOLD = 0.2
+# 한 번의 조회 응답에 담기는 열차 수 (하루 전체 조회 기준)
+TRAIN_COUNT = 120
+
+# 항목 이름 -> 준비 함수 (측정할 인자 없는 함수를 반환한다. 준비 시간은 측정에서 제외)
+CASES: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def case(name: str):
+    def register(setup: Callable[[], Callable[[], object]]):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+# ──────────────────────────────────────────────
+# 고정 데이터
+# ──────────────────────────────────────────────
+
+
+def _date() -> str:
+    return (datetime.now(KST) + timedelta(days=1)).strftime("%Y%m%d")
+
+
+def _tago_items(date: str) -> list[dict]:
+    """TAGO getStrtpntAlocFndTrainInfo 응답 항목 (JSON 디코딩 결과와 같은 타입)"""
+    start = datetime.strptime(date + "050000", "%Y%m%d%H%M%S")
+    items = []
+    for i in range(TRAIN_COUNT):
+        dep = start + timedelta(minutes=9 * i)
+        arr = dep + timedelta(hours=2, minutes=40)
+        items.append({
+            "adultcharge": 59800 if i % 3 else 52600,
+            "arrplacename": "부산",
+            "arrplandtime": int(arr.strftime("%Y%m%d%H%M%S")),
+            "depplacename": "서울",
+            "depplandtime": int(dep.strftime("%Y%m%d%H%M%S")),
+            "traingradename": "KTX-산천" if i % 4 == 0 else "KTX",
+            "trainno": 101 + i,
+        })
+    return items
+
+
+def _korail_trains(date: str) -> list:
+    """korail2 search_train_allday 결과 (시뮬레이터로 생성, 시드 고정)"""
+    world = SeatWorld(seed=0, clock=lambda: 0.0)
+    world.trains_per_day = TRAIN_COUNT
+    world.latency = 0.0
+    korail = SimulatedKorail("bench", "bench", world=world)
+    return korail.search_train_allday("서울", "부산", date, "000000", include_no_seats=True)
+
+
+def _train_infos(date: str) -> list[TrainInfo]:
+    return [TaGoService._parse_train_item(item) for item in _tago_items(date)]
+
+
+# ──────────────────────────────────────────────
+# 측정 항목
+# ──────────────────────────────────────────────
+
+
+@case("validate_params")
+def _validate_params_case():
+    date = _date()
+    queries = [
+        ("서울", "부산", date, "000000"),
+        ("용산", "광주송정", date, "093000"),
+        ("수서", "동대구", date, "180000"),
+    ]
+
+    def run():
+        for query in queries:
+            validate_search_params(*query)
+    return run
+
+
+@case("tago_parse_items")
+def _tago_parse_case():
+    items = _tago_items(_date())
+
+    def run():
+        return [TaGoService._parse_train_item(item) for item in items]
+    return run
+
+
+@case("korail_format_time")
+def _format_time_case():
+    times = [t for train in _korail_trains(_date()) for t in (train.dep_time, train.arr_time)]
+
+    def run():
+        return [KorailService._format_time(t) for t in times]
+    return run
+
+
+@case("korail_train_info")
+def _korail_train_info_case():
+    # KorailService.search_trains의 Train -> TrainInfo 변환과 같은 작업
+    trains = _korail_trains(_date())
+
+    def run():
+        return [
+            TrainInfo(
+                train_no=train.train_no,
+                train_type=train.train_type_name,
+                dep_station=train.dep_station_name,
+                arr_station=train.arr_station_name,
+                dep_time=KorailService._format_time(train.dep_time),
+                arr_time=KorailService._format_time(train.arr_time),
+                general_seats=train.has_general_seat(),
+                special_seats=train.has_special_seat(),
+                handle="0" * 32,
+            )
+            for train in trains
+        ]
+    return run
+
+
+@case("search_response_build")
+def _response_build_case():
+    trains = _train_infos(_date())
+    searched_at = datetime.now(KST).isoformat()
+
+    def run():
+        return TrainSearchResponse(trains=trains, searched_at=searched_at)
+    return run
+
+
+@case("search_response_validate")
+def _response_validate_case():
+    # response_model 검증 (라우트가 반환한 dict/모델을 다시 검증하는 경로)
+    payload = TrainSearchResponse(
+        trains=_train_infos(_date()), searched_at=datetime.now(KST).isoformat(),
+    ).model_dump()
+
+    def run():
+        return TrainSearchResponse.model_validate(payload)
+    return run
+
+
+@case("search_response_json")
+def _response_json_case():
+    response = TrainSearchResponse(
+        trains=_train_infos(_date()), searched_at=datetime.now(KST).isoformat(),
+    )
+
+    def run():
+        return response.model_dump_json()
+    return run
+
+
+# ──────────────────────────────────────────────
+# 측정 / 비교
+# ──────────────────────────────────────────────
+
+
+def measure(run: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> float:
+    """가장 빠른 회차의 1회 호출 시간 (µs)"""
+    timer = timeit.Timer(run)
+    number, elapsed = timer.autorange()
+    # 회차당 min_time 이상 돌도록 반복 횟수를 늘린다
+    if elapsed < min_time:
+        number = max(number, int(number * min_time / max(elapsed, 1e-9)))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e6
+
+
+def run_cases(pattern: Optional[str] = None) -> dict[str, float]:
+    results = {}
+    for name, setup in CASES.items():
+        if pattern and pattern not in name:
+            continue
+        results[name] = round(measure(setup()), 3)
+    return results
+
+
+def find_regressions(current: dict[str, float], baseline: dict[str, float],
+                     threshold: float) -> list[tuple[str, float, float, float]]:
+    """
+    기준값보다 threshold 비율 이상 느려진 항목.
+
+    Returns:
+        (항목 이름, 기준값 µs, 현재 µs, 변화율) 목록. 기준값에 없는 항목은 제외한다.
+    """
+    regressions = []
+    for name, value in current.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        change = value / base - 1
+        if change > threshold:
+            regressions.append((name, base, value, change))
+    return regressions
+
+
+def _environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+    }
+
+
+def _load_baseline(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _print_results(results: dict[str, float], baseline: Optional[dict[str, float]] = None) -> None:
+    header = f"{'case':<28}{'µs':>12}"
+    if baseline is not None:
+        header += f"{'baseline':>12}{'change':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, value in results.items():
+        line = f"{name:<28}{value:>12.2f}"
+        if baseline is not None:
+            base = baseline.get(name)
+            if base:
+                line += f"{base:>12.2f}{(value / base - 1) * 100:>+9.1f}%"
+            else:
+                line += f"{'-':>12}{'-':>10}"
+        print(line)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="조회 경로 마이크로 벤치마크")
+    parser.add_argument("command", choices=("run", "save", "compare"), nargs="?", default="run")
+    parser.add_argument("-k", dest="pattern", help="이름에 이 문자열이 들어간 항목만 측정")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="기준값 파일 경로")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="회귀로 판단할 느려짐 비율 (0.2 = 20%%)",
+    )
+    parser.add_argument("--json", help="측정 결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    results = run_cases(args.pattern)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"environment": _environment(), "results_us": results}, f, indent=2)
+
+    if args.command == "run":
+        _print_results(results)
+        return 0
+
+    if args.command == "save":
+        saved = {}
+        if args.pattern and os.path.exists(args.baseline):
+            saved = _load_baseline(args.baseline).get("results_us", {})
+        saved.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"environment": _environment(), "results_us": saved}, f, indent=2)
+            f.write("\n")
+        _print_results(results)
+        print(f"기준값 저장: {args.baseline}")
+        return 0
+
+    stored = _load_baseline(args.baseline)
+    baseline = stored.get("results_us", {})
+    _print_results(results, baseline)
+    if stored.get("environment") != _environment():
+        print(f"주의: 기준값 측정 환경이 다릅니다 ({stored.get('environment')})")
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    for name, base, value, change in regressions:
+        print(f"회귀: {name} {base:.2f}µs -> {value:.2f}µs ({change * 100:+.1f}%)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+부하 테스트용 TAGO 대역 (stand-in)
+- tago_app: TAGO getStrtpntAlocFndTrainInfo 응답을 흉내 내는 ASGI 앱
+
+korail2 대역은 services.korail_simulator.SimulatedKorail을 사용한다 (KORAIL_SIM_* 환경변수).
+
+지연 시간, 오류율, 열차 수는 환경변수로 조정한다.
+- BENCH_TAGO_LATENCY_MS (기본 50), BENCH_TAGO_ERROR_RATE (기본 0)
+- BENCH_TRAINS_PER_DAY (기본 80): 하루 열차 수
+"""
+
+import asyncio
+import json
+import os
+import random
+from datetime import datetime
+
+from services.korail_simulator import daily_timetable
+
+
+def _env_float(name: str, default: str) -> float:
+    return float(os.getenv(name, default))
+
+
+# ──────────────────────────────────────────────
+# TAGO 대역 (ASGI)
+# ──────────────────────────────────────────────
+
+
+async def tago_app(scope, receive, send):
+    """
+    TAGO 열차 정보 API 대역.
+
+    depPlandTime 날짜의 열차를 numOfRows/pageNo로 나누어 반환한다.
+    uvicorn benchmarks.stand_ins:tago_app --port 9001 로 실행한다.
+    """
+    if scope["type"] != "http":
+        return
+
+    from urllib.parse import parse_qsl
+
+    params = dict(parse_qsl(scope["query_string"].decode("utf-8")))
+    await asyncio.sleep(_env_float("BENCH_TAGO_LATENCY_MS", "50") / 1000)
+
+    if random.random() < _env_float("BENCH_TAGO_ERROR_RATE", "0"):
+        status, payload = 503, {"error": "unavailable"}
+    else:
+        date = params.get("depPlandTime", datetime.now().strftime("%Y%m%d"))
+        rows = int(params.get("numOfRows", "10"))
+        page = int(params.get("pageNo", "1"))
+        trains = daily_timetable(date, int(_env_float("BENCH_TRAINS_PER_DAY", "80")))
+        items = [
+            {
+                "trainno": int(no),
+                "traingradename": "KTX",
+                "depplacename": "서울",
+                "arrplacename": "부산",
+                "depplandtime": int(date + dep),
+                "arrplandtime": int(date + arr),
+                "adultcharge": 59800,
+            }
+            for no, dep, arr in trains[(page - 1) * rows: page * rows]
+        ]
+        status, payload = 200, {
+            "response": {
+                "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+                "body": {
+                    "items": {"item": items} if items else "",
+                    "numOfRows": rows,
+                    "pageNo": page,
+                    "totalCount": len(trains),
+                },
+            }
+        }
+
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json;charset=UTF-8")],
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -6,6 +6,7 @@ FastAPI 앱 생성, CORS 설정, 라우터 등록, 글로벌 예외 핸들러를
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
 
@@ -14,16 +15,35 @@ from dotenv import load_dotenv
 # ──────────────────────────────────────────────
 load_dotenv()
 
-from fastapi import FastAPI, Request  # noqa: E402
+from fastapi import FastAPI, HTTPException, Request  # noqa: E402
+from fastapi.exception_handlers import http_exception_handler  # noqa: E402
 from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
-from fastapi.responses import JSONResponse  # noqa: E402
-from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
-
+from fastapi.responses import JSONResponse, PlainTextResponse  # noqa: E402
+
+from api.deps import _session_registry  # noqa: E402
+from api.middleware import (  # noqa: E402
+    ProfilingMiddleware,
+    RequestLoggingMiddleware,
+    admin_token,
+    get_route_latency,
+)
+from api.routes.admin import router as admin_router  # noqa: E402
 from api.routes.auth import router as auth_router  # noqa: E402
 from api.routes.trains import router as trains_router  # noqa: E402
 from api.routes.reservation import router as reservation_router  # noqa: E402
+from api.routes.watches import router as watches_router  # noqa: E402
+from services.executor_service import (  # noqa: E402
+    get_korail_executor,
+    shutdown_korail_executor,
+)
 from services.korail_service import KorailServiceError  # noqa: E402
 from services.tago_service import TaGoServiceError  # noqa: E402
+from services.reservation_store import (  # noqa: E402
+    close_reservation_store,
+    get_reservation_store,
+)
+from services.retry_service import upstream_stats  # noqa: E402
+from services.metrics import record_error, render_metrics  # noqa: E402
 
 # ──────────────────────────────────────────────
 # 로깅 설정
@@ -39,6 +59,46 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# ──────────────────────────────────────────────
+# 앱 수명 주기 (시작/종료)
+# ──────────────────────────────────────────────
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작 시 백그라운드 작업과 HTTP 연결을 준비하고, 종료 시 정리한다."""
+    from api.deps import (
+        _tago_service,
+        _timetable_index,
+        _timetable_prefetcher,
+        _watch_service,
+    )
+
+    logger.info("=" * 60)
+    logger.info("KTX Auto Reservation API 서버 시작")
+    logger.info("  Swagger UI: http://localhost:%s/docs", os.getenv("PORT", "8000"))
+    logger.info("  ReDoc:      http://localhost:%s/redoc", os.getenv("PORT", "8000"))
+    logger.info("=" * 60)
+
+    await _tago_service.start()
+    get_reservation_store().start()
+    if _timetable_prefetcher is not None:
+        _timetable_prefetcher.start()
+
+    yield
+
+    await _watch_service.shutdown()
+    if _timetable_prefetcher is not None:
+        await _timetable_prefetcher.stop()
+    await _tago_service.close()
+    if _timetable_index is not None:
+        _timetable_index.close()
+    await get_reservation_store().stop()
+    close_reservation_store()
+    shutdown_korail_executor()
+    logger.info("KTX Auto Reservation API 서버 종료")
+
+
 # ──────────────────────────────────────────────
 # FastAPI 앱 생성
 # ──────────────────────────────────────────────
@@ -52,6 +112,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # ──────────────────────────────────────────────
@@ -71,29 +132,16 @@ app.add_middleware(
 )
 
 # ──────────────────────────────────────────────
-# 요청 디버그 로깅 미들웨어
+# 요청 프로파일링 미들웨어 (PROFILE_ADMIN_TOKEN 설정 시에만 등록)
 # ──────────────────────────────────────────────
+if admin_token():
+    app.add_middleware(ProfilingMiddleware)
+    logger.info("요청 프로파일링 활성화 (X-Profile-Token 헤더)")
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        body = b""
-        if request.method in ("POST", "PUT", "PATCH"):
-            body = await request.body()
-        logger.info(
-            "[REQ] %s %s | body=%s",
-            request.method,
-            request.url.path,
-            body[:500].decode("utf-8", errors="replace") if body else "-",
-        )
-        response = await call_next(request)
-        logger.info(
-            "[RES] %s %s → %d",
-            request.method,
-            request.url.path,
-            response.status_code,
-        )
-        return response
-
+# ──────────────────────────────────────────────
+# 요청 로깅 미들웨어 (샘플링, 느린 요청 경고, 라우트별 지연 시간)
+# 나중에 등록한 미들웨어가 바깥쪽이므로 프로파일링 시간까지 포함해 기록한다
+# ──────────────────────────────────────────────
 app.add_middleware(RequestLoggingMiddleware)
 
 # ──────────────────────────────────────────────
@@ -102,14 +150,28 @@ app.add_middleware(RequestLoggingMiddleware)
 app.include_router(auth_router, prefix="/api/auth", tags=["auth"])
 app.include_router(trains_router, prefix="/api/trains", tags=["trains"])
 app.include_router(reservation_router, prefix="/api", tags=["reservation"])
+app.include_router(watches_router, prefix="/api", tags=["watches"])
+app.include_router(admin_router, prefix="/api/admin", tags=["admin"])
 
-logger.info("라우터 등록 완료: /api/auth, /api/trains, /api/reservation")
+logger.info("라우터 등록 완료: /api/auth, /api/trains, /api/reservation, /api/watches, /api/admin")
 
 # ──────────────────────────────────────────────
 # 글로벌 예외 핸들러
 # ──────────────────────────────────────────────
 
 
+@app.exception_handler(HTTPException)
+async def http_exception_with_metrics(
+    request: Request, exc: HTTPException
+) -> JSONResponse:
+    """
+    라우트에서 발생한 HTTPException의 에러 코드를 기록하고 기본 처리기로 응답한다.
+    """
+    if isinstance(exc.detail, dict):
+        record_error(exc.detail.get("code"))
+    return await http_exception_handler(request, exc)
+
+
 @app.exception_handler(KorailServiceError)
 async def korail_exception_handler(
     request: Request, exc: KorailServiceError
@@ -140,9 +202,11 @@ async def korail_exception_handler(
         "SYSTEM_001": 500, # 내부 서버 오류
         "SYSTEM_002": 503, # 코레일 서버 오류
         "SYSTEM_003": 504, # 요청 시간 초과
+        "SYSTEM_004": 429, # 호출량 제한
     }
 
     status_code = status_code_map.get(exc.code, 500)
+    record_error(exc.code)
 
     return JSONResponse(
         status_code=status_code,
@@ -175,6 +239,7 @@ async def tago_exception_handler(
     }
 
     status_code = status_code_map.get(exc.code, 500)
+    record_error(exc.code)
 
     return JSONResponse(
         status_code=status_code,
@@ -198,6 +263,7 @@ async def general_exception_handler(
         type(exc).__name__,
         str(exc),
     )
+    record_error("SYSTEM_001")
 
     return JSONResponse(
         status_code=500,
@@ -222,30 +288,29 @@ async def general_exception_handler(
 )
 async def health_check():
     """서버 상태 확인용 헬스체크 엔드포인트."""
-    return {"status": "ok", "service": "KTX Auto Reservation API"}
-
-
-# ──────────────────────────────────────────────
-# 앱 이벤트
-# ──────────────────────────────────────────────
-
-
-@app.on_event("startup")
-async def startup_event():
-    """서버 시작 시 실행되는 이벤트 핸들러."""
-    logger.info("=" * 60)
-    logger.info("KTX Auto Reservation API 서버 시작")
-    logger.info("  Swagger UI: http://localhost:%s/docs", os.getenv("PORT", "8000"))
-    logger.info("  ReDoc:      http://localhost:%s/redoc", os.getenv("PORT", "8000"))
-    logger.info("=" * 60)
+    return {
+        "status": "ok",
+        "service": "KTX Auto Reservation API",
+        "korail_executor": get_korail_executor().stats(),
+        "sessions": _session_registry.stats(),
+        "upstreams": upstream_stats(),
+        "reservation_store": get_reservation_store().stats(),
+        "routes": get_route_latency().stats(),
+    }
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """서버 종료 시 실행되는 이벤트 핸들러."""
-    from api.deps import _tago_service
-    await _tago_service.close()
-    logger.info("KTX Auto Reservation API 서버 종료")
+@app.get(
+    "/metrics",
+    tags=["system"],
+    summary="지표",
+    description="요청/업스트림 지연 시간, 폴백/오류 횟수, 캐시 통계를 Prometheus 텍스트 포맷으로 반환한다.",
+    response_class=PlainTextResponse,
+)
+async def metrics():
+    """Prometheus 수집용 지표 엔드포인트."""
+    return PlainTextResponse(
+        render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
 
 
 # ──────────────────────────────────────────────
@@ -39,6 +39,57 @@ class ReservationRequest(BaseModel):
     arr_station: str = Field(..., description="도착역")
     date: str = Field(..., description="출발 날짜 (YYYYMMDD)")
     time: str = Field(default="000000", description="출발 시간 (HHmmss)")
+    handle: Optional[str] = Field(
+        None,
+        description="열차 조회 결과의 handle. 유효하면 재조회 없이 즉시 예약한다",
+    )
+
+
+class TrainSearchQuery(BaseModel):
+    """열차 조회 조건 (일괄 조회의 개별 항목)"""
+    dep: str = Field(..., description="출발역 이름 (한글)")
+    arr: str = Field(..., description="도착역 이름 (한글)")
+    date: str = Field(..., description="출발 날짜 (YYYYMMDD)")
+    time: str = Field(default="000000", description="출발 시간 (HHmmss)")
+
+
+class BatchSearchRequest(BaseModel):
+    """열차 일괄 조회 요청"""
+    queries: list[TrainSearchQuery] = Field(
+        ..., min_length=1, max_length=20, description="조회 조건 목록 (최대 20건)"
+    )
+
+
+class BatchCancellationRequest(BaseModel):
+    """예약 일괄 취소 요청"""
+    reservation_ids: list[str] = Field(
+        ..., min_length=1, max_length=20, description="취소할 예약 번호 목록 (최대 20건)"
+    )
+
+
+class WatchRequest(BaseModel):
+    """좌석 감시 등록 요청"""
+    dep_station: str = Field(..., description="출발역")
+    arr_station: str = Field(..., description="도착역")
+    date: str = Field(..., description="출발 날짜 (YYYYMMDD)")
+    time: str = Field(default="000000", description="출발 시간 (HHmmss, 이 시간 이후 열차 감시)")
+    train_nos: list[str] = Field(
+        default_factory=list,
+        description="감시할 열차 번호 목록 (비어 있으면 조건에 맞는 모든 열차)",
+    )
+    seat_type: SeatType = Field(
+        default=SeatType.GENERAL,
+        description='감시할 좌석 유형: "general" (일반실), "special" (특실)'
+    )
+    interval_seconds: float = Field(
+        default=10.0, ge=3.0, le=300.0, description="조회 주기 (초)"
+    )
+    auto_reserve: bool = Field(
+        default=False, description="좌석 발견 시 즉시 예약 여부"
+    )
+    max_duration_minutes: int = Field(
+        default=60, ge=1, le=720, description="최대 감시 시간 (분)"
+    )
 
 
 # ──────────────────────────────────────────────
@@ -53,6 +104,19 @@ class LoginResponse(BaseModel):
     message: str = Field(default="로그인 성공", description="결과 메시지")
 
 
+class RateLimitResponse(BaseModel):
+    """계정별 호출량 제한 상태 응답"""
+    rate_per_second: float = Field(..., description="지속 허용 호출 수 (초당)")
+    burst: float = Field(..., description="순간 허용 호출 수 (버킷 크기)")
+    reserved: float = Field(..., description="예약/취소 전용 예비 토큰 수")
+    tokens: float = Field(..., description="현재 남은 토큰 수")
+    high_waiting: int = Field(..., description="토큰을 기다리는 예약/취소 요청 수")
+    granted_high: int = Field(..., description="누적 허용된 예약/취소 호출 수")
+    granted_low: int = Field(..., description="누적 허용된 열차 조회 호출 수")
+    throttled: int = Field(..., description="호출량 초과로 최근 결과 응답/거절된 조회 수")
+    timeouts: int = Field(..., description="대기 시간 초과로 거절된 예약/취소 수")
+
+
 class TrainInfo(BaseModel):
     """열차 정보"""
     train_no: str = Field(..., description="열차 번호")
@@ -64,6 +128,9 @@ class TrainInfo(BaseModel):
     general_seats: Optional[bool] = Field(None, description="일반실 좌석 여부 (true: 있음, null: 미확인)")
     special_seats: Optional[bool] = Field(None, description="특실 좌석 여부 (true: 있음, null: 미확인)")
     adult_charge: Optional[int] = Field(None, description="일반석 운임 (원, TAGO 조회 시)")
+    handle: Optional[str] = Field(
+        None, description="예약용 열차 핸들 (korail2 조회 시, 짧은 시간 동안 유효)"
+    )
 
 
 class TrainSearchResponse(BaseModel):
@@ -107,6 +174,52 @@ class CancellationResponse(BaseModel):
     status: str = Field(..., description='취소 상태 ("cancelled")')
     message: str = Field(..., description="결과 메시지")
     cancelled_at: str = Field(..., description="취소 시각 (ISO 8601)")
+    verification: str = Field(
+        "pending",
+        description='취소 확인 상태 ("pending", "confirmed", "still_exists", "unknown"). '
+                    "GET /api/reservation/{id}/cancellation으로 결과를 조회한다",
+    )
+
+
+class CancellationStatusResponse(BaseModel):
+    """예약 취소 확인 상태 응답"""
+    reservation_id: str = Field(..., description="예약 번호")
+    verification: str = Field(
+        ...,
+        description='취소 확인 상태 ("pending": 확인 중, "confirmed": 취소 확인, '
+                    '"still_exists": 예약이 남아 있음, "unknown": 확인 조회 실패)',
+    )
+
+
+class WatchResponse(BaseModel):
+    """좌석 감시 상태 응답"""
+    watch_id: str = Field(..., description="감시 작업 ID")
+    status: str = Field(
+        ...,
+        description='감시 상태 ("searching", "reserving", "found", "success", '
+                    '"failure", "expired", "cancelled")',
+    )
+    dep_station: str = Field(..., description="출발역")
+    arr_station: str = Field(..., description="도착역")
+    date: str = Field(..., description="출발 날짜 (YYYYMMDD)")
+    time: str = Field(..., description="출발 시간 (HHmmss)")
+    train_nos: list[str] = Field(default_factory=list, description="감시 대상 열차 번호")
+    seat_type: SeatType = Field(..., description="감시 좌석 유형")
+    interval_seconds: float = Field(..., description="조회 주기 (초)")
+    auto_reserve: bool = Field(..., description="자동 예약 여부")
+    poll_count: int = Field(..., description="누적 조회 횟수")
+    created_at: str = Field(..., description="등록 시각 (ISO 8601)")
+    expires_at: str = Field(..., description="감시 종료 예정 시각 (ISO 8601)")
+    last_checked_at: Optional[str] = Field(None, description="마지막 조회 시각 (ISO 8601)")
+    matched_train: Optional[TrainInfo] = Field(None, description="좌석이 발견된 열차")
+    reservation: Optional[ReservationResponse] = Field(None, description="자동 예약 결과")
+    last_error: Optional[str] = Field(None, description="마지막 오류 메시지")
+
+
+class WatchListResponse(BaseModel):
+    """좌석 감시 목록 응답"""
+    watches: list[WatchResponse] = Field(default_factory=list, description="감시 작업 목록")
+    count: int = Field(..., description="감시 작업 수")
 
 
 class ErrorResponse(BaseModel):
@@ -114,3 +227,41 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="에러 타입 (대문자 SNAKE_CASE)")
     code: str = Field(..., description="에러 코드 (카테고리_숫자 3자리)")
     detail: str = Field(..., description="사용자에게 표시 가능한 에러 설명 (한국어)")
+
+
+class BatchSearchResult(BaseModel):
+    """열차 일괄 조회의 개별 결과 (성공 시 trains, 실패 시 error)"""
+    query: TrainSearchQuery = Field(..., description="조회 조건")
+    status_code: int = Field(..., description="개별 조회의 HTTP 상태 코드")
+    trains: list[TrainInfo] = Field(default_factory=list, description="열차 정보 배열")
+    error: Optional[ErrorResponse] = Field(None, description="실패 시 에러 정보")
+
+
+class BatchSearchResponse(BaseModel):
+    """열차 일괄 조회 응답 (요청 순서와 같은 순서)"""
+    results: list[BatchSearchResult] = Field(default_factory=list, description="조회 결과 배열")
+    searched_at: str = Field(..., description="조회 시각 (ISO 8601)")
+
+
+class DateSearchResult(BaseModel):
+    """날짜 범위 조회의 날짜별 결과 (NDJSON 한 줄)"""
+    date: str = Field(..., description="출발 날짜 (YYYYMMDD)")
+    status_code: int = Field(..., description="해당 날짜 조회의 HTTP 상태 코드")
+    trains: list[TrainInfo] = Field(default_factory=list, description="열차 정보 배열")
+    error: Optional[ErrorResponse] = Field(None, description="실패 시 에러 정보")
+
+
+class BatchCancellationResult(BaseModel):
+    """예약 일괄 취소의 개별 결과 (성공 시 result, 실패 시 error)"""
+    reservation_id: str = Field(..., description="예약 번호")
+    status_code: int = Field(..., description="개별 취소의 HTTP 상태 코드")
+    result: Optional[CancellationResponse] = Field(None, description="성공 시 취소 결과")
+    error: Optional[ErrorResponse] = Field(None, description="실패 시 에러 정보")
+
+
+class BatchCancellationResponse(BaseModel):
+    """예약 일괄 취소 응답 (요청 순서와 같은 순서, 중복 예약 번호는 한 번만 포함)"""
+    results: list[BatchCancellationResult] = Field(
+        default_factory=list, description="취소 결과 배열"
+    )
+    cancelled: int = Field(..., description="취소 성공 건수")
@@ -0,0 +1,160 @@
+"""
+TTLCache - 크기 제한 LRU + TTL 인메모리 캐시
+항목마다 fresh 기간(ttl)과 그 이후 stale 허용 기간(stale)을 두어
+stale-while-revalidate 방식의 조회를 지원한다.
+"""
+
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 살아 있는 모든 캐시 (지표 수집용, 세션별 캐시는 세션과 함께 사라진다)
+_caches: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+# 사라진 캐시의 누적 통계 (이름별). 세션 캐시가 사라져도 누적 지표가 줄지 않도록 보관한다
+_COUNTER_KEYS = ("hits", "stale_hits", "misses", "evictions")
+_retired_stats: dict[str, dict[str, int]] = {}
+
+
+class _CacheCounts:
+    """캐시 하나의 누적 hit/miss 통계. 캐시가 사라진 뒤에도 합산할 수 있도록 캐시와 분리해 둔다."""
+
+    __slots__ = _COUNTER_KEYS
+
+    def __init__(self):
+        for key in _COUNTER_KEYS:
+            setattr(self, key, 0)
+
+
+def _retire(name: str, counts: _CacheCounts) -> None:
+    """사라진 캐시의 통계를 이름별 누적값에 더한다 (weakref.finalize 콜백)."""
+    retired = _retired_stats.setdefault(name, dict.fromkeys(_COUNTER_KEYS, 0))
+    for key in _COUNTER_KEYS:
+        retired[key] += getattr(counts, key)
+
+
+class TTLCache:
+    """
+    크기 제한 LRU 캐시.
+
+    - ttl_seconds 이내의 항목은 fresh
+    - ttl_seconds ~ ttl_seconds + stale_seconds 구간의 항목은 stale
+      (호출자가 stale 값을 응답하면서 백그라운드 갱신을 할 수 있다)
+    - 그 이후의 항목은 조회 시 제거된다
+    - max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 제거한다
+
+    이벤트 루프 스레드에서만 접근하므로 별도의 lock은 두지 않는다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+        name: str = "cache",
+    ):
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._stale = stale_seconds
+        self._name = name
+        # key -> (value, stored_at)
+        self._entries: "OrderedDict[Hashable, tuple[Any, float]]" = OrderedDict()
+        self._counts = _CacheCounts()
+        _caches.add(self)
+        weakref.finalize(self, _retire, name, self._counts)
+
+    def get_entry(self, key: Hashable) -> Optional[tuple[Any, bool]]:
+        """
+        캐시 항목을 조회한다.
+
+        Returns:
+            (value, is_fresh) 튜플. 항목이 없거나 stale 허용 기간도 지났으면 None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._counts.misses += 1
+            return None
+
+        value, stored_at = entry
+        age = time.monotonic() - stored_at
+        if age > self._ttl + self._stale:
+            del self._entries[key]
+            self._counts.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        if age <= self._ttl:
+            self._counts.hits += 1
+            return value, True
+
+        self._counts.stale_hits += 1
+        return value, False
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """fresh 항목만 반환한다. 없거나 stale이면 None."""
+        entry = self.get_entry(key)
+        if entry is None or not entry[1]:
+            return None
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """항목을 저장하고 크기 상한을 넘으면 LRU 항목을 제거한다."""
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._counts.evictions += 1
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """항목을 제거하고 값을 반환한다. 없으면 None."""
+        entry = self._entries.pop(key, None)
+        return entry[0] if entry is not None else None
+
+    def clear(self) -> None:
+        """모든 항목을 제거한다."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def stats(self) -> dict:
+        """항목 수와 누적 hit/miss 통계를 반환한다."""
+        counts = self._counts
+        return {
+            "name": self._name,
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": counts.hits,
+            "stale_hits": counts.stale_hits,
+            "misses": counts.misses,
+            "evictions": counts.evictions,
+        }
+
+
+def cache_stats_by_name() -> dict[str, dict]:
+    """
+    이름별로 합산한 캐시 통계를 반환한다.
+
+    세션마다 만들어지는 캐시(korail-raw-reservations 등)는 같은 이름으로 합쳐진다.
+    hit/miss/eviction은 이미 사라진 캐시의 값까지 더한 누적값이라 줄어들지 않는다.
+    """
+    # 살아 있는 캐시를 먼저 붙잡아 두어야 합산 도중 사라진 캐시가 빠지거나 두 번 세지지 않는다.
+    # 합산 중 GC로 다른 캐시가 정리되면 _retired_stats가 바뀔 수 있으므로 복사본을 순회한다
+    live = list(_caches)
+    totals: dict[str, dict] = {
+        name: {"entries": 0, **retired} for name, retired in list(_retired_stats.items())
+    }
+    for cache in live:
+        stats = cache.stats()
+        total = totals.setdefault(
+            stats["name"], {"entries": 0, **dict.fromkeys(_COUNTER_KEYS, 0)},
+        )
+        for key in total:
+            total[key] += stats[key]
+    return totals
@@ -0,0 +1,333 @@
+"""
+Cassette - 업스트림(TAGO, 코레일) HTTP 응답 녹화/재생
+녹화 모드에서는 실제 응답을 인증 정보를 지운 뒤 카세트 파일에 기록하고,
+재생 모드에서는 네트워크 없이 카세트의 응답을 원래 걸린 시간만큼 기다렸다가 돌려준다.
+실제 응답 형태와 크기(하루 전체 코레일 조회 결과, TAGO 단일 항목 dict 응답 등)로
+벤치마크와 회귀 테스트를 오프라인에서 돌리기 위한 것이다.
+
+- UPSTREAM_CASSETTE_MODE: record / replay (비워 두면 사용하지 않음)
+- UPSTREAM_CASSETTE_DIR (기본 cassettes): 카세트 디렉토리. 업스트림별로 <이름>.jsonl.gz 파일 하나
+- UPSTREAM_CASSETTE_SPEED (기본 1.0): 재생 시 지연 배율 (0이면 기다리지 않음)
+
+카세트는 gzip으로 압축한 JSON Lines이며, 한 줄이 요청/응답 한 쌍이다.
+재생 시에는 (메서드, API 이름, 인증 정보를 뺀 파라미터)가 같은 응답을 녹화 순서대로 돌려주고,
+같은 요청이 없으면 같은 API의 응답을 차례로 돌려준다 (날짜가 다른 조회도 재생할 수 있도록).
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+# 기록하지 않는 요청 파라미터 (API 키, 비밀번호, 로그인 세션 키)
+SCRUB_PARAMS = frozenset({"serviceKey", "txtPwd", "txtMemberNo", "Key"})
+# 응답 JSON에서 가리는 항목 (세션 키, 회원 정보)
+SCRUB_FIELDS = frozenset({
+    "Key", "strMbCrdNo", "strCustNm", "strEmailAdr", "strCpNo", "strCustId",
+})
+SCRUBBED = "***"
+
+
+def _scrub_params(params: Iterable[tuple[str, str]]) -> list[list[str]]:
+    return sorted([k, str(v)] for k, v in params if k not in SCRUB_PARAMS)
+
+
+def _scrub_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            k: SCRUBBED if k in SCRUB_FIELDS else _scrub_value(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_scrub_value(v) for v in value]
+    return value
+
+
+def _scrub_body(text: str) -> str:
+    """JSON 응답이면 회원 정보를 가리고 공백 없이 다시 직렬화한다."""
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return text
+    return json.dumps(_scrub_value(data), ensure_ascii=False, separators=(",", ":"))
+
+
+class Cassette:
+    """
+    업스트림 하나의 카세트 파일.
+
+    녹화는 워커 스레드(코레일)와 이벤트 루프(TAGO)에서 동시에 일어날 수 있으므로
+    파일 쓰기와 재생 위치는 lock으로 보호한다.
+    """
+
+    def __init__(self, path: str, mode: str, speed: float = 1.0):
+        self.path = path
+        self.mode = mode
+        self.speed = speed
+        self._lock = threading.Lock()
+        # 재생용: 요청 키 / 경로 -> 응답 목록, 다음 재생 위치
+        self._by_key: dict[str, list[dict]] = {}
+        self._by_path: dict[str, list[dict]] = {}
+        self._cursors: dict[str, int] = {}
+        if mode == MODE_REPLAY:
+            self._load()
+
+    @staticmethod
+    def _path_key(method: str, url: str) -> str:
+        # 경로의 마지막 부분(API 이름)만 사용한다 (대역 서버 등 다른 주소로 재생할 수 있도록)
+        return f"{method.upper()} {urlsplit(url).path.rstrip('/').rsplit('/', 1)[-1]}"
+
+    @classmethod
+    def _request_key(cls, method: str, url: str, params: list[list[str]]) -> str:
+        return f"{cls._path_key(method, url)}?{urlencode([tuple(p) for p in params])}"
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            logger.warning("[Cassette] 카세트 파일이 없습니다: %s", self.path)
+            return
+        count = 0
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                key = self._request_key(entry["method"], entry["url"], entry["params"])
+                self._by_key.setdefault(key, []).append(entry)
+                self._by_path.setdefault(
+                    self._path_key(entry["method"], entry["url"]), []
+                ).append(entry)
+                count += 1
+        logger.info("[Cassette] 카세트 로드 - %s (%d건)", self.path, count)
+
+    def record(self, method: str, url: str, params: Iterable[tuple[str, str]],
+               status: int, content_type: str, body: str, elapsed: float) -> None:
+        """요청/응답 한 쌍을 인증 정보를 지운 뒤 카세트에 추가한다."""
+        parts = urlsplit(url)
+        entry = {
+            "method": method.upper(),
+            "url": f"{parts.scheme}://{parts.netloc}{parts.path}",
+            "params": _scrub_params(params),
+            "status": status,
+            "content_type": content_type,
+            "elapsed": round(elapsed, 4),
+            "body": _scrub_body(body),
+        }
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # gzip 멤버를 이어 붙인다 (gzip.open으로 한 번에 읽힌다)
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(line)
+
+    def play(self, method: str, url: str, params: Iterable[tuple[str, str]]) -> Optional[dict]:
+        """
+        요청에 해당하는 녹화 응답을 반환한다. 없으면 None.
+
+        같은 키의 응답이 여러 개면 녹화 순서대로 돌려주고, 끝나면 처음부터 반복한다.
+        """
+        candidates = [
+            self._request_key(method, url, _scrub_params(params)),
+            self._path_key(method, url),
+        ]
+        with self._lock:
+            for key, table in zip(candidates, (self._by_key, self._by_path)):
+                entries = table.get(key)
+                if entries:
+                    cursor = self._cursors.get(key, 0)
+                    self._cursors[key] = cursor + 1
+                    return entries[cursor % len(entries)]
+        return None
+
+    def delay(self, entry: dict) -> float:
+        return entry.get("elapsed", 0.0) * self.speed
+
+
+_cassettes: dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(name: str) -> Optional[Cassette]:
+    """업스트림 이름의 카세트를 반환한다. UPSTREAM_CASSETTE_MODE가 비어 있으면 None."""
+    mode = os.getenv("UPSTREAM_CASSETTE_MODE", "").strip().lower()
+    if mode not in (MODE_RECORD, MODE_REPLAY):
+        return None
+    with _cassettes_lock:
+        cassette = _cassettes.get(name)
+        if cassette is None or cassette.mode != mode:
+            path = os.path.join(os.getenv("UPSTREAM_CASSETTE_DIR", "cassettes"), f"{name}.jsonl.gz")
+            cassette = Cassette(
+                path, mode, float(os.getenv("UPSTREAM_CASSETTE_SPEED", "1.0")),
+            )
+            _cassettes[name] = cassette
+            logger.info("[Cassette] %s 카세트 %s 모드 - %s", name, mode, path)
+        return cassette
+
+
+# ──────────────────────────────────────────────
+# httpx (TAGO)
+# ──────────────────────────────────────────────
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """실제 transport로 요청하고 응답을 카세트에 기록하는 httpx transport"""
+
+    def __init__(self, cassette: Cassette, inner: Optional[httpx.AsyncBaseTransport] = None):
+        self._cassette = cassette
+        self._inner = inner or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self._inner.handle_async_request(request)
+        content = await response.aread()
+        self._cassette.record(
+            request.method, str(request.url), request.url.params.multi_items(),
+            response.status_code, response.headers.get("content-type", ""),
+            content.decode("utf-8", errors="replace"), time.perf_counter() - started,
+        )
+        return httpx.Response(
+            response.status_code,
+            headers={"content-type": response.headers.get("content-type", "")},
+            content=content,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """카세트의 응답을 돌려주는 httpx transport (네트워크를 사용하지 않음)"""
+
+    def __init__(self, cassette: Cassette):
+        self._cassette = cassette
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        entry = self._cassette.play(
+            request.method, str(request.url), request.url.params.multi_items(),
+        )
+        if entry is None:
+            raise httpx.ConnectError("카세트에 녹화되지 않은 요청입니다", request=request)
+        delay = self._cassette.delay(entry)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return httpx.Response(
+            entry["status"],
+            headers={"content-type": entry["content_type"]},
+            content=entry["body"].encode("utf-8"),
+            request=request,
+        )
+
+
+def tago_transport(
+    inner: Optional[httpx.AsyncBaseTransport] = None,
+) -> Optional[httpx.AsyncBaseTransport]:
+    """
+    TAGO httpx 클라이언트에 사용할 transport. 카세트를 사용하지 않으면 None (inner 그대로 사용).
+
+    녹화 모드에서는 inner(연결 풀)로 실제 요청을 보내고, 재생 모드에서는 inner를 사용하지 않는다.
+    """
+    cassette = get_cassette("tago")
+    if cassette is None:
+        return None
+    if cassette.mode == MODE_REPLAY:
+        return ReplayTransport(cassette)
+    return RecordingTransport(cassette, inner)
+
+
+# ──────────────────────────────────────────────
+# requests (korail2)
+# ──────────────────────────────────────────────
+
+
+def _prepared_params(request: requests.PreparedRequest) -> list[tuple[str, str]]:
+    """쿼리 문자열과 form 본문의 파라미터"""
+    params = parse_qsl(urlsplit(request.url).query, keep_blank_values=True)
+    body = request.body
+    if body and "application/x-www-form-urlencoded" in request.headers.get("Content-Type", ""):
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        params.extend(parse_qsl(body, keep_blank_values=True))
+    return params
+
+
+class RecordingAdapter(BaseAdapter):
+    """실제 adapter로 요청하고 응답을 카세트에 기록하는 requests adapter"""
+
+    def __init__(self, cassette: Cassette, inner: Optional[BaseAdapter] = None):
+        super().__init__()
+        self._cassette = cassette
+        self._inner = inner or HTTPAdapter()
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        response = self._inner.send(request, **kwargs)
+        self._cassette.record(
+            request.method, request.url, _prepared_params(request),
+            response.status_code, response.headers.get("Content-Type", ""),
+            response.text, time.perf_counter() - started,
+        )
+        return response
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """카세트의 응답을 돌려주는 requests adapter (네트워크를 사용하지 않음)"""
+
+    def __init__(self, cassette: Cassette):
+        super().__init__()
+        self._cassette = cassette
+
+    def send(self, request, **kwargs):
+        entry = self._cassette.play(request.method, request.url, _prepared_params(request))
+        if entry is None:
+            raise requests.ConnectionError(
+                f"카세트에 녹화되지 않은 요청입니다: {request.method} {urlsplit(request.url).path}",
+                request=request,
+            )
+        delay = self._cassette.delay(entry)
+        if delay > 0:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict({"Content-Type": entry["content_type"]})
+        response._content = entry["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def mount_korail(session: requests.Session) -> None:
+    """korail2 세션에 카세트 adapter를 연결한다. 카세트를 사용하지 않으면 아무것도 하지 않는다."""
+    cassette = get_cassette("korail")
+    if cassette is None:
+        return
+    if cassette.mode == MODE_REPLAY:
+        adapter: BaseAdapter = ReplayAdapter(cassette)
+    else:
+        adapter = RecordingAdapter(cassette)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
@@ -0,0 +1,186 @@
+"""
+KorailExecutor - korail2 블로킹 호출 전용 워커 풀
+korail2는 requests 기반의 동기 라이브러리이므로 이벤트 루프에서 직접 호출하면
+느린 코레일 응답 하나가 같은 워커의 모든 요청(TAGO 조회, /health 포함)을 멈춘다.
+이 모듈은 korail2 호출을 크기가 제한된 스레드 풀에서 실행하고,
+대기열 깊이와 대기/실행 시간 메트릭을 수집한다.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorSaturatedError(Exception):
+    """워커 풀 대기열이 가득 차서 작업을 받을 수 없음"""
+
+
+class KorailExecutor:
+    """
+    korail2 호출 전용 bounded 스레드 풀.
+
+    - 워커 수: KORAIL_EXECUTOR_WORKERS (기본 8)
+    - 대기열 상한: KORAIL_EXECUTOR_MAX_QUEUE (기본 64)
+      실행 중이 아닌 대기 작업이 상한을 넘으면 ExecutorSaturatedError를 발생시켜
+      코레일 장애 시 요청이 무한정 쌓이지 않도록 한다.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+    ):
+        self._max_workers = max_workers or int(
+            os.getenv("KORAIL_EXECUTOR_WORKERS", "8")
+        )
+        self._max_queue = (
+            max_queue
+            if max_queue is not None
+            else int(os.getenv("KORAIL_EXECUTOR_MAX_QUEUE", "64"))
+        )
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="korail",
+        )
+
+        # 메트릭 (워커 스레드에서도 갱신되므로 lock으로 보호)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._active = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_run = 0.0
+        self._max_run = 0.0
+
+        logger.info(
+            "[KorailExecutor] 워커 풀 초기화 - workers=%d, max_queue=%d",
+            self._max_workers, self._max_queue,
+        )
+
+    async def run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        블로킹 함수를 워커 풀에서 실행하고 결과를 기다린다.
+
+        Raises:
+            ExecutorSaturatedError: 대기열이 가득 찬 경우
+            func가 발생시킨 예외는 그대로 전파된다.
+        """
+        with self._lock:
+            if self._pending >= self._max_queue:
+                self._rejected += 1
+                logger.warning(
+                    "[KorailExecutor] 대기열 초과로 요청 거부 - pending=%d, active=%d",
+                    self._pending, self._active,
+                )
+                raise ExecutorSaturatedError()
+            self._pending += 1
+            self._submitted += 1
+
+        submitted_at = time.monotonic()
+        call = functools.partial(self._execute, submitted_at, func, args, kwargs)
+        try:
+            future = self._pool.submit(call)
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        # 호출자가 취소되거나 shutdown(cancel_futures=True)로 실행 전에 취소된 작업은
+        # _execute가 실행되지 않으므로 여기서 대기 수를 되돌린다
+        future.add_done_callback(self._release_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def _release_cancelled(self, future: Future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self._pending -= 1
+
+    def _execute(
+        self,
+        submitted_at: float,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+    ) -> Any:
+        """워커 스레드에서 실행되며 대기/실행 시간을 기록한다."""
+        started_at = time.monotonic()
+        wait = started_at - submitted_at
+        with self._lock:
+            self._pending -= 1
+            self._active += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+
+        failed = False
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = time.monotonic() - started_at
+            with self._lock:
+                self._active -= 1
+                self._total_run += elapsed
+                self._max_run = max(self._max_run, elapsed)
+                if failed:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+
+    def stats(self) -> dict:
+        """워커 풀 상태와 누적 메트릭을 반환한다."""
+        with self._lock:
+            finished = self._completed + self._failed
+            started = finished + self._active
+            return {
+                "workers": self._max_workers,
+                "max_queue": self._max_queue,
+                "queue_depth": self._pending,
+                "active": self._active,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "avg_wait_ms": round(self._total_wait / started * 1000, 2) if started else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 2),
+                "avg_run_ms": round(self._total_run / finished * 1000, 2) if finished else 0.0,
+                "max_run_ms": round(self._max_run * 1000, 2),
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """워커 풀을 종료한다."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+        logger.info("[KorailExecutor] 워커 풀 종료")
+
+
+# ──────────────────────────────────────────────
+# 프로세스 공용 워커 풀
+# ──────────────────────────────────────────────
+_korail_executor: Optional[KorailExecutor] = None
+
+
+def get_korail_executor() -> KorailExecutor:
+    """프로세스 공용 KorailExecutor를 반환한다 (최초 호출 시 생성)."""
+    global _korail_executor
+    if _korail_executor is None:
+        _korail_executor = KorailExecutor()
+    return _korail_executor
+
+
+def shutdown_korail_executor() -> None:
+    """프로세스 공용 KorailExecutor를 종료한다."""
+    global _korail_executor
+    if _korail_executor is not None:
+        _korail_executor.shutdown()
+        _korail_executor = None
@@ -0,0 +1,131 @@
+"""
+HTTP 클라이언트 팩토리 - 업스트림별 httpx.AsyncClient 생성과 연결 예열
+연결 풀 크기, keep-alive 유지 시간, HTTP/2, 연결/읽기 타임아웃을 업스트림별 환경변수로 조정한다.
+
+환경변수 (<PREFIX>는 업스트림 이름, 예: TAGO):
+- <PREFIX>_HTTP_MAX_CONNECTIONS (기본 20): 최대 동시 연결 수
+- <PREFIX>_HTTP_MAX_KEEPALIVE (기본 10): 재사용을 위해 열어 두는 유휴 연결 수
+- <PREFIX>_HTTP_KEEPALIVE_EXPIRY_SECONDS (기본 120): 유휴 연결을 닫기까지의 시간
+- <PREFIX>_HTTP_CONNECT_TIMEOUT_SECONDS (기본 3): 연결 타임아웃
+- <PREFIX>_HTTP_READ_TIMEOUT_SECONDS (기본 10): 응답 읽기 타임아웃
+- <PREFIX>_HTTP_POOL_TIMEOUT_SECONDS (기본 10): 연결 풀에서 빈 연결을 기다리는 시간
+- <PREFIX>_HTTP2 (기본 false): HTTP/2 사용 (h2 패키지 필요, https 주소에서만 협상된다)
+- <PREFIX>_HTTP_WARM_CONNECTIONS (기본 2): 시작 시 미리 열어 둘 연결 수 (0이면 예열하지 않음)
+- <PREFIX>_HTTP_KEEP_WARM_SECONDS (기본 0): 예열을 반복하는 주기. 0이면 시작 시 한 번만 예열한다.
+  예열한 연결도 요청이 없으면 keep-alive 유지 시간 뒤에 닫히므로, 한산한 시간 뒤의 첫 요청까지
+  빠르게 하려면 keep-alive 유지 시간보다 짧게 지정한다
+"""
+
+import asyncio
+import logging
+import os
+from typing import Callable, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClientConfig:
+    """업스트림 HTTP 클라이언트 설정 (<prefix>_HTTP_* 환경변수)"""
+
+    def __init__(self, prefix: str):
+        def env(name: str, default: str) -> str:
+            return os.getenv(f"{prefix}_HTTP_{name}", default)
+
+        self.prefix = prefix
+        self.max_connections = int(env("MAX_CONNECTIONS", "20"))
+        self.max_keepalive = int(env("MAX_KEEPALIVE", "10"))
+        self.keepalive_expiry = float(env("KEEPALIVE_EXPIRY_SECONDS", "120"))
+        self.connect_timeout = float(env("CONNECT_TIMEOUT_SECONDS", "3"))
+        self.read_timeout = float(env("READ_TIMEOUT_SECONDS", "10"))
+        self.pool_timeout = float(env("POOL_TIMEOUT_SECONDS", "10"))
+        self.http2 = os.getenv(f"{prefix}_HTTP2", "false").lower() == "true"
+        self.warm_connections = int(env("WARM_CONNECTIONS", "2"))
+        self.keep_warm_interval = float(env("KEEP_WARM_SECONDS", "0"))
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_async_client(
+    config: HttpClientConfig,
+    wrap_transport: Optional[Callable[[httpx.AsyncBaseTransport], Optional[httpx.AsyncBaseTransport]]] = None,
+) -> httpx.AsyncClient:
+    """
+    설정에 맞는 연결 풀로 httpx.AsyncClient를 만든다.
+
+    Args:
+        config: 클라이언트 설정
+        wrap_transport: 연결 풀 transport를 감싸는 함수 (카세트 녹화/재생 등).
+            None을 반환하면 연결 풀 transport를 그대로 사용한다.
+    """
+    http2 = config.http2
+    if http2 and not _http2_available():
+        logger.warning("[HttpClient] h2 패키지가 없어 HTTP/1.1을 사용합니다 (pip install 'httpx[http2]')")
+        http2 = False
+
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        http2=http2,
+    )
+    if wrap_transport is not None:
+        transport = wrap_transport(transport) or transport
+
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            config.read_timeout,
+            connect=config.connect_timeout,
+            pool=config.pool_timeout,
+        ),
+        transport=transport,
+    )
+
+
+async def warm_up(client: httpx.AsyncClient, url: str, connections: int) -> int:
+    """
+    url의 호스트로 연결을 미리 열어 keep-alive 풀에 넣어 둔다.
+
+    HEAD 요청을 동시에 보내 연결 수만큼 TCP(와 TLS) 연결을 맺는다.
+    응답 상태와 관계없이 연결이 맺어지면 성공으로 센다. 실패는 기록만 하고 무시한다.
+
+    Returns:
+        int: 연결에 성공한 요청 수
+    """
+    if connections <= 0:
+        return 0
+
+    async def one() -> bool:
+        try:
+            await client.head(url)
+            return True
+        except httpx.HTTPError as e:
+            logger.warning("[HttpClient] 연결 예열 실패 - %s: %s", url, type(e).__name__)
+            return False
+
+    results = await asyncio.gather(*(one() for _ in range(connections)))
+    warmed = sum(results)
+    logger.info("[HttpClient] 연결 예열 완료 - %s (%d/%d)", url, warmed, connections)
+    return warmed
+
+
+async def keep_warm(client: httpx.AsyncClient, url: str, connections: int, interval: float) -> None:
+    """
+    연결을 예열하고, interval이 있으면 그 주기로 다시 예열한다 (취소될 때까지).
+
+    keep-alive 유지 시간이 지나 닫힌 연결을 다시 열어 두기 위한 것이다.
+    """
+    while True:
+        await warm_up(client, url, connections)
+        if interval <= 0:
+            return
+        await asyncio.sleep(interval)
@@ -4,18 +4,193 @@ KorailService - korail2 라이브러리 래핑 서비스
 세션 캐싱 및 자동 재로그인 기능을 포함한다.
 """
 
+import asyncio
+import importlib
+import itertools
 import logging
+import os
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Optional, Union
 
 from models.schemas import TrainInfo, ReservationResponse, ReservationDetailResponse
+from services.cache_service import TTLCache
+from services.cassette import mount_korail
+from services.executor_service import (
+    ExecutorSaturatedError,
+    KorailExecutor,
+    get_korail_executor,
+)
+from services.metrics import UPSTREAM_IN_FLIGHT, record_upstream
+from services.rate_limiter import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    AccountRateGovernor,
+    RateLimitTimeout,
+    get_account_governor,
+)
+from services.single_flight import SingleFlight
+from services.reservation_store import (
+    ReservationStore,
+    get_reservation_store,
+    owner_key,
+)
+from services.retry_service import (
+    UPSTREAM_RETRY_BASE_DELAY,
+    UPSTREAM_RETRY_MAX,
+    UPSTREAM_RETRY_MAX_DELAY,
+    CircuitOpenError,
+    get_breaker,
+    get_retry_budget,
+    retry_with_backoff,
+)
 
 logger = logging.getLogger(__name__)
 
 # 한국 시간대 (KST = UTC+9)
 KST = timezone(timedelta(hours=9))
 
+# 조회 결과 핸들 -> korail2 Train 객체.
+# 같은 조건의 조회는 single-flight로 여러 세션이 결과를 공유하므로 세션별이 아닌
+# 프로세스 전역 저장소를 사용한다 (Train은 세션 정보 없이 열차 데이터만 가진다).
+_train_handles = TTLCache(
+    max_entries=int(os.getenv("KORAIL_HANDLE_MAX_ENTRIES", "4096")),
+    ttl_seconds=float(os.getenv("KORAIL_HANDLE_TTL_SECONDS", "120")),
+    name="korail-train-handles",
+)
+
+# (출발역, 도착역, 날짜, 시간) -> 열차 매칭 인덱스.
+# 좌석이 풀리는 순간의 반복 예약 시도가 재조회 없이 O(1) 조회로 열차를 찾도록 한다.
+_match_indexes = TTLCache(
+    max_entries=256,
+    ttl_seconds=float(os.getenv("KORAIL_HANDLE_TTL_SECONDS", "120")),
+    name="korail-match-index",
+)
+
+
+# 취소 후 확인 결과
+VERIFY_PENDING = "pending"
+VERIFY_CONFIRMED = "confirmed"
+VERIFY_STILL_EXISTS = "still_exists"
+VERIFY_UNKNOWN = "unknown"
+
+# 계정(소유자 키) -> korail2 예약 목록. 예약/취소 후에는 즉시 무효화한다.
+_reservation_lists = TTLCache(
+    max_entries=1024,
+    ttl_seconds=float(os.getenv("KORAIL_RESERVATIONS_CACHE_SECONDS", "10")),
+    name="korail-reservation-lists",
+)
+# 계정별 무효화 세대. 무효화 전에 시작된 조회 결과가 캐시에 남지 않도록 한다.
+# 세대 값은 프로세스 전체에서 한 번만 쓰이므로, 세션 종료 시 항목을 지워도
+# 진행 중이던 조회가 지워진 뒤의 상태를 같은 세대로 착각하지 않는다.
+_reservation_generations: dict[str, int] = {}
+_generation_seq = itertools.count(1)
+# 같은 계정의 동시 예약 목록 조회를 하나의 korail2 호출로 합친다
+_reservation_flight = SingleFlight("korail-reservations")
+
+# korail2 호출 함수 이름 -> 업스트림 지표의 작업 이름
+_KORAIL_OPERATIONS = {
+    "_create_korail": "login",
+    "search_train_allday": "search",
+    "reserve": "reserve",
+    "reservations": "reservations",
+    "get": "cancel",  # KORAIL_CANCEL은 세션의 GET으로 직접 보낸다
+}
+# 업스트림 실패로 세지 않는 korail2 예외 (정상 응답으로 받은 조회 결과 없음/매진)
+_KORAIL_OUTCOME_ERRORS = frozenset({"NoResultsError", "SoldOutError"})
+
+
+def _timed(func: Callable, elapsed: list[float]) -> Callable:
+    """
+    korail2 호출의 소요 시간을 elapsed에 추가하는 함수를 반환한다.
+
+    워커 스레드에서 실행되므로 대기열 대기 시간은 포함되지 않는다.
+    워커에서 실행되지 않았으면 (대기열 거부) elapsed는 비어 있다.
+    """
+    def call(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed.append(time.perf_counter() - started)
+    return call
+
+
+def korail_client_class() -> Callable:
+    """
+    로그인 시 생성할 korail2.Korail 클래스를 반환한다.
+
+    KORAIL_CLIENT ("모듈:클래스")를 지정하면 그 클래스를 사용한다
+    (부하 테스트용 대역 등). 비어 있으면 korail2.Korail.
+    """
+    spec = os.getenv("KORAIL_CLIENT", "")
+    if not spec:
+        from korail2 import Korail
+        return Korail
+    module_name, _, class_name = spec.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+# 일괄 취소 시 동시에 보내는 KORAIL_CANCEL 요청 수
+KORAIL_CANCEL_CONCURRENCY = int(os.getenv("KORAIL_CANCEL_CONCURRENCY", "3"))
+
+
+def _normalize_train_no(train_no: str) -> str:
+    """열차 번호 비교용 정규화 (공백, 앞자리 0 제거)."""
+    return train_no.strip().lstrip("0")
+
+
+class _TrainMatchIndex:
+    """
+    korail2 조회 결과의 열차 매칭용 해시 인덱스.
+
+    정규화된 열차 번호와 출발 HHmm을 키로 Train 객체를 찾는다.
+    같은 키가 여러 개면 조회 결과 순서상 첫 열차를 사용한다.
+    """
+
+    __slots__ = ("trains", "by_no", "by_hhmm")
+
+    def __init__(self, trains: list):
+        self.trains = trains
+        self.by_no: dict[str, object] = {}
+        self.by_hhmm: dict[str, object] = {}
+        for train in trains:
+            self.by_no.setdefault(
+                _normalize_train_no(getattr(train, "train_no", "")), train,
+            )
+            clean_dep = getattr(train, "dep_time", "").replace(":", "")
+            if len(clean_dep) >= 4:
+                self.by_hhmm.setdefault(clean_dep[:4], train)
+
+    def match(self, train_no: str, time: str):
+        """
+        열차 번호로 찾고, 없으면 출발 시간(HHmm)으로 폴백한다. 없으면 None.
+
+        TAGO API와 korail2의 열차번호 포맷이 다를 수 있으므로
+        출발시간이 일치하는 열차를 폴백으로 사용한다.
+        """
+        train = self.by_no.get(_normalize_train_no(train_no))
+        if train is not None or time == "000000":
+            return train
+
+        # time을 HHmm으로 정규화 (HH:MM → HHmm, HHmmss → HHmm)
+        train = self.by_hhmm.get(time.replace(":", "")[:4])
+        if train is not None:
+            logger.info(
+                "[KorailService] train_no 매칭 실패, dep_time 폴백 매칭 성공 - "
+                "요청 train_no: '%s', 매칭된 korail2 train_no: '%s', dep_time: %s",
+                train_no, getattr(train, "train_no", ""), getattr(train, "dep_time", ""),
+            )
+        return train
+
+    def describe(self) -> str:
+        """매칭 실패 메시지용 열차 목록 (디버깅용)."""
+        return ", ".join(
+            f"{getattr(t, 'train_no', '')}({getattr(t, 'dep_time', '')})"
+            for t in self.trains
+        ) or "없음"
+
 
 class KorailServiceError(Exception):
     """KorailService 기본 예외"""
@@ -83,6 +258,13 @@ class CancellationFailedError(KorailServiceError):
         super().__init__(error="CANCELLATION_FAILED", code="RESERVE_004", detail=detail)
 
 
+class RateLimitExceededError(KorailServiceError):
+    """계정별 호출량 제한 초과"""
+
+    def __init__(self, detail: str = "요청이 너무 많습니다. 잠시 후 다시 시도해주세요"):
+        super().__init__(error="RATE_LIMITED", code="SYSTEM_004", detail=detail)
+
+
 class KorailService:
     """
     korail2 라이브러리를 래핑하는 서비스 클래스.
@@ -92,23 +274,72 @@ class KorailService:
     - 열차 조회
     - 예약 생성 및 조회
     - 세션 캐싱 및 자동 재로그인
+
+    korail2는 동기(requests) 라이브러리이므로 모든 korail2 호출은
+    KorailExecutor 워커 풀에서 실행하여 이벤트 루프를 막지 않는다.
+
+    모든 korail2 호출은 "korail" 서킷 브레이커를 거친다. 네트워크 오류(OSError)가
+    연속되면 서킷이 열려 이후 호출은 대기 없이 KorailServerError로 즉시 실패한다.
+    조회성 호출만 재시도 예산 안에서 full jitter backoff로 재시도한다.
+
+    로그인 후에는 계정별 AccountRateGovernor가 호출량을 제한한다.
+    예산을 넘은 열차 조회는 업스트림 대신 같은 조건의 최근 조회 결과로 응답한다.
     """
 
     # 세션 유효 시간 (기본 30분)
     SESSION_DURATION_MINUTES = 30
 
-    def __init__(self):
+    def __init__(
+        self,
+        executor: Optional[KorailExecutor] = None,
+        store: Optional[ReservationStore] = None,
+    ):
+        self._executor = executor or get_korail_executor()
+        # 예약 상세 정보 저장소 (프로세스 전역, 결제 기한이 지나면 sweeper가 제거)
+        self._store = store or get_reservation_store()
+        # requests 예외는 모두 OSError(IOError) 하위 클래스이다
+        self._breaker = get_breaker("korail", (OSError,))
+        self._retry_budget = get_retry_budget("korail")
         self._korail = None  # korail2.Korail 인스턴스 (lazy init)
         self._session_token: Optional[str] = None
         self._expires_at: Optional[datetime] = None
         self._korail_id: Optional[str] = None
         self._korail_pw: Optional[str] = None
-        self._reservations: dict[str, ReservationDetailResponse] = {}
-        # korail2 Reservation 객체 캐시 (취소 시 재조회 없이 사용)
-        self._raw_reservations: dict[str, object] = {}
+        # 레지스트리에서 제거되어 닫힌 세션 (자동 재로그인하지 않는다)
+        self._closed = False
+        # korail2 Reservation 객체 캐시 (취소 시 재조회 없이 사용, 결제 기한 동안 유지)
+        self._raw_reservations = TTLCache(
+            max_entries=64, ttl_seconds=600, name="korail-raw-reservations",
+        )
+        # 예약 번호 -> 취소 확인 결과 (pending, confirmed, still_exists, unknown)
+        self._cancel_verifications = TTLCache(
+            max_entries=64, ttl_seconds=600, name="korail-cancel-verifications",
+        )
+        # 실행 중인 백그라운드 작업 (GC로 사라지지 않도록 참조 유지)
+        self._background_tasks: set[asyncio.Task] = set()
+        # 계정별 호출량 관리자 (로그인 시 설정, 같은 계정의 세션끼리 공유)
+        self._governor: Optional[AccountRateGovernor] = None
+        # 호출량 초과 시 응답할 최근 열차 조회 결과
+        self._last_search = TTLCache(
+            max_entries=32,
+            ttl_seconds=float(os.getenv("KORAIL_RATE_LAST_RESULT_SECONDS", "300")),
+            name="korail-last-search",
+        )
 
         logger.info("[KorailService] 서비스 초기화 완료")
 
+    @property
+    def session_token(self) -> Optional[str]:
+        """현재 발급된 세션 토큰 (로그인 전이면 None)."""
+        return self._session_token
+
+    @property
+    def _owner(self) -> Optional[str]:
+        """예약 저장소의 소유자 키 (로그인 전이면 None)."""
+        if self._korail_id is None:
+            return None
+        return owner_key(self._korail_id)
+
     def is_session_valid(self) -> bool:
         """세션이 유효한지 확인한다."""
         if self._session_token is None or self._expires_at is None:
@@ -125,11 +356,19 @@ class KorailService:
         if self.is_session_valid():
             return
 
+        # 레지스트리에서 제거된 세션은 토큰이 없어졌으므로 재로그인하지 않는다
+        if self._closed:
+            raise SessionExpiredError()
+
         # 저장된 자격 증명이 있으면 자동 재로그인 시도
         if self._korail_id and self._korail_pw:
             logger.info("[KorailService] 세션 만료 감지 - 자동 재로그인 시도")
+            previous_token = self._session_token
             try:
                 await self.login(self._korail_id, self._korail_pw)
+                # 클라이언트가 가진 토큰(세션 레지스트리 키)은 그대로 유지한다
+                if previous_token:
+                    self._session_token = previous_token
                 logger.info("[KorailService] 자동 재로그인 성공")
                 return
             except Exception as e:
@@ -137,6 +376,198 @@ class KorailService:
 
         raise SessionExpiredError()
 
+    def _invalidate_session(self) -> None:
+        """
+        코레일 세션을 만료 처리한다.
+
+        세션 토큰은 레지스트리 키이므로 지우지 않고 만료 시각만 초기화한다.
+        """
+        self._expires_at = None
+
+    @property
+    def is_closed(self) -> bool:
+        """세션 레지스트리에서 제거되어 닫혔는지 여부"""
+        return self._closed
+
+    def close(self) -> None:
+        """
+        이 세션 전용 HTTP 세션을 닫는다 (세션 레지스트리에서 제거될 때 호출).
+
+        저장된 비밀번호를 지우고 닫힘으로 표시하여, 이 서비스를 참조하는
+        감시 작업 등이 자동 재로그인하지 못하게 한다.
+        """
+        self._closed = True
+        self._korail_pw = None
+        if self._owner is not None:
+            _reservation_generations.pop(self._owner, None)
+        for task in self._background_tasks:
+            task.cancel()
+        session = getattr(self._korail, "_session", None)
+        if session is not None and hasattr(session, "close"):
+            session.close()
+        self._korail = None
+        self._invalidate_session()
+
+    def _save_reservation(self, detail: ReservationDetailResponse) -> None:
+        """예약 상세 정보를 저장소에 기록한다 (로그인 전이면 무시)."""
+        owner = self._owner
+        if owner is not None and detail.reservation_id:
+            self._store.put(owner, detail)
+
+    async def _fetch_reservations(self) -> list:
+        """
+        korail2 예약 목록을 반환한다.
+
+        계정별로 짧은 시간(KORAIL_RESERVATIONS_CACHE_SECONDS) 캐싱하고,
+        같은 계정의 동시 조회는 korail2 호출 하나로 합친다.
+        예약/취소 후에는 _invalidate_reservations()로 즉시 무효화한다.
+        """
+        owner = self._owner
+        if owner is None:
+            return await self._run_read(self._korail.reservations)
+
+        cached = _reservation_lists.get(owner)
+        if cached is not None:
+            logger.info("[KorailService] 예약 목록 캐시 사용")
+            return cached
+
+        generation = _reservation_generations.setdefault(owner, next(_generation_seq))
+
+        async def load() -> list:
+            reservations = await self._run_read(self._korail.reservations)
+            if _reservation_generations.get(owner) == generation:
+                _reservation_lists.set(owner, reservations)
+            return reservations
+
+        return await _reservation_flight.do((owner, generation), load)
+
+    def _invalidate_reservations(self) -> None:
+        """이 계정의 예약 목록 캐시를 무효화한다 (예약/취소 후 호출)."""
+        owner = self._owner
+        if owner is None:
+            return
+        _reservation_lists.pop(owner)
+        _reservation_generations[owner] = next(_generation_seq)
+
+    @staticmethod
+    def _create_korail(korail_class: Callable, korail_id: str, korail_pw: str):
+        """
+        사용자 전용 HTTP 세션을 가진 korail2.Korail 인스턴스를 생성하고 로그인한다.
+
+        korail2.Korail은 requests 세션을 클래스 속성으로 공유하므로,
+        그대로 사용하면 모든 사용자의 쿠키가 섞인다. 인스턴스마다 세션을 분리한다.
+        워커 풀에서 실행된다.
+        """
+        import requests
+        from collections.abc import Mapping
+
+        korail = korail_class(korail_id, korail_pw, auto_login=False)
+        session = requests.Session()
+        headers = getattr(getattr(korail, "_session", None), "headers", None)
+        if isinstance(headers, Mapping):
+            session.headers.update(headers)
+        mount_korail(session)
+        korail._session = session
+        korail.login(korail_id, korail_pw)
+        return korail
+
+    async def _run(
+        self, func: Callable, *args: Any, priority: Optional[str] = None, **kwargs: Any,
+    ) -> Any:
+        """
+        korail2 블로킹 호출을 전용 워커 풀에서 실행한다.
+
+        코레일로 나가는 호출마다(재시도, 재로그인 포함) 계정 호출량 토큰을 사용한다.
+        priority를 주지 않으면 열차 조회는 PRIORITY_LOW, 그 밖의 호출은 PRIORITY_HIGH다.
+
+        Raises:
+            RateLimitExceededError: 계정 호출량을 넘은 경우
+            KorailServerError: 워커 풀 대기열이 가득 찬 경우, 서킷이 열린 경우
+        """
+        operation = _KORAIL_OPERATIONS.get(getattr(func, "__name__", ""), "other")
+        if priority is None:
+            priority = PRIORITY_LOW if operation == "search" else PRIORITY_HIGH
+        await self._acquire_token(priority)
+
+        async def call() -> Any:
+            # 지표에는 워커에서 실제로 실행된 korail2 호출만 기록한다
+            # (서킷/대기열 거부, 대기열 대기 시간, 결과 없음/매진 응답은 업스트림 실패가 아님)
+            elapsed: list[float] = []
+            failed = False
+            UPSTREAM_IN_FLIGHT.inc("korail")
+            try:
+                return await self._executor.run(_timed(func, elapsed), *args, **kwargs)
+            except Exception as e:
+                failed = type(e).__name__ not in _KORAIL_OUTCOME_ERRORS
+                raise
+            finally:
+                UPSTREAM_IN_FLIGHT.dec("korail")
+                if elapsed:
+                    record_upstream("korail", operation, elapsed[0], failed)
+
+        try:
+            return await self._breaker.call(call)
+        except ExecutorSaturatedError:
+            raise KorailServerError(
+                detail="코레일 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요"
+            )
+        except CircuitOpenError as e:
+            raise KorailServerError(
+                detail=(
+                    "코레일 서버 장애로 요청을 잠시 중단했습니다. "
+                    f"{e.retry_after:.0f}초 후 다시 시도해주세요"
+                )
+            )
+
+    async def _run_read(
+        self, func: Callable, *args: Any, priority: Optional[str] = None,
+    ) -> Any:
+        """
+        조회성(멱등) korail2 호출을 실행한다.
+
+        네트워크 오류는 재시도 예산 안에서 full jitter backoff로 재시도한다.
+        재시도도 호출량 토큰을 다시 사용한다.
+        예약/취소처럼 멱등이 아닌 호출에는 사용하지 않는다.
+        """
+        return await retry_with_backoff(
+            self._run,
+            func,
+            *args,
+            priority=priority,
+            base_delay=UPSTREAM_RETRY_BASE_DELAY,
+            max_delay=UPSTREAM_RETRY_MAX_DELAY,
+            max_retries=UPSTREAM_RETRY_MAX,
+            retryable_exceptions=(OSError,),
+            jitter=True,
+            budget=self._retry_budget,
+        )
+
+    async def _acquire_token(self, priority: str) -> None:
+        """
+        korail2 호출 한 번의 토큰을 획득한다 (계정이 정해지기 전이면 무시).
+
+        열차 조회(PRIORITY_LOW)는 기다리지 않고, 예약/취소 등 우선 작업은 최대 대기 시간까지 기다린다.
+
+        Raises:
+            RateLimitExceededError: 조회 예산을 넘었거나 최대 대기 시간 안에 토큰을 얻지 못한 경우
+        """
+        if self._governor is None:
+            return
+        if priority == PRIORITY_LOW:
+            if not self._governor.try_acquire_low():
+                raise RateLimitExceededError()
+            return
+        try:
+            await self._governor.acquire_high()
+        except RateLimitTimeout:
+            raise RateLimitExceededError()
+
+    def rate_limit_stats(self) -> Optional[dict]:
+        """계정별 호출량 관리자 상태 (로그인 전이면 None)."""
+        if self._governor is None:
+            return None
+        return self._governor.stats()
+
     async def login(self, korail_id: str, korail_pw: str) -> dict:
         """
         코레일 계정으로 로그인한다.
@@ -156,9 +587,11 @@ class KorailService:
         logger.info("[KorailService] 로그인 시도 - ID: %s", korail_id[:3] + "***")
 
         try:
-            from korail2 import Korail
-
-            self._korail = Korail(korail_id, korail_pw, auto_login=True)
+            # 로그인도 코레일 호출이므로 계정 호출량에 포함한다
+            self._governor = get_account_governor(korail_id)
+            self._korail = await self._run(
+                self._create_korail, korail_client_class(), korail_id, korail_pw,
+            )
 
             # korail2의 login()은 실패 시 예외를 던지지 않고
             # False를 반환하며 self.logined = False로 설정한다.
@@ -185,7 +618,10 @@ class KorailService:
                 "message": "로그인 성공",
             }
 
-        except (LoginFailedError, AccountBlockedError, KorailServerError):
+        except (
+            LoginFailedError, AccountBlockedError,
+            KorailServerError, RateLimitExceededError,
+        ):
             raise
 
         except ImportError:
@@ -224,9 +660,11 @@ class KorailService:
             SessionExpiredError: 세션 만료
             NoTrainsError: 해당 조건의 열차 없음
             KorailServerError: 코레일 서버 오류
+            RateLimitExceededError: 호출량 초과 (최근 조회 결과도 없는 경우)
         """
         await self._ensure_session()
 
+        search_key = (dep, arr, date, time)
         logger.info(
             "[KorailService] 열차 조회 - %s -> %s, %s %s",
             dep, arr, date, time,
@@ -237,11 +675,17 @@ class KorailService:
                 raise KorailServerError(detail="코레일 세션이 초기화되지 않았습니다")
 
             # korail2의 search_train_allday 호출 (해당 날짜 전체 열차)
-            trains = self._korail.search_train_allday(dep, arr, date, time)
+            trains = await self._run_read(
+                self._korail.search_train_allday, dep, arr, date, time,
+                priority=PRIORITY_LOW,
+            )
 
             if not trains:
                 raise NoTrainsError()
 
+            # 이어지는 예약 요청이 재조회 없이 열차를 찾을 수 있도록 인덱싱
+            _match_indexes.set(search_key, _TrainMatchIndex(trains))
+
             train_list: list[TrainInfo] = []
             for train in trains:
                 try:
@@ -250,6 +694,10 @@ class KorailService:
                     has_gen = getattr(train, "has_general_seat", lambda: False)()
                     has_spe = getattr(train, "has_special_seat", lambda: False)()
 
+                    # 예약 시 재조회 없이 사용할 수 있도록 원본 Train 객체를 핸들로 보관
+                    handle = uuid.uuid4().hex
+                    _train_handles.set(handle, train)
+
                     train_info = TrainInfo(
                         train_no=getattr(train, "train_no", "N/A"),
                         train_type=getattr(train, "train_type_name", "KTX"),
@@ -263,6 +711,7 @@ class KorailService:
                         ),
                         general_seats=has_gen,
                         special_seats=has_spe,
+                        handle=handle,
                     )
                     train_list.append(train_info)
                 except Exception as parse_err:
@@ -278,8 +727,19 @@ class KorailService:
                 sum(1 for t in train_list if t.general_seats or t.special_seats),
             )
 
+            self._last_search.set(search_key, train_list)
             return train_list
 
+        except RateLimitExceededError:
+            last_result = self._last_search.get(search_key)
+            if last_result is None:
+                raise
+            logger.info(
+                "[KorailService] 호출량 초과 - 최근 조회 결과로 응답 (%s -> %s, %s %s)",
+                dep, arr, date, time,
+            )
+            return last_result
+
         except (NoTrainsError, SessionExpiredError, KorailServerError):
             raise
 
@@ -290,14 +750,88 @@ class KorailService:
             if "결과가 없습니다" in str(e) or "no result" in error_msg:
                 raise NoTrainsError()
             elif "session" in error_msg or "만료" in error_msg:
-                self._session_token = None
-                self._expires_at = None
+                self._invalidate_session()
                 raise SessionExpiredError()
             else:
                 raise KorailServerError(
                     detail=f"코레일 서버 연결 실패: {str(e)}"
                 )
 
+    @staticmethod
+    def _train_from_handle(handle: Optional[str], train_no: str):
+        """
+        핸들로 보관된 korail2 Train 객체를 반환한다.
+
+        핸들이 없거나 만료되었거나, 다른 열차의 핸들이거나,
+        조회 당시 좌석이 없던 열차면 None (재조회 필요).
+        korail2.reserve()는 Train 객체의 좌석 정보로 매진 여부를 먼저 판단하므로
+        좌석이 없던 객체로는 예약을 시도할 수 없다.
+        """
+        if not handle:
+            return None
+        train = _train_handles.get(handle)
+        if train is None:
+            logger.info("[KorailService] 열차 핸들 만료 - 재조회")
+            return None
+        if _normalize_train_no(getattr(train, "train_no", "")) != _normalize_train_no(train_no):
+            logger.warning(
+                "[KorailService] 열차 핸들 불일치 - 요청: %s, 핸들: %s",
+                train_no, getattr(train, "train_no", ""),
+            )
+            return None
+        if not getattr(train, "has_seat", lambda: True)():
+            return None
+        logger.info("[KorailService] 열차 핸들 사용 - 재조회 생략 (%s)", train_no)
+        return train
+
+    async def _search_target_train(
+        self, train_no: str, dep: str, arr: str, date: str, time: str
+    ):
+        """
+        예약할 korail2 Train 객체를 찾는다.
+
+        같은 조건의 최근 조회 결과 인덱스가 있고 그 열차에 좌석이 있으면 그대로 사용한다.
+        없으면 검색 조건으로 재조회하여 인덱스를 새로 만든다.
+
+        Raises:
+            NoTrainsError: 해당 열차를 찾을 수 없는 경우
+        """
+        search_key = (dep, arr, date, time)
+        index = _match_indexes.get(search_key)
+        if index is not None:
+            train = index.match(train_no, time)
+            # korail2.reserve()는 Train의 좌석 정보로 매진을 먼저 판단하므로
+            # 좌석이 없던 객체는 재조회하여 최신 정보를 받는다
+            if train is not None and getattr(train, "has_seat", lambda: True)():
+                logger.info("[KorailService] 매칭 인덱스 사용 - 재조회 생략 (%s)", train_no)
+                return train
+
+        # 프론트에서 전달받은 검색 조건으로 열차를 재검색하여
+        # korail2 Train 객체를 얻는다 (reserve에 필요, 예약의 일부이므로 우선 토큰 사용)
+        trains = await self._run_read(
+            self._korail.search_train_allday, dep, arr, date, time,
+            priority=PRIORITY_HIGH,
+        )
+        index = _TrainMatchIndex(trains or [])
+        _match_indexes.set(search_key, index)
+
+        target_train = index.match(train_no, time)
+        if target_train is None:
+            found_info = index.describe()
+            logger.warning(
+                "[KorailService] 열차 매칭 실패 - "
+                "요청 train_no: '%s' (normalized: '%s'), "
+                "요청 time: '%s' (HHmm: '%s'), "
+                "검색된 열차: [%s]",
+                train_no, _normalize_train_no(train_no),
+                time, time.replace(":", "")[:4], found_info,
+            )
+            raise NoTrainsError(
+                detail=f"열차 {train_no}을 찾을 수 없습니다. 검색된 열차: {found_info}"
+            )
+
+        return target_train
+
     async def reserve(
         self,
         train_no: str,
@@ -306,10 +840,14 @@ class KorailService:
         arr: str,
         date: str,
         time: str = "000000",
+        handle: Optional[str] = None,
     ) -> ReservationResponse:
         """
         선택한 열차에 대해 예약을 시도한다.
 
+        handle이 유효하면 조회 시 보관한 korail2 Train 객체로 즉시 예약하고,
+        없거나 만료되었으면 검색 조건으로 열차를 재조회하여 찾는다.
+
         Args:
             train_no: 예약할 열차 번호
             seat_type: 좌석 유형 ("general" 또는 "special")
@@ -317,6 +855,7 @@ class KorailService:
             arr: 도착역
             date: 출발 날짜 (YYYYMMDD)
             time: 출발 시간 (HHmmss)
+            handle: search_trains 결과의 TrainInfo.handle
 
         Returns:
             ReservationResponse: 예약 결과
@@ -325,6 +864,7 @@ class KorailService:
             SessionExpiredError: 세션 만료
             SoldOutError: 매진
             KorailServerError: 코레일 서버 오류
+            RateLimitExceededError: 호출량 초과
         """
         await self._ensure_session()
 
@@ -337,69 +877,19 @@ class KorailService:
             if self._korail is None:
                 raise KorailServerError(detail="코레일 세션이 초기화되지 않았습니다")
 
-            # 프론트에서 전달받은 검색 조건으로 열차를 재검색하여
-            # korail2 Train 객체를 얻는다 (reserve에 필요)
-            trains = self._korail.search_train_allday(
-                dep, arr, date, time,
-            )
-
-            # 검색된 열차 정보 수집 (디버깅용)
-            found_info = []
-            target_train = None
-            normalized_req = train_no.strip().lstrip("0")
-
-            # 1차: train_no 매칭 (정규화 비교)
-            for train in trains:
-                raw_no = getattr(train, "train_no", "")
-                raw_dep = getattr(train, "dep_time", "")
-                found_info.append(f"{raw_no}({raw_dep})")
-                normalized = raw_no.strip().lstrip("0")
-                if normalized == normalized_req:
-                    target_train = train
-                    break
-
-            # 2차: train_no 매칭 실패 시 dep_time으로 폴백 매칭
-            # TAGO API와 korail2의 열차번호 포맷이 다를 수 있으므로
-            # 출발시간이 일치하는 열차를 찾는다
-            if target_train is None and time != "000000":
-                # time을 HHmm으로 정규화 (HH:MM → HHmm, HHmmss → HHmm)
-                clean_time = time.replace(":", "")
-                req_hhmm = clean_time[:4]  # HHmm
-                for train in trains:
-                    raw_dep = getattr(train, "dep_time", "")
-                    # korail2의 dep_time도 정규화
-                    clean_dep = raw_dep.replace(":", "")
-                    dep_hhmm = clean_dep[:4] if len(clean_dep) >= 4 else ""
-                    if dep_hhmm == req_hhmm:
-                        target_train = train
-                        logger.info(
-                            "[KorailService] train_no 매칭 실패, dep_time 폴백 매칭 성공 - "
-                            "요청 train_no: '%s', 매칭된 korail2 train_no: '%s', dep_time: %s",
-                            train_no, getattr(train, "train_no", ""), raw_dep,
-                        )
-                        break
-
+            target_train = self._train_from_handle(handle, train_no)
             if target_train is None:
-                clean_time = time.replace(":", "")
-                req_hhmm = clean_time[:4]
-                logger.warning(
-                    "[KorailService] 열차 매칭 실패 - "
-                    "요청 train_no: '%s' (normalized: '%s'), "
-                    "요청 time: '%s' (HHmm: '%s'), "
-                    "검색된 열차: [%s]",
-                    train_no, normalized_req, time, req_hhmm,
-                    ", ".join(found_info) if found_info else "없음",
-                )
-                raise NoTrainsError(
-                    detail=f"열차 {train_no}을 찾을 수 없습니다. "
-                           f"검색된 열차: {', '.join(found_info) if found_info else '없음'}"
+                target_train = await self._search_target_train(
+                    train_no, dep, arr, date, time,
                 )
 
             # 좌석 유형에 따라 예약 시도
             if seat_type == "special":
-                reservation = self._korail.reserve(target_train, option="SPECIAL_FIRST")
+                reservation = await self._run(
+                    self._korail.reserve, target_train, option="SPECIAL_FIRST",
+                )
             else:
-                reservation = self._korail.reserve(target_train)
+                reservation = await self._run(self._korail.reserve, target_train)
 
             # 예약 성공
             now = datetime.now(KST)
@@ -434,14 +924,15 @@ class KorailService:
 
             # 예약 상세 정보 저장 (조회용)
             payment_deadline = now + timedelta(minutes=10)
-            self._reservations[reservation_id] = ReservationDetailResponse(
+            self._save_reservation(ReservationDetailResponse(
                 reservation_id=reservation_id,
                 status="success",
                 train=train_info,
                 reserved_at=now.isoformat(),
                 payment_deadline=payment_deadline.isoformat(),
-            )
+            ))
 
+            self._invalidate_reservations()
             logger.info(
                 "[KorailService] 예약 성공 - 예약번호: %s", reservation_id
             )
@@ -450,7 +941,7 @@ class KorailService:
 
         except (
             NoTrainsError, SessionExpiredError,
-            SoldOutError, KorailServerError,
+            SoldOutError, KorailServerError, RateLimitExceededError,
         ):
             raise
 
@@ -461,8 +952,7 @@ class KorailService:
             if "매진" in str(e) or "sold out" in error_msg or "no seat" in error_msg:
                 raise SoldOutError()
             elif "session" in error_msg or "만료" in error_msg:
-                self._session_token = None
-                self._expires_at = None
+                self._invalidate_session()
                 raise SessionExpiredError(detail="세션이 만료되었습니다")
             else:
                 raise KorailServerError(
@@ -488,7 +978,7 @@ class KorailService:
             if self._korail is None:
                 raise KorailServerError(detail="코레일 세션이 초기화되지 않았습니다")
 
-            reservations = self._korail.reservations()
+            reservations = await self._fetch_reservations()
 
             # korail2 Reservation 객체를 캐싱 (취소 시 재조회 없이 사용)
             self._raw_reservations.clear()
@@ -500,7 +990,7 @@ class KorailService:
 
                     # 원본 korail2 Reservation 객체 캐싱
                     if rsv_id:
-                        self._raw_reservations[rsv_id] = rsv
+                        self._raw_reservations.set(rsv_id, rsv)
 
                     train_info = TrainInfo(
                         train_no=getattr(rsv, "train_no", "N/A"),
@@ -532,13 +1022,18 @@ class KorailService:
                     )
                     continue
 
+            # 코레일 예약 목록 기준으로 저장소 갱신 (결제/취소된 예약 제거)
+            owner = self._owner
+            if owner is not None:
+                self._store.replace_owner(owner, result)
+
             logger.info(
-                "[KorailService] 예약 목록 조회 완료 - %d건 (캐시: %s)",
-                len(result), list(self._raw_reservations.keys()),
+                "[KorailService] 예약 목록 조회 완료 - %d건 (캐시: %d건)",
+                len(result), len(self._raw_reservations),
             )
             return result
 
-        except (SessionExpiredError, KorailServerError):
+        except (SessionExpiredError, KorailServerError, RateLimitExceededError):
             raise
 
         except Exception as e:
@@ -546,8 +1041,7 @@ class KorailService:
             logger.error("[KorailService] 예약 목록 조회 실패: %s", str(e))
 
             if "session" in error_msg or "만료" in error_msg:
-                self._session_token = None
-                self._expires_at = None
+                self._invalidate_session()
                 raise SessionExpiredError()
             elif "결과가 없습니다" in str(e) or "no result" in error_msg:
                 return []
@@ -574,17 +1068,19 @@ class KorailService:
 
         logger.info("[KorailService] 예약 조회 - ID: %s", reservation_id)
 
-        # 메모리에 저장된 예약 정보 확인
-        if reservation_id in self._reservations:
-            logger.info("[KorailService] 예약 조회 성공 (캐시)")
-            return self._reservations[reservation_id]
+        # 저장소의 예약 정보 확인 (결제 기한이 지나지 않은 예약만)
+        owner = self._owner
+        cached = self._store.get(owner, reservation_id) if owner is not None else None
+        if cached is not None:
+            logger.info("[KorailService] 예약 조회 성공 (저장소)")
+            return cached
 
         # korail2를 통한 예약 조회 시도
         try:
             if self._korail is None:
                 raise KorailServerError(detail="코레일 세션이 초기화되지 않았습니다")
 
-            reservations = self._korail.reservations()
+            reservations = await self._fetch_reservations()
 
             for rsv in reservations:
                 rsv_id = getattr(rsv, "rsv_id", "")
@@ -612,12 +1108,16 @@ class KorailService:
                         payment_deadline=getattr(rsv, "pay_limit_date", None),
                     )
 
+                    self._save_reservation(detail)
                     logger.info("[KorailService] 예약 조회 성공 (korail2)")
                     return detail
 
             raise ReservationNotFoundError()
 
-        except (ReservationNotFoundError, SessionExpiredError, KorailServerError):
+        except (
+            ReservationNotFoundError, SessionExpiredError,
+            KorailServerError, RateLimitExceededError,
+        ):
             raise
 
         except Exception as e:
@@ -632,7 +1132,7 @@ class KorailService:
             reservation_id: 예약 번호
 
         Returns:
-            dict: 취소 결과 (reservation_id, status, message, cancelled_at)
+            dict: 취소 결과 (reservation_id, status, message, cancelled_at, verification)
 
         Raises:
             SessionExpiredError: 세션 만료
@@ -658,9 +1158,9 @@ class KorailService:
                 # 2차: 캐시에 없으면 korail2를 통해 예약 목록 재조회
                 logger.info(
                     "[KorailService] 캐시 미스, korail2 재조회 - "
-                    "캐시 키: %s", list(self._raw_reservations.keys()),
+                    "캐시: %d건", len(self._raw_reservations),
                 )
-                reservations = self._korail.reservations()
+                reservations = await self._fetch_reservations()
 
                 found_ids = []
                 for rsv in reservations:
@@ -689,96 +1189,16 @@ class KorailService:
                 getattr(target_rsv, "rsv_chg_no", "?"),
             )
 
-            import json as _json
-            from korail2.korail2 import KORAIL_CANCEL
-
-            cancel_data = {
-                "Device": self._korail._device,
-                "Version": self._korail._version,
-                "Key": self._korail._key,
-                "txtPnrNo": target_rsv.rsv_id,
-                "txtJrnySqno": target_rsv.journey_no,
-                "txtJrnyCnt": target_rsv.journey_cnt,
-                "hidRsvChgNo": target_rsv.rsv_chg_no,
-            }
-
-            logger.info(
-                "[KorailService] 취소 요청 data: %s", cancel_data,
-            )
-
-            # korail2의 cancel()은 GET + body data를 사용하는데
-            # 코레일 서버가 이를 400 Bad Request로 거부함.
-            # korail2의 reservations()는 GET + params(query string)를 사용하므로
-            # 동일한 방식으로 cancel도 params로 전송한다.
-            try:
-                r = self._korail._session.get(
-                    KORAIL_CANCEL, params=cancel_data,
-                )
-                logger.info(
-                    "[KorailService] 취소 응답 status: %s, "
-                    "본문 (앞 500자): %s",
-                    r.status_code, repr(r.text[:500]),
-                )
-
-                if r.status_code == 200:
-                    # JSON 응답 파싱 시도
-                    try:
-                        decoder = _json.JSONDecoder()
-                        j, _ = decoder.raw_decode(r.text.strip())
-                        str_result = j.get("strResult", "")
-                        h_msg_txt = j.get("h_msg_txt", "")
-                        logger.info(
-                            "[KorailService] 취소 결과 - "
-                            "strResult: '%s', msg: '%s'",
-                            str_result, h_msg_txt,
-                        )
-                        if str_result == "FAIL":
-                            raise CancellationFailedError(
-                                detail=h_msg_txt or "코레일 서버에서 취소 거부"
-                            )
-                    except _json.JSONDecodeError:
-                        # JSON 파싱 실패해도 200이면 성공 간주
-                        logger.warning(
-                            "[KorailService] 취소 응답 JSON 파싱 실패, "
-                            "HTTP 200이므로 성공 간주"
-                        )
-                else:
-                    raise CancellationFailedError(
-                        detail=f"코레일 서버 응답: HTTP {r.status_code}"
-                    )
-            except CancellationFailedError:
-                raise
-            except Exception as req_err:
-                logger.error(
-                    "[KorailService] 취소 요청 실패: %s", str(req_err),
-                )
-                raise CancellationFailedError(
-                    detail=f"예약 취소에 실패했습니다: {str(req_err)}"
-                )
+            await self._send_cancel(target_rsv)
 
             now = datetime.now(KST)
 
             # 캐시에서 제거
-            self._reservations.pop(reservation_id, None)
-            self._raw_reservations.pop(reservation_id, None)
+            self._forget_reservation(reservation_id)
+            self._invalidate_reservations()
 
-            # 취소 확인: 예약 목록 재조회
-            try:
-                remaining = self._korail.reservations()
-                still_exists = any(
-                    getattr(rv, "rsv_id", "") == reservation_id
-                    for rv in remaining
-                )
-                logger.info(
-                    "[KorailService] 취소 후 잔여 예약 %d건, "
-                    "대상 존재: %s",
-                    len(remaining), still_exists,
-                )
-            except Exception as verify_err:
-                logger.warning(
-                    "[KorailService] 취소 확인 조회 실패: %s",
-                    str(verify_err),
-                )
+            # 취소 확인은 백그라운드에서 진행하고 응답은 바로 반환한다
+            self._schedule_verification(reservation_id)
 
             logger.info("[KorailService] 예약 취소 성공 - ID: %s", reservation_id)
 
@@ -787,9 +1207,13 @@ class KorailService:
                 "status": "cancelled",
                 "message": "예약이 취소되었습니다",
                 "cancelled_at": now.isoformat(),
+                "verification": VERIFY_PENDING,
             }
 
-        except (ReservationNotFoundError, SessionExpiredError, KorailServerError):
+        except (
+            ReservationNotFoundError, SessionExpiredError,
+            KorailServerError, RateLimitExceededError,
+        ):
             raise
 
         except CancellationFailedError:
@@ -800,14 +1224,231 @@ class KorailService:
             logger.error("[KorailService] 예약 취소 실패: %s", str(e))
 
             if "session" in error_msg or "만료" in error_msg:
-                self._session_token = None
-                self._expires_at = None
+                self._invalidate_session()
                 raise SessionExpiredError()
             else:
                 raise CancellationFailedError(
                     detail=f"예약 취소에 실패했습니다: {str(e)}"
                 )
 
+    async def cancel_reservations(
+        self, reservation_ids: list[str],
+    ) -> list[tuple[str, Union[dict, KorailServiceError]]]:
+        """
+        여러 예약을 한 번에 취소한다.
+
+        캐시에 없는 예약 번호는 예약 목록 한 번의 조회로 찾고,
+        KORAIL_CANCEL 요청은 KORAIL_CANCEL_CONCURRENCY개까지 동시에 보낸다.
+        취소 확인은 단건 취소와 같이 백그라운드에서 진행한다.
+
+        Args:
+            reservation_ids: 예약 번호 목록 (중복은 한 번만 취소)
+
+        Returns:
+            (예약 번호, 결과) 목록. 결과는 성공 시 cancel_reservation()과 같은 dict,
+            실패 시 ReservationNotFoundError / CancellationFailedError /
+            RateLimitExceededError / KorailServerError 중 하나
+
+        Raises:
+            SessionExpiredError: 세션 만료
+            KorailServerError: 예약 목록 조회 실패
+        """
+        await self._ensure_session()
+
+        if self._korail is None:
+            raise KorailServerError(detail="코레일 세션이 초기화되지 않았습니다")
+
+        ids = list(dict.fromkeys(reservation_ids))
+        logger.info("[KorailService] 일괄 취소 시도 - %d건", len(ids))
+
+        targets = {rid: self._raw_reservations.get(rid) for rid in ids}
+        if any(rsv is None for rsv in targets.values()):
+            try:
+                reservations = await self._fetch_reservations()
+            except (SessionExpiredError, KorailServerError, RateLimitExceededError):
+                raise
+            except Exception as e:
+                error_msg = str(e).lower()
+                if "결과가 없습니다" in str(e) or "no result" in error_msg:
+                    reservations = []
+                elif "session" in error_msg or "만료" in error_msg:
+                    self._invalidate_session()
+                    raise SessionExpiredError()
+                else:
+                    raise KorailServerError(
+                        detail=f"코레일 서버 연결 실패: {str(e)}"
+                    )
+            by_id = {getattr(rsv, "rsv_id", None): rsv for rsv in reservations}
+            for rid, rsv in targets.items():
+                if rsv is None:
+                    targets[rid] = by_id.get(rid)
+
+        semaphore = asyncio.Semaphore(KORAIL_CANCEL_CONCURRENCY)
+
+        async def cancel_one(rid: str) -> Union[dict, KorailServiceError]:
+            target_rsv = targets[rid]
+            if target_rsv is None:
+                return ReservationNotFoundError(
+                    detail=f"예약 {rid}을 찾을 수 없습니다. "
+                           f"예약이 만료되었거나 이미 취소되었을 수 있습니다."
+                )
+            async with semaphore:
+                try:
+                    await self._send_cancel(target_rsv)
+                except KorailServiceError as e:
+                    return e
+            self._forget_reservation(rid)
+            return {
+                "reservation_id": rid,
+                "status": "cancelled",
+                "message": "예약이 취소되었습니다",
+                "cancelled_at": datetime.now(KST).isoformat(),
+                "verification": VERIFY_PENDING,
+            }
+
+        outcomes = await asyncio.gather(*(cancel_one(rid) for rid in ids))
+        cancelled = [rid for rid, r in zip(ids, outcomes) if isinstance(r, dict)]
+
+        if cancelled:
+            # 예약 목록 캐시는 한 번만 무효화하고, 확인 조회는 single-flight로 합쳐진다
+            self._invalidate_reservations()
+            for rid in cancelled:
+                self._schedule_verification(rid)
+
+        logger.info(
+            "[KorailService] 일괄 취소 완료 - 성공 %d건 / 전체 %d건",
+            len(cancelled), len(ids),
+        )
+        return list(zip(ids, outcomes))
+
+    async def _send_cancel(self, target_rsv) -> None:
+        """
+        korail2 예약 객체 하나에 대해 KORAIL_CANCEL 요청을 보낸다.
+
+        Raises:
+            CancellationFailedError: 코레일 서버가 취소를 거부했거나 요청이 실패한 경우
+            KorailServerError: 코레일 서버 장애 (회로 차단 포함)
+        """
+        import json as _json
+        from korail2.korail2 import KORAIL_CANCEL
+
+        cancel_data = {
+            "Device": self._korail._device,
+            "Version": self._korail._version,
+            "Key": self._korail._key,
+            "txtPnrNo": target_rsv.rsv_id,
+            "txtJrnySqno": target_rsv.journey_no,
+            "txtJrnyCnt": target_rsv.journey_cnt,
+            "hidRsvChgNo": target_rsv.rsv_chg_no,
+        }
+
+        logger.info(
+            "[KorailService] 취소 요청 data: %s", cancel_data,
+        )
+
+        # korail2의 cancel()은 GET + body data를 사용하는데
+        # 코레일 서버가 이를 400 Bad Request로 거부함.
+        # korail2의 reservations()는 GET + params(query string)를 사용하므로
+        # 동일한 방식으로 cancel도 params로 전송한다.
+        try:
+            r = await self._run(
+                self._korail._session.get, KORAIL_CANCEL, params=cancel_data,
+            )
+            logger.info(
+                "[KorailService] 취소 응답 status: %s, "
+                "본문 (앞 500자): %s",
+                r.status_code, repr(r.text[:500]),
+            )
+
+            if r.status_code == 200:
+                # JSON 응답 파싱 시도
+                try:
+                    decoder = _json.JSONDecoder()
+                    j, _ = decoder.raw_decode(r.text.strip())
+                    str_result = j.get("strResult", "")
+                    h_msg_txt = j.get("h_msg_txt", "")
+                    logger.info(
+                        "[KorailService] 취소 결과 - "
+                        "strResult: '%s', msg: '%s'",
+                        str_result, h_msg_txt,
+                    )
+                    if str_result == "FAIL":
+                        raise CancellationFailedError(
+                            detail=h_msg_txt or "코레일 서버에서 취소 거부"
+                        )
+                except _json.JSONDecodeError:
+                    # JSON 파싱 실패해도 200이면 성공 간주
+                    logger.warning(
+                        "[KorailService] 취소 응답 JSON 파싱 실패, "
+                        "HTTP 200이므로 성공 간주"
+                    )
+            else:
+                raise CancellationFailedError(
+                    detail=f"코레일 서버 응답: HTTP {r.status_code}"
+                )
+        except (CancellationFailedError, KorailServerError, RateLimitExceededError):
+            raise
+        except Exception as req_err:
+            logger.error(
+                "[KorailService] 취소 요청 실패: %s", str(req_err),
+            )
+            raise CancellationFailedError(
+                detail=f"예약 취소에 실패했습니다: {str(req_err)}"
+            )
+
+    def _forget_reservation(self, reservation_id: str) -> None:
+        """취소된 예약을 저장소와 korail2 객체 캐시에서 제거한다."""
+        if self._owner is not None:
+            self._store.delete(self._owner, reservation_id)
+        self._raw_reservations.pop(reservation_id)
+
+    def _schedule_verification(self, reservation_id: str) -> None:
+        """취소 확인 작업을 백그라운드로 시작한다 (예약 목록 캐시 무효화 후 호출)."""
+        self._cancel_verifications.set(reservation_id, VERIFY_PENDING)
+        task = asyncio.create_task(self._verify_cancellation(reservation_id))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _verify_cancellation(self, reservation_id: str) -> None:
+        """
+        취소 후 예약 목록을 재조회하여 예약이 사라졌는지 확인하고 결과를 기록한다.
+
+        예약 목록 캐시는 취소 시 무효화되었으므로 최신 목록을 조회하며,
+        조회 결과는 이후 예약 목록 화면에서 재사용된다.
+        """
+        try:
+            remaining = await self._fetch_reservations()
+            still_exists = any(
+                getattr(rv, "rsv_id", "") == reservation_id
+                for rv in remaining
+            )
+            result = VERIFY_STILL_EXISTS if still_exists else VERIFY_CONFIRMED
+            logger.info(
+                "[KorailService] 취소 확인 - ID: %s, 잔여 예약 %d건, 대상 존재: %s",
+                reservation_id, len(remaining), still_exists,
+            )
+        except Exception as verify_err:
+            # korail2는 예약이 하나도 없으면 예외를 던진다
+            if "결과가 없습니다" in str(verify_err) or "no result" in str(verify_err).lower():
+                result = VERIFY_CONFIRMED
+            else:
+                result = VERIFY_UNKNOWN
+                logger.warning(
+                    "[KorailService] 취소 확인 조회 실패: %s",
+                    str(verify_err),
+                )
+        self._cancel_verifications.set(reservation_id, result)
+
+    def get_cancel_verification(self, reservation_id: str) -> Optional[str]:
+        """
+        취소 확인 결과를 반환한다. 이 세션에서 취소한 예약이 아니면 None.
+
+        Returns:
+            "pending" (확인 중), "confirmed" (취소 확인), "still_exists" (예약이 남아 있음),
+            "unknown" (확인 조회 실패) 중 하나
+        """
+        return self._cancel_verifications.get(reservation_id)
+
     @staticmethod
     def _format_time(time_str: str) -> str:
         """
@@ -0,0 +1,447 @@
+"""
+KorailSimulator - korail2.Korail 대역 시뮬레이터 (좌석 재고 모델)
+열차별 좌석 재고가 시간에 따라 변하는 가상 코레일을 제공한다.
+KORAIL_CLIENT=services.korail_simulator:SimulatedKorail 로 지정하면
+KorailService.login()이 korail2.Korail 대신 이 클래스를 생성한다.
+
+좌석 변동(취소표, 다른 사용자의 예약)은 시드와 열차별로 고정된 이벤트 시퀀스라서,
+같은 시드로 같은 시각에 조회/예약하면 항상 같은 결과가 나온다.
+예약 번호는 예약 순서, 날짜는 시뮬레이션 시각에서 만들므로 호출 기록도 실행마다 같다.
+감시 주기나 예약 지연 시간을 바꾼 빌드끼리 같은 예매 경쟁을 재현해 비교할 수 있다.
+부하 테스트(benchmarks.load_test)도 이 시뮬레이터를 korail2 대역으로 사용한다.
+
+- KORAIL_SIM_SEED (기본 0): 좌석 변동 시드
+- KORAIL_SIM_SPEED (기본 1.0): 실제 1초당 진행하는 시뮬레이션 시간 (초)
+- KORAIL_SIM_START (YYYYMMDDHHMMSS): 시뮬레이션 시각 0의 날짜/시각 (KST).
+  비워 두면 시작 시점의 실제 시각 (다른 날 실행한 기록과 비교하려면 지정한다)
+- KORAIL_SIM_TRAINS_PER_DAY (기본 60): 구간별 하루 열차 수
+- KORAIL_SIM_SOLD_OUT_RATIO (기본 0.7): 시작 시점에 매진인 좌석 등급 비율
+- KORAIL_SIM_EVENTS_PER_MINUTE (기본 2.0): 열차별 좌석 변동 빈도
+- KORAIL_SIM_RELEASE_RATIO (기본 0.5): 좌석 변동 중 취소표(좌석 증가)의 비율
+- KORAIL_SIM_LATENCY_MS (기본 0): 코레일 호출 1회당 지연 시간
+- KORAIL_SIM_ERROR_RATE (기본 0): 코레일 호출이 연결 오류로 실패할 확률 (시드로 고정)
+- KORAIL_SIM_PAY_WINDOW_SECONDS (기본 600): 결제 기한 (시뮬레이션 시간)
+- KORAIL_SIM_JOURNAL: 호출 기록(JSON Lines)을 남길 파일 경로. 비워 두면 메모리에만 보관
+"""
+
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from korail2.korail2 import KORAIL_CANCEL, NoResultsError, SoldOutError
+
+logger = logging.getLogger(__name__)
+
+KST = timezone(timedelta(hours=9))
+
+# korail2 search_train 한 번의 응답 열차 수
+PAGE_SIZE = 10
+# korail2 Train의 좌석 코드
+SEAT_AVAILABLE = "11"
+SEAT_SOLD_OUT = "13"
+# 좌석 등급별 최대 잔여석 (취소표가 쌓여도 이 이상 늘지 않는다)
+CAPACITY = {"general": 8, "special": 3}
+
+
+def daily_timetable(date: str, count: int) -> list[tuple[str, str, str]]:
+    """하루 열차 목록 (열차 번호, 출발 HHMMSS, 도착 HHMMSS). 05:00부터 균등 간격."""
+    start = datetime.strptime(date + "050000", "%Y%m%d%H%M%S")
+    step = timedelta(minutes=max(1, (18 * 60) // max(count, 1)))
+    trains = []
+    for i in range(count):
+        dep = start + step * i
+        arr = dep + timedelta(hours=2, minutes=40)
+        trains.append((f"{101 + i:03d}", dep.strftime("%H%M%S"), arr.strftime("%H%M%S")))
+    return trains
+
+
+class _TrainInventory:
+    """
+    열차 하나의 좌석 등급별 잔여석.
+
+    좌석 변동 이벤트는 열차별 시드로 만든 난수열에서 시간 순으로 생성되므로,
+    조회 순서와 관계없이 같은 시각의 잔여석은 항상 같다 (직접 예약/취소분 제외).
+    """
+
+    def __init__(self, seed: str, events_per_minute: float, release_ratio: float,
+                 sold_out_ratio: float):
+        self._rng = random.Random(seed)
+        self._rate = events_per_minute / 60
+        self._release_ratio = release_ratio
+        self.available = {
+            grade: 0 if self._rng.random() < sold_out_ratio else self._rng.randint(1, cap)
+            for grade, cap in CAPACITY.items()
+        }
+        self._next_event = self._draw_interval()
+
+    def _draw_interval(self) -> float:
+        return self._rng.expovariate(self._rate) if self._rate > 0 else float("inf")
+
+    def advance(self, now: float) -> None:
+        """now까지의 좌석 변동을 반영한다."""
+        while self._next_event <= now:
+            grade = "general" if self._rng.random() < 0.8 else "special"
+            delta = 1 if self._rng.random() < self._release_ratio else -1
+            self.available[grade] = min(CAPACITY[grade], max(0, self.available[grade] + delta))
+            self._next_event += self._draw_interval()
+
+
+class SeatWorld:
+    """
+    시뮬레이터의 공유 상태 (모든 세션이 같은 좌석 재고와 계정별 예약을 본다).
+
+    시각은 생성 시점부터 흐른 시뮬레이션 시간(초)이며, clock을 주면 그 값을 사용한다.
+    날짜/시각이 필요한 곳(예약일, 결제 기한, 기본 조회일)은 start에 시뮬레이션 시간을 더해 만든다.
+    워커 스레드에서 동시에 호출되므로 상태 변경은 lock으로 직렬화한다.
+    """
+
+    def __init__(self, seed: Optional[int] = None, clock: Optional[Callable[[], float]] = None,
+                 start: Optional[datetime] = None):
+        self.seed = seed if seed is not None else int(os.getenv("KORAIL_SIM_SEED", "0"))
+        speed = float(os.getenv("KORAIL_SIM_SPEED", "1.0"))
+        started = time.monotonic()
+        self._clock = clock or (lambda: (time.monotonic() - started) * speed)
+        start_env = os.getenv("KORAIL_SIM_START", "")
+        if start is None and start_env:
+            start = datetime.strptime(start_env, "%Y%m%d%H%M%S").replace(tzinfo=KST)
+        self.start = start or datetime.now(KST).replace(microsecond=0)
+        self.trains_per_day = int(os.getenv("KORAIL_SIM_TRAINS_PER_DAY", "60"))
+        self.sold_out_ratio = float(os.getenv("KORAIL_SIM_SOLD_OUT_RATIO", "0.7"))
+        self.events_per_minute = float(os.getenv("KORAIL_SIM_EVENTS_PER_MINUTE", "2.0"))
+        self.release_ratio = float(os.getenv("KORAIL_SIM_RELEASE_RATIO", "0.5"))
+        self.latency = float(os.getenv("KORAIL_SIM_LATENCY_MS", "0")) / 1000
+        self.error_rate = float(os.getenv("KORAIL_SIM_ERROR_RATE", "0"))
+        self._error_rng = random.Random(f"{self.seed}:errors")
+        self._reservation_seq = 0
+        self.pay_window = float(os.getenv("KORAIL_SIM_PAY_WINDOW_SECONDS", "600"))
+        self._journal_path = os.getenv("KORAIL_SIM_JOURNAL", "")
+        self.journal: deque = deque(maxlen=10000)
+        self.lock = threading.RLock()
+        self._inventories: dict[tuple, _TrainInventory] = {}
+        # 계정 ID -> 예약 목록
+        self.reservations: dict[str, list["SimulatedReservation"]] = {}
+
+    def now(self) -> float:
+        return self._clock()
+
+    def datetime_at(self, seconds: float) -> datetime:
+        """시뮬레이션 시간(초)에 해당하는 날짜/시각 (KST)"""
+        return self.start + timedelta(seconds=seconds)
+
+    def timetable(self, date: str) -> list[tuple[str, str, str]]:
+        """하루 열차 목록 (열차 번호, 출발 HHMMSS, 도착 HHMMSS)."""
+        return daily_timetable(date, self.trains_per_day)
+
+    def fails(self) -> bool:
+        """이번 호출을 연결 오류로 실패시킬지 정한다 (시드로 고정된 난수열)."""
+        if self.error_rate <= 0:
+            return False
+        with self.lock:
+            return self._error_rng.random() < self.error_rate
+
+    def next_reservation_id(self) -> str:
+        """예약 순서로 만든 예약 번호. lock을 잡은 상태에서 호출한다."""
+        self._reservation_seq += 1
+        return f"{self.seed % 1000:03d}{self._reservation_seq:09d}"
+
+    def inventory(self, dep: str, arr: str, date: str, train_no: str) -> _TrainInventory:
+        """열차의 잔여석 (현재 시각까지 변동 반영). lock을 잡은 상태에서 호출한다."""
+        key = (dep, arr, date, train_no)
+        inventory = self._inventories.get(key)
+        if inventory is None:
+            inventory = self._inventories[key] = _TrainInventory(
+                f"{self.seed}:{dep}:{arr}:{date}:{train_no}",
+                self.events_per_minute, self.release_ratio, self.sold_out_ratio,
+            )
+        inventory.advance(self.now())
+        return inventory
+
+    def expire_unpaid(self, account: str) -> None:
+        """결제 기한이 지난 예약을 제거하고 좌석을 되돌린다. lock을 잡은 상태에서 호출한다."""
+        now = self.now()
+        kept = []
+        for rsv in self.reservations.get(account, []):
+            if rsv.deadline <= now:
+                self.release(rsv)
+                self.record("expire", account=account, rsv_id=rsv.rsv_id)
+            else:
+                kept.append(rsv)
+        self.reservations[account] = kept
+
+    def release(self, rsv: "SimulatedReservation") -> None:
+        inventory = self.inventory(
+            rsv.dep_station_name, rsv.arr_station_name, rsv.dep_date, rsv.train_no,
+        )
+        inventory.available[rsv.grade] = min(
+            CAPACITY[rsv.grade], inventory.available[rsv.grade] + 1,
+        )
+
+    def record(self, op: str, **fields) -> None:
+        """호출 기록을 남긴다 (같은 시드의 실행끼리 비교용)."""
+        entry = {"t": round(self.now(), 3), "op": op, **fields}
+        self.journal.append(entry)
+        if self._journal_path:
+            with open(self._journal_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+_world: Optional[SeatWorld] = None
+_world_lock = threading.Lock()
+
+
+def get_world() -> SeatWorld:
+    """프로세스 전역 시뮬레이터 상태를 반환한다 (처음 호출 시 환경변수로 생성)."""
+    global _world
+    with _world_lock:
+        if _world is None:
+            _world = SeatWorld()
+            logger.info("[KorailSimulator] 시뮬레이터 시작 - seed=%d", _world.seed)
+        return _world
+
+
+def reset_world(seed: Optional[int] = None, clock: Optional[Callable[[], float]] = None,
+                start: Optional[datetime] = None) -> SeatWorld:
+    """시뮬레이터 상태를 새로 만든다 (재현 실행, 테스트용)."""
+    global _world
+    with _world_lock:
+        _world = SeatWorld(seed=seed, clock=clock, start=start)
+        return _world
+
+
+class SimulatedTrain:
+    """korail2 Train 대역 (조회 시점의 좌석 코드를 가진다)"""
+
+    def __init__(self, dep: str, arr: str, date: str, train_no: str, dep_time: str,
+                 arr_time: str, inventory: _TrainInventory):
+        self.train_type = "100"
+        self.train_type_name = "KTX"
+        self.train_group = "100"
+        self.train_no = train_no
+        self.dep_station_name = dep
+        self.arr_station_name = arr
+        self.dep_date = date
+        self.dep_time = dep_time
+        self.arr_date = date
+        self.arr_time = arr_time
+        self.run_date = date
+        self.reserve_possible = "Y"
+        self.general_seat = SEAT_AVAILABLE if inventory.available["general"] else SEAT_SOLD_OUT
+        self.special_seat = SEAT_AVAILABLE if inventory.available["special"] else SEAT_SOLD_OUT
+        self.wait_reserve_flag = 0
+
+    def has_general_seat(self) -> bool:
+        return self.general_seat == SEAT_AVAILABLE
+
+    def has_special_seat(self) -> bool:
+        return self.special_seat == SEAT_AVAILABLE
+
+    def has_seat(self) -> bool:
+        return self.has_general_seat() or self.has_special_seat()
+
+    def has_general_waiting_list(self) -> bool:
+        return False
+
+
+class SimulatedReservation:
+    """korail2 Reservation 대역"""
+
+    def __init__(self, rsv_id: str, train: SimulatedTrain, grade: str, deadline: float,
+                 reserved_at: datetime, pay_limit: datetime):
+        self.rsv_id = rsv_id
+        self.journey_no = "0001"
+        self.journey_cnt = "01"
+        self.rsv_chg_no = "00000"
+        self.train_no = train.train_no
+        self.train_type_name = train.train_type_name
+        self.dep_station_name = train.dep_station_name
+        self.arr_station_name = train.arr_station_name
+        self.dep_date = train.dep_date
+        self.dep_time = train.dep_time
+        self.arr_time = train.arr_time
+        self.rsv_date = reserved_at.strftime("%Y%m%d")
+        self.pay_limit_date = pay_limit.isoformat()
+        self.seat_no_count = 1
+        self.grade = grade
+        self.deadline = deadline
+
+
+class _Response:
+    def __init__(self, status_code: int, payload: dict):
+        self.status_code = status_code
+        self.text = json.dumps(payload, ensure_ascii=False)
+
+
+class _SimulatedSession:
+    """KORAIL_CANCEL GET 요청을 처리하는 requests.Session 대역"""
+
+    def __init__(self, korail: "SimulatedKorail"):
+        self._korail = korail
+        self.headers: dict = {}
+
+    def get(self, url: str, params: Optional[dict] = None, **kwargs) -> _Response:
+        if url != KORAIL_CANCEL:
+            return _Response(404, {})
+        return self._korail._cancel((params or {}).get("txtPnrNo", ""))
+
+    def close(self) -> None:
+        pass
+
+
+class SimulatedKorail:
+    """
+    korail2.Korail 대역.
+
+    search_train은 korail2처럼 출발 시각 이후 열차를 PAGE_SIZE개씩 반환하고,
+    search_train_allday는 korail2와 같은 방식으로 페이지를 넘기며 전체를 모은다.
+    reserve는 korail2처럼 Train의 좌석 코드로 먼저 확인한 뒤, 현재 잔여석으로 다시 확인한다.
+
+    KorailService._create_korail은 _session을 requests.Session으로 교체한 뒤 login()을
+    호출하므로, login()에서 취소 요청을 처리하는 대역 세션으로 되돌린다.
+    """
+
+    def __init__(self, korail_id: str = "", korail_pw: str = "", auto_login: bool = True,
+                 world: Optional[SeatWorld] = None):
+        self._world = world or get_world()
+        self._device = "AD"
+        self._version = "190617001"
+        self._key = "korail-simulator"
+        self._session = _SimulatedSession(self)
+        self.korail_id = korail_id
+        self.logined = False
+        if auto_login:
+            self.login(korail_id, korail_pw)
+
+    def _call(self) -> None:
+        if self._world.latency:
+            time.sleep(self._world.latency)
+        if self._world.fails():
+            raise ConnectionError("korail simulator upstream error")
+
+    def login(self, korail_id: Optional[str] = None, korail_pw: Optional[str] = None) -> bool:
+        self._call()
+        self.korail_id = korail_id or self.korail_id
+        self._session = _SimulatedSession(self)
+        self.logined = True
+        self._world.record("login", account=self.korail_id)
+        return True
+
+    def search_train(self, dep, arr, date=None, time=None, train_type="109", passengers=None,
+                     include_no_seats=False, include_waiting_list=False):
+        self._call()
+        world = self._world
+        date = date or world.datetime_at(world.now()).strftime("%Y%m%d")
+        time = time or "000000"
+        with world.lock:
+            trains = [
+                SimulatedTrain(
+                    dep, arr, date, no, dep_time, arr_time,
+                    world.inventory(dep, arr, date, no),
+                )
+                for no, dep_time, arr_time in world.timetable(date)
+                if dep_time >= time
+            ][:PAGE_SIZE]
+            world.record(
+                "search", account=self.korail_id, date=date, time=time,
+                seats=[t.train_no for t in trains if t.has_seat()],
+            )
+        if not include_no_seats:
+            trains = [t for t in trains if t.has_seat()]
+        if not trains:
+            raise NoResultsError()
+        return trains
+
+    def search_train_allday(self, dep, arr, date=None, time=None, train_type="109",
+                            passengers=None, include_no_seats=False):
+        all_trains: list[SimulatedTrain] = []
+        dep_time = time
+        for _ in range(15):
+            try:
+                trains = self.search_train(
+                    dep, arr, date, dep_time, train_type, passengers, True,
+                )
+            except NoResultsError:
+                break
+            all_trains.extend(trains)
+            last = datetime.strptime(all_trains[-1].dep_time, "%H%M%S")
+            if last.hour == 23 and last.minute == 59:
+                break
+            dep_time = (last + timedelta(minutes=1)).strftime("%H%M%S")
+
+        if not include_no_seats:
+            all_trains = [t for t in all_trains if t.has_seat()]
+        if not all_trains:
+            raise NoResultsError()
+        return all_trains
+
+    def reserve(self, train: SimulatedTrain, passengers=None, option="GENERAL_FIRST",
+                try_waiting=False):
+        # korail2와 같이 조회 당시의 좌석 코드로 먼저 등급을 정한다
+        if not train.has_seat():
+            raise SoldOutError()
+        if option == "GENERAL_ONLY":
+            grades = ["general"] if train.has_general_seat() else []
+        elif option == "SPECIAL_ONLY":
+            grades = ["special"] if train.has_special_seat() else []
+        elif option == "SPECIAL_FIRST":
+            grades = ["special" if train.has_special_seat() else "general"]
+        else:
+            grades = ["general" if train.has_general_seat() else "special"]
+        if not grades:
+            raise SoldOutError()
+
+        self._call()
+        world = self._world
+        with world.lock:
+            inventory = world.inventory(
+                train.dep_station_name, train.arr_station_name, train.dep_date, train.train_no,
+            )
+            grade = grades[0]
+            if inventory.available[grade] <= 0:
+                world.record(
+                    "reserve", account=self.korail_id, train_no=train.train_no,
+                    grade=grade, result="sold_out",
+                )
+                raise SoldOutError()
+            inventory.available[grade] -= 1
+            now = world.now()
+            reservation = SimulatedReservation(
+                world.next_reservation_id(), train, grade, now + world.pay_window,
+                world.datetime_at(now), world.datetime_at(now + world.pay_window),
+            )
+            world.reservations.setdefault(self.korail_id, []).append(reservation)
+            world.record(
+                "reserve", account=self.korail_id, train_no=train.train_no,
+                grade=grade, result="success", rsv_id=reservation.rsv_id,
+            )
+        return reservation
+
+    def reservations(self):
+        self._call()
+        world = self._world
+        with world.lock:
+            world.expire_unpaid(self.korail_id)
+            reservations = list(world.reservations.get(self.korail_id, []))
+        if not reservations:
+            raise NoResultsError()
+        return reservations
+
+    def _cancel(self, rsv_id: str) -> _Response:
+        self._call()
+        world = self._world
+        with world.lock:
+            world.expire_unpaid(self.korail_id)
+            reservations = world.reservations.get(self.korail_id, [])
+            target = next((r for r in reservations if r.rsv_id == rsv_id), None)
+            if target is None:
+                world.record("cancel", account=self.korail_id, rsv_id=rsv_id, result="not_found")
+                return _Response(200, {"strResult": "FAIL", "h_msg_txt": "예약 내역이 없습니다"})
+            reservations.remove(target)
+            world.release(target)
+            world.record("cancel", account=self.korail_id, rsv_id=rsv_id, result="success")
+        return _Response(200, {"strResult": "SUCC", "h_msg_txt": ""})
@@ -0,0 +1,324 @@
+"""
+Metrics - Prometheus 텍스트 포맷 지표 수집
+요청/업스트림 지연 시간 히스토그램, 폴백/오류 카운터, in-flight 게이지를 기록하고
+GET /metrics에서 Prometheus text exposition format(0.0.4)으로 내보낸다.
+"""
+
+import bisect
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import Callable, Iterable, Optional
+
+# Prometheus 기본 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+
+    def samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self.samples(),
+        ]
+
+
+class Counter(_Metric):
+    """
+    단조 증가 카운터.
+
+    이벤트 루프 스레드에서만 기록하므로 lock 없이 dict 값을 직접 증가시킨다.
+    """
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def items(self) -> list[tuple[tuple[str, ...], float]]:
+        return sorted(self._values.items())
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self.items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+class Gauge(Counter):
+    """증감 가능한 게이지 (in-flight 요청 수 등)"""
+
+    type_name = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels: str, value: float) -> None:
+        self._values[labels] = value
+
+
+class _HistogramSeries:
+    """레이블 조합 하나의 버킷별 관측 수, 합계, 최대값"""
+
+    __slots__ = ("buckets", "count", "sum", "max")
+
+    def __init__(self, size: int):
+        self.buckets = [0] * size
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+
+class Histogram(_Metric):
+    """
+    버킷 히스토그램.
+
+    관측값은 해당 버킷 하나만 증가시키고, 누적 합은 내보낼 때 계산한다.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.bounds = tuple(buckets)
+        self._series: dict[tuple[str, ...], _HistogramSeries] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = _HistogramSeries(len(self.bounds) + 1)
+        series.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        series.count += 1
+        series.sum += value
+        if value > series.max:
+            series.max = value
+
+    def series(self, *labels: str) -> Optional[_HistogramSeries]:
+        return self._series.get(labels)
+
+    def items(self) -> list[tuple[tuple[str, ...], _HistogramSeries]]:
+        return sorted(self._series.items())
+
+    def quantile(self, q: float, *labels: str) -> Optional[float]:
+        """버킷 기준 분위수 (해당 버킷의 상한). 마지막 버킷이면 최대값."""
+        series = self._series.get(labels)
+        if series is None or series.count == 0:
+            return None
+        rank = q * series.count
+        seen = 0
+        for i, n in enumerate(series.buckets):
+            seen += n
+            if seen >= rank and i < len(self.bounds):
+                return self.bounds[i]
+        return series.max
+
+    def samples(self) -> Iterable[str]:
+        names = self.labelnames + ("le",)
+        for labels, series in self.items():
+            cumulative = 0
+            for bound, n in zip(self.bounds + (math.inf,), series.buckets):
+                cumulative += n
+                yield (
+                    f"{self.name}_bucket"
+                    f"{_format_labels(names, labels + (_format_value(bound),))} {cumulative}"
+                )
+            label_str = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{label_str} {_format_value(series.sum)}"
+            yield f"{self.name}_count{label_str} {series.count}"
+
+    def clear(self) -> None:
+        self._series.clear()
+
+
+class MetricsRegistry:
+    """
+    지표 목록과 수집 함수 목록.
+
+    수집 함수(collector)는 내보낼 때마다 호출되어 다른 모듈의 통계
+    (캐시 hit/miss 등)를 지표로 변환한다. 기록 경로에는 비용이 없다.
+    """
+
+    def __init__(self):
+        self._metrics: list[_Metric] = []
+        self._collectors: list[Callable[[], Iterable[_Metric]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[_Metric]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for metric in collector():
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+# ──────────────────────────────────────────────
+# 지표 정의
+# ──────────────────────────────────────────────
+
+HTTP_REQUEST_DURATION = REGISTRY.register(Histogram(
+    "http_request_duration_seconds",
+    "API 요청 처리 시간 (라우트 템플릿별)",
+    ("method", "route"),
+))
+HTTP_RESPONSES = REGISTRY.register(Counter(
+    "http_responses_total",
+    "API 응답 수 (상태 코드별)",
+    ("method", "route", "status"),
+))
+HTTP_IN_FLIGHT = REGISTRY.register(Gauge(
+    "http_requests_in_flight",
+    "처리 중인 API 요청 수",
+))
+
+UPSTREAM_DURATION = REGISTRY.register(Histogram(
+    "upstream_request_duration_seconds",
+    "업스트림(코레일, TAGO) 호출 시간 (작업별)",
+    ("upstream", "operation"),
+))
+UPSTREAM_ERRORS = REGISTRY.register(Counter(
+    "upstream_errors_total",
+    "업스트림 호출 실패 수 (작업별)",
+    ("upstream", "operation"),
+))
+UPSTREAM_IN_FLIGHT = REGISTRY.register(Gauge(
+    "upstream_requests_in_flight",
+    "진행 중인 업스트림 호출 수",
+    ("upstream",),
+))
+
+SEARCH_FALLBACKS = REGISTRY.register(Counter(
+    "train_search_fallback_total",
+    "korail2 조회 실패로 TAGO로 폴백한 횟수 (사유별)",
+    ("reason",),
+))
+TAGO_TRUNCATED = REGISTRY.register(Counter(
+    "tago_truncated_responses_total",
+    "TAGO_MAX_PAGES에 걸려 일부 열차만 받은 시간표 조회 수",
+))
+API_ERRORS = REGISTRY.register(Counter(
+    "api_errors_total",
+    "에러 응답 수 (에러 코드별)",
+    ("code",),
+))
+
+
+def record_upstream(upstream: str, operation: str, elapsed: float, failed: bool) -> None:
+    """
+    업스트림 호출 하나의 소요 시간과 실패 여부를 기록한다.
+
+    워커 스레드에서 잰 시간도 이벤트 루프 스레드에서 기록한다.
+    """
+    UPSTREAM_DURATION.observe(elapsed, upstream, operation)
+    if failed:
+        UPSTREAM_ERRORS.inc(upstream, operation)
+
+
+@asynccontextmanager
+async def track_upstream(upstream: str, operation: str):
+    """
+    업스트림 호출 하나의 소요 시간, 실패 여부, in-flight 수를 기록한다.
+
+    Usage:
+        async with track_upstream("tago", "fetch"):
+            ...
+    """
+    UPSTREAM_IN_FLIGHT.inc(upstream)
+    started = time.perf_counter()
+    failed = False
+    try:
+        yield
+    except Exception:
+        failed = True
+        raise
+    finally:
+        record_upstream(upstream, operation, time.perf_counter() - started, failed)
+        UPSTREAM_IN_FLIGHT.dec(upstream)
+
+
+def _cache_metrics() -> list[_Metric]:
+    """TTLCache 통계를 캐시 이름별 지표로 변환한다."""
+    from services.cache_service import cache_stats_by_name
+
+    counters = {
+        key: Counter(f"cache_{key}_total", help_text, ("cache",))
+        for key, help_text in (
+            ("hits", "캐시 fresh hit 수"),
+            ("stale_hits", "캐시 stale hit 수"),
+            ("misses", "캐시 miss 수"),
+            ("evictions", "캐시 LRU 제거 수"),
+        )
+    }
+    entries = Gauge("cache_entries", "캐시 항목 수", ("cache",))
+    for name, stats in cache_stats_by_name().items():
+        for key, counter in counters.items():
+            counter.inc(name, amount=stats[key])
+        entries.set(name, value=stats["entries"])
+    return [*counters.values(), entries]
+
+
+REGISTRY.register_collector(_cache_metrics)
+
+
+def record_error(code: Optional[str]) -> None:
+    """에러 응답의 에러 코드를 기록한다 (코드가 없으면 무시)."""
+    if code:
+        API_ERRORS.inc(code)
+
+
+def render_metrics() -> str:
+    """모든 지표를 Prometheus 텍스트 포맷으로 반환한다."""
+    return REGISTRY.render()
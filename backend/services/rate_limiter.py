@@ -0,0 +1,171 @@
+"""
+AccountRateGovernor - 코레일 계정별 호출량 제한 (token bucket)
+같은 코레일 계정의 모든 세션이 하나의 토큰 버킷을 공유하여
+과도한 조회로 계정이 차단(AUTH_002)되는 것을 막는다.
+예약/취소 같은 우선 작업을 위해 토큰 일부를 예비로 남겨 둔다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+import weakref
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 호출 우선순위
+PRIORITY_HIGH = "high"  # 예약, 취소, 예약 조회
+PRIORITY_LOW = "low"  # 열차 조회
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷.
+
+    reserve 인자를 주면 그 개수만큼의 토큰은 남겨 두고 획득한다
+    (우선순위가 낮은 호출이 예비 토큰을 쓰지 못하게 할 때 사용).
+    이벤트 루프 스레드에서만 접근하므로 별도의 lock은 두지 않는다.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    @property
+    def tokens(self) -> float:
+        """현재 남은 토큰 수."""
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0, reserve: float = 0.0) -> bool:
+        """토큰을 즉시 획득한다. 남은 토큰이 tokens + reserve보다 적으면 False."""
+        self._refill()
+        if self._tokens - tokens < reserve:
+            return False
+        self._tokens -= tokens
+        return True
+
+    def wait_time(self, tokens: float = 1.0, reserve: float = 0.0) -> float:
+        """tokens개를 획득할 수 있을 때까지 기다려야 하는 시간 (초)."""
+        self._refill()
+        shortage = tokens + reserve - self._tokens
+        if shortage <= 0:
+            return 0.0
+        return shortage / self.rate
+
+
+class RateLimitTimeout(Exception):
+    """우선 작업이 최대 대기 시간 안에 토큰을 얻지 못한 경우"""
+
+
+class AccountRateGovernor:
+    """
+    코레일 계정 하나의 호출량 관리자.
+
+    - KORAIL_RATE_PER_SECOND (기본 1.0): 지속 허용 호출 수 (초당)
+    - KORAIL_RATE_BURST (기본 5): 순간 허용 호출 수 (버킷 크기)
+    - KORAIL_RATE_RESERVED (기본 2): 예약/취소 전용으로 남겨 두는 토큰 수
+    - KORAIL_RATE_MAX_WAIT_SECONDS (기본 5): 우선 작업의 최대 대기 시간
+
+    열차 조회(PRIORITY_LOW)는 기다리지 않는다. 예비 토큰을 제외한 토큰이 없거나
+    우선 작업이 대기 중이면 즉시 거절되고, 호출자는 최근 조회 결과로 응답한다.
+    예약/취소(PRIORITY_HIGH)는 예비 토큰까지 사용할 수 있고, 부족하면 최대 대기 시간까지 기다린다.
+    """
+
+    def __init__(
+        self,
+        account: str,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        reserved: Optional[float] = None,
+        max_wait_seconds: Optional[float] = None,
+    ):
+        self._account = account
+        rate = rate or float(os.getenv("KORAIL_RATE_PER_SECOND", "1.0"))
+        burst = burst or float(os.getenv("KORAIL_RATE_BURST", "5"))
+        self._reserved = (
+            reserved
+            if reserved is not None
+            else float(os.getenv("KORAIL_RATE_RESERVED", "2"))
+        )
+        self._max_wait = (
+            max_wait_seconds
+            if max_wait_seconds is not None
+            else float(os.getenv("KORAIL_RATE_MAX_WAIT_SECONDS", "5"))
+        )
+        self._bucket = TokenBucket(rate, burst)
+        self._high_waiting = 0
+        self._granted = {PRIORITY_HIGH: 0, PRIORITY_LOW: 0}
+        self._throttled = 0
+        self._timeouts = 0
+
+    def try_acquire_low(self) -> bool:
+        """열차 조회용 토큰을 즉시 획득한다. 예산을 넘었으면 False."""
+        if self._high_waiting == 0 and self._bucket.try_acquire(reserve=self._reserved):
+            self._granted[PRIORITY_LOW] += 1
+            return True
+        self._throttled += 1
+        return False
+
+    async def acquire_high(self) -> None:
+        """
+        예약/취소용 토큰을 획득한다 (필요하면 대기).
+
+        Raises:
+            RateLimitTimeout: 최대 대기 시간 안에 토큰을 얻지 못한 경우
+        """
+        deadline = time.monotonic() + self._max_wait
+        self._high_waiting += 1
+        try:
+            while not self._bucket.try_acquire():
+                wait = self._bucket.wait_time()
+                if time.monotonic() + wait > deadline:
+                    self._timeouts += 1
+                    logger.warning(
+                        "[RateGovernor] 우선 작업 대기 시간 초과 - %s",
+                        self._account[:3] + "***",
+                    )
+                    raise RateLimitTimeout()
+                await asyncio.sleep(wait)
+        finally:
+            self._high_waiting -= 1
+        self._granted[PRIORITY_HIGH] += 1
+
+    def stats(self) -> dict:
+        """버킷 설정, 남은 토큰과 누적 허용/제한 횟수를 반환한다."""
+        return {
+            "rate_per_second": self._bucket.rate,
+            "burst": self._bucket.burst,
+            "reserved": self._reserved,
+            "tokens": round(self._bucket.tokens, 2),
+            "high_waiting": self._high_waiting,
+            "granted_high": self._granted[PRIORITY_HIGH],
+            "granted_low": self._granted[PRIORITY_LOW],
+            "throttled": self._throttled,
+            "timeouts": self._timeouts,
+        }
+
+
+# 계정 ID -> 관리자. 계정의 세션이 모두 사라지면 함께 제거된다.
+_governors: "weakref.WeakValueDictionary[str, AccountRateGovernor]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def get_account_governor(account: str) -> AccountRateGovernor:
+    """계정별 관리자를 반환한다 (같은 계정의 세션끼리 공유)."""
+    governor = _governors.get(account)
+    if governor is None:
+        governor = AccountRateGovernor(account)
+        _governors[account] = governor
+    return governor
@@ -0,0 +1,273 @@
+"""
+ReservationStore - 예약 정보 영속 저장소 (SQLite)
+예약 번호와 결제 기한으로 인덱싱된 예약 상세 정보를 저장하여
+서버 재시작 후에도 예약 상세 조회를 코레일 재조회 없이 처리한다.
+결제 기한이 지난 항목은 기한 순 min-heap 기반 sweeper가 제거한다.
+"""
+
+import asyncio
+import hashlib
+import heapq
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from models.schemas import ReservationDetailResponse
+
+logger = logging.getLogger(__name__)
+
+# 결제 기한을 알 수 없는 예약의 보관 시간 (코레일 결제 기한 10분)
+DEFAULT_RETENTION_SECONDS = 600
+# RESERVATION_STORE_PATH가 없을 때의 저장 경로 (재시작 후에도 예약 상세가 유지된다)
+DEFAULT_STORE_PATH = "data/reservations.sqlite3"
+
+
+def owner_key(korail_id: str) -> str:
+    """계정 ID를 저장용 소유자 키로 변환한다 (계정 ID를 평문으로 저장하지 않는다)."""
+    return hashlib.sha256(korail_id.encode("utf-8")).hexdigest()
+
+
+def deadline_of(detail: ReservationDetailResponse, known: Optional[float] = None) -> float:
+    """
+    예약의 결제 기한 (epoch 초).
+
+    기한을 해석할 수 없으면 이미 저장된 기한(known)을, 처음 보는 예약이면 지금부터 10분 뒤.
+    갱신할 때마다 10분씩 밀려 만료되지 않는 일이 없도록 처음 정한 기한을 유지한다.
+    """
+    if detail.payment_deadline:
+        try:
+            return datetime.fromisoformat(detail.payment_deadline).timestamp()
+        except ValueError:
+            pass
+    if known is not None:
+        return known
+    return time.time() + DEFAULT_RETENTION_SECONDS
+
+
+class ReservationStore:
+    """
+    (소유자, 예약 번호) → 예약 상세 정보 저장소.
+
+    - 경로: RESERVATION_STORE_PATH (기본 data/reservations.sqlite3, :memory:로 지정하면 재시작 시 초기화)
+    - 조회 시 결제 기한이 지난 항목은 없는 것으로 취급한다
+    - sweeper는 기한 순 min-heap의 가장 이른 기한까지 대기한 뒤 지난 항목을 삭제한다
+      (RESERVATION_SWEEP_MAX_INTERVAL_SECONDS 이상은 대기하지 않는다)
+
+    TestClient 등 다른 스레드에서도 접근할 수 있도록 DB 접근은 lock으로 직렬화한다.
+    """
+
+    def __init__(self, path: str = ":memory:", sweep_max_interval: Optional[float] = None):
+        self._path = path
+        self._sweep_max_interval = sweep_max_interval or float(
+            os.getenv("RESERVATION_SWEEP_MAX_INTERVAL_SECONDS", "30")
+        )
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # (deadline, reservation_id). 삭제/갱신된 항목은 꺼낼 때 DB 조건으로 걸러낸다
+        self._heap: list[tuple[float, str]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._expired = 0
+
+        with self._lock:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS reservations (
+                    reservation_id TEXT PRIMARY KEY,
+                    owner          TEXT NOT NULL,
+                    payload        TEXT NOT NULL,
+                    deadline       REAL NOT NULL
+                ) WITHOUT ROWID
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_reservations_deadline "
+                "ON reservations(deadline)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_reservations_owner "
+                "ON reservations(owner)"
+            )
+            self._conn.commit()
+            # 재시작 시 기존 항목의 기한을 heap으로 복원
+            self._heap = [
+                (deadline, rid)
+                for rid, deadline in self._conn.execute(
+                    "SELECT reservation_id, deadline FROM reservations"
+                )
+            ]
+        heapq.heapify(self._heap)
+
+        logger.info(
+            "[ReservationStore] 저장소 열기 - %s (%d건)", path, len(self._heap),
+        )
+
+    @classmethod
+    def from_env(cls) -> "ReservationStore":
+        """RESERVATION_STORE_PATH 설정으로 저장소를 생성한다."""
+        path = os.getenv("RESERVATION_STORE_PATH", "") or DEFAULT_STORE_PATH
+        directory = os.path.dirname(path) if path != ":memory:" else ""
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return cls(path)
+
+    def get(self, owner: str, reservation_id: str) -> Optional[ReservationDetailResponse]:
+        """소유자의 예약을 반환한다. 없거나 결제 기한이 지났으면 None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM reservations "
+                "WHERE reservation_id = ? AND owner = ? AND deadline > ?",
+                (reservation_id, owner, time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        return ReservationDetailResponse.model_validate_json(row[0])
+
+    def put(self, owner: str, detail: ReservationDetailResponse) -> None:
+        """예약을 저장한다 (같은 예약 번호가 있으면 교체)."""
+        with self._lock:
+            known = self._deadlines(owner).get(detail.reservation_id)
+            deadline = deadline_of(detail, known)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO reservations "
+                "(reservation_id, owner, payload, deadline) VALUES (?, ?, ?, ?)",
+                (detail.reservation_id, owner, detail.model_dump_json(), deadline),
+            )
+            self._conn.commit()
+            if deadline != known:
+                heapq.heappush(self._heap, (deadline, detail.reservation_id))
+
+    def replace_owner(self, owner: str, details: list[ReservationDetailResponse]) -> None:
+        """소유자의 예약을 코레일 예약 목록 기준으로 교체한다."""
+        with self._lock:
+            known = self._deadlines(owner)
+            rows = [
+                (d.reservation_id, owner, d.model_dump_json(),
+                 deadline_of(d, known.get(d.reservation_id)))
+                for d in details
+                if d.reservation_id
+            ]
+            self._conn.execute("DELETE FROM reservations WHERE owner = ?", (owner,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO reservations "
+                "(reservation_id, owner, payload, deadline) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+            for rid, _, _, deadline in rows:
+                # 기한이 그대로인 항목은 이미 heap에 있다
+                if deadline != known.get(rid):
+                    heapq.heappush(self._heap, (deadline, rid))
+
+    def _deadlines(self, owner: str) -> dict[str, float]:
+        """소유자의 예약 번호별 저장된 결제 기한. lock을 잡은 상태에서 호출한다."""
+        return dict(self._conn.execute(
+            "SELECT reservation_id, deadline FROM reservations WHERE owner = ?", (owner,),
+        ))
+
+    def delete(self, owner: str, reservation_id: str) -> None:
+        """소유자의 예약을 삭제한다 (heap 항목은 sweep 시 걸러진다)."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM reservations WHERE reservation_id = ? AND owner = ?",
+                (reservation_id, owner),
+            )
+            self._conn.commit()
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """
+        결제 기한이 지난 항목을 삭제하고 삭제 건수를 반환한다.
+
+        heap에서 기한이 지난 항목만 꺼내므로 비용은 만료 건수에 비례한다.
+        """
+        now = time.time() if now is None else now
+        removed = 0
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                deadline, rid = heapq.heappop(self._heap)
+                # 기한이 갱신된 항목은 DB의 deadline 조건에 걸리지 않는다
+                cur = self._conn.execute(
+                    "DELETE FROM reservations WHERE reservation_id = ? AND deadline <= ?",
+                    (rid, deadline),
+                )
+                removed += cur.rowcount
+            if removed:
+                self._conn.commit()
+        if removed:
+            self._expired += removed
+            logger.info("[ReservationStore] 결제 기한 만료 예약 %d건 삭제", removed)
+        return removed
+
+    def next_deadline(self) -> Optional[float]:
+        """heap에서 가장 이른 결제 기한 (epoch 초). 비어 있으면 None."""
+        with self._lock:
+            return self._heap[0][0] if self._heap else None
+
+    def start(self) -> None:
+        """만료 sweeper를 시작한다."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name="reservation-sweeper")
+
+    async def stop(self) -> None:
+        """만료 sweeper를 중단한다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error("[ReservationStore] 만료 정리 오류: %s", e)
+            next_deadline = self.next_deadline()
+            delay = self._sweep_max_interval
+            if next_deadline is not None:
+                delay = min(delay, max(0.0, next_deadline - time.time()))
+            await asyncio.sleep(delay)
+
+    def count(self) -> int:
+        """저장된 항목 수를 반환한다."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM reservations").fetchone()[0]
+
+    def stats(self) -> dict:
+        return {
+            "entries": self.count(),
+            "pending_deadlines": len(self._heap),
+            "expired": self._expired,
+        }
+
+    def close(self) -> None:
+        """DB 연결을 닫는다."""
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[ReservationStore] = None
+
+
+def get_reservation_store() -> ReservationStore:
+    """프로세스 전역 예약 저장소를 반환한다 (처음 호출 시 생성)."""
+    global _store
+    if _store is None:
+        _store = ReservationStore.from_env()
+    return _store
+
+
+def close_reservation_store() -> None:
+    """프로세스 전역 예약 저장소를 닫는다."""
+    global _store
+    if _store is not None:
+        _store.close()
+        _store = None
@@ -2,21 +2,44 @@
 Exponential Backoff 재시도 유틸리티
 지수 증가 방식으로 실패한 작업을 재시도한다.
 스케줄: 5s -> 10s -> 20s -> 40s -> 60s (cap)
+
+업스트림(코레일, TAGO)별 CircuitBreaker와 RetryBudget도 제공한다.
+업스트림 장애 시 요청을 즉시 실패시켜 재시도 대기가 쌓이지 않도록 한다.
 """
 
 import asyncio
 import functools
 import logging
+import os
+import random
+import time
 from typing import Callable, Any, Optional, Type
 
 logger = logging.getLogger(__name__)
 
+# 요청 경로의 업스트림 재시도 설정 (코레일/TAGO 공통)
+UPSTREAM_RETRY_MAX = int(os.getenv("UPSTREAM_RETRY_MAX", "2"))
+UPSTREAM_RETRY_BASE_DELAY = float(os.getenv("UPSTREAM_RETRY_BASE_DELAY", "0.2"))
+UPSTREAM_RETRY_MAX_DELAY = float(os.getenv("UPSTREAM_RETRY_MAX_DELAY", "2.0"))
+
+
+def _backoff_delay(
+    attempt: int, base_delay: float, max_delay: float, jitter: bool
+) -> float:
+    """attempt번째 재시도 대기 시간. jitter면 0 ~ 지수 대기 시간 사이의 난수 (full jitter)."""
+    delay = min(base_delay * (2 ** attempt), max_delay)
+    if jitter:
+        return random.uniform(0, delay)
+    return delay
+
 
 def exponential_backoff(
     base_delay: float = 5.0,
     max_delay: float = 60.0,
     max_retries: int = 5,
     retryable_exceptions: Optional[tuple[Type[Exception], ...]] = None,
+    jitter: bool = False,
+    budget: Optional["RetryBudget"] = None,
 ):
     """
     Exponential backoff 데코레이터.
@@ -30,12 +53,16 @@ def exponential_backoff(
         max_retries: 최대 재시도 횟수. 기본값 5.
         retryable_exceptions: 재시도할 예외 타입 튜플.
                              None이면 모든 Exception에 대해 재시도.
+        jitter: True면 full jitter (0 ~ 지수 대기 시간 사이 난수) 적용.
+        budget: 재시도 예산. 예산이 바닥나면 재시도 없이 즉시 예외를 전파한다.
     """
 
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             last_exception = None
+            if budget is not None:
+                budget.deposit()
 
             for attempt in range(max_retries + 1):
                 try:
@@ -64,8 +91,16 @@ def exponential_backoff(
                         )
                         raise
 
+                    if budget is not None and not budget.try_withdraw():
+                        logger.warning(
+                            "[Retry] 재시도 예산 소진 - 재시도 없이 실패: %s - %s",
+                            type(e).__name__,
+                            str(e),
+                        )
+                        raise
+
                     # 대기 시간 계산: base_delay * 2^attempt, max_delay로 cap
-                    delay = min(base_delay * (2 ** attempt), max_delay)
+                    delay = _backoff_delay(attempt, base_delay, max_delay, jitter)
 
                     logger.warning(
                         "[Retry] 재시도 %d/%d - %.1f초 후 재시도 예정: %s - %s",
@@ -93,6 +128,8 @@ async def retry_with_backoff(
     max_delay: float = 60.0,
     max_retries: int = 5,
     retryable_exceptions: Optional[tuple[Type[Exception], ...]] = None,
+    jitter: bool = False,
+    budget: Optional["RetryBudget"] = None,
     **kwargs: Any,
 ) -> Any:
     """
@@ -107,12 +144,16 @@ async def retry_with_backoff(
         max_delay: 최대 대기 시간 (초)
         max_retries: 최대 재시도 횟수
         retryable_exceptions: 재시도할 예외 타입 튜플
+        jitter: True면 full jitter 적용
+        budget: 재시도 예산 (바닥나면 재시도 없이 실패)
         **kwargs: 함수에 전달할 키워드 인자
 
     Returns:
         함수 실행 결과
     """
     last_exception = None
+    if budget is not None:
+        budget.deposit()
 
     for attempt in range(max_retries + 1):
         try:
@@ -137,7 +178,15 @@ async def retry_with_backoff(
                 )
                 raise
 
-            delay = min(base_delay * (2 ** attempt), max_delay)
+            if budget is not None and not budget.try_withdraw():
+                logger.warning(
+                    "[Retry] 재시도 예산 소진 - 재시도 없이 실패: %s - %s",
+                    type(e).__name__,
+                    str(e),
+                )
+                raise
+
+            delay = _backoff_delay(attempt, base_delay, max_delay, jitter)
 
             logger.warning(
                 "[Retry] 재시도 %d/%d - %.1f초 후 재시도: %s - %s",
@@ -151,3 +200,212 @@ async def retry_with_backoff(
             await asyncio.sleep(delay)
 
     raise last_exception  # type: ignore[misc]
+
+
+# ──────────────────────────────────────────────
+# 재시도 예산
+# ──────────────────────────────────────────────
+
+
+class RetryBudget:
+    """
+    토큰 기반 재시도 예산.
+
+    요청마다 ratio개의 토큰이 쌓이고 (최대 max_tokens), 재시도마다 토큰 1개를 쓴다.
+    업스트림 장애로 모든 요청이 실패해도 재시도는 전체 요청의 ratio 비율을 넘지 않는다.
+    이벤트 루프 스레드에서만 접근하므로 별도의 lock은 두지 않는다.
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10.0):
+        self._ratio = ratio
+        self._max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._retries = 0
+        self._exhausted = 0
+
+    def deposit(self) -> None:
+        """요청 1건만큼 토큰을 적립한다."""
+        self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def try_withdraw(self) -> bool:
+        """재시도 1회분 토큰을 사용한다. 예산이 없으면 False."""
+        if self._tokens < 1.0:
+            self._exhausted += 1
+            return False
+        self._tokens -= 1.0
+        self._retries += 1
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "tokens": round(self._tokens, 2),
+            "retries": self._retries,
+            "exhausted": self._exhausted,
+        }
+
+
+# ──────────────────────────────────────────────
+# 서킷 브레이커
+# ──────────────────────────────────────────────
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 업스트림 호출을 차단한 경우"""
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"{name} 서킷 열림 ({retry_after:.1f}초 후 재시도)")
+
+
+class CircuitBreaker:
+    """
+    업스트림별 서킷 브레이커.
+
+    - closed: 정상. 연속 실패가 failure_threshold에 도달하면 open
+    - open: reset_timeout 동안 모든 호출을 CircuitOpenError로 즉시 실패
+    - half_open: reset_timeout이 지나면 시험 호출 1건만 허용.
+      성공하면 closed, 실패하면 다시 open
+
+    failure_exceptions에 해당하는 예외만 실패로 센다 (네트워크 오류, 5xx 등).
+    그 밖의 예외(매진, 결과 없음 등)는 업스트림이 응답한 것이므로 실패로 세지 않는다.
+    이벤트 루프 스레드에서만 접근하므로 별도의 lock은 두지 않는다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_exceptions: tuple[Type[BaseException], ...] = (Exception,),
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+    ):
+        self.name = name
+        self._failure_exceptions = failure_exceptions
+        self._failure_threshold = failure_threshold or int(
+            os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5")
+        )
+        self._reset_timeout = reset_timeout or float(
+            os.getenv("CIRCUIT_RESET_SECONDS", "30")
+        )
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_inflight = False
+        self._rejected = 0
+        self._opened = 0
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == CIRCUIT_OPEN
+            and time.monotonic() - self._opened_at >= self._reset_timeout
+        ):
+            return CIRCUIT_HALF_OPEN
+        return self._state
+
+    def _before_call(self) -> None:
+        state = self.state
+        if state == CIRCUIT_CLOSED:
+            return
+        if state == CIRCUIT_HALF_OPEN and not self._probe_inflight:
+            self._state = CIRCUIT_HALF_OPEN
+            self._probe_inflight = True
+            logger.info("[CircuitBreaker] %s 시험 호출 허용 (half-open)", self.name)
+            return
+        self._rejected += 1
+        retry_after = max(
+            0.0, self._reset_timeout - (time.monotonic() - self._opened_at)
+        )
+        raise CircuitOpenError(self.name, retry_after)
+
+    def _record_success(self) -> None:
+        if self._state != CIRCUIT_CLOSED:
+            logger.info("[CircuitBreaker] %s 서킷 닫힘 (복구)", self.name)
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._probe_inflight = False
+
+    def _record_failure(self) -> None:
+        self._failures += 1
+        self._probe_inflight = False
+        if self._state == CIRCUIT_HALF_OPEN or self._failures >= self._failure_threshold:
+            if self._state != CIRCUIT_OPEN:
+                self._opened += 1
+            self._state = CIRCUIT_OPEN
+            self._opened_at = time.monotonic()
+            logger.warning(
+                "[CircuitBreaker] %s 서킷 열림 - 연속 실패 %d회, %.0f초간 호출 차단",
+                self.name, self._failures, self._reset_timeout,
+            )
+
+    async def call(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        서킷 상태를 확인하고 비동기 함수를 호출한다.
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있는 경우 (func는 호출되지 않음)
+        """
+        self._before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except self._failure_exceptions:
+            self._record_failure()
+            raise
+        except BaseException:
+            # 업스트림 장애가 아닌 예외 (비즈니스 오류, 취소 등): 시험 호출 슬롯만 반환
+            self._probe_inflight = False
+            raise
+        self._record_success()
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "opened": self._opened,
+            "rejected": self._rejected,
+        }
+
+
+# 업스트림 이름 -> 서킷 브레이커 / 재시도 예산 (프로세스 전역 공유)
+_breakers: dict[str, CircuitBreaker] = {}
+_budgets: dict[str, RetryBudget] = {}
+
+
+def get_breaker(
+    name: str,
+    failure_exceptions: tuple[Type[BaseException], ...] = (Exception,),
+) -> CircuitBreaker:
+    """업스트림별 서킷 브레이커를 반환한다 (처음 호출 시 생성)."""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = CircuitBreaker(name, failure_exceptions)
+        _breakers[name] = breaker
+    return breaker
+
+
+def get_retry_budget(name: str) -> RetryBudget:
+    """업스트림별 재시도 예산을 반환한다 (처음 호출 시 생성)."""
+    budget = _budgets.get(name)
+    if budget is None:
+        budget = RetryBudget(
+            ratio=float(os.getenv("RETRY_BUDGET_RATIO", "0.2")),
+            max_tokens=float(os.getenv("RETRY_BUDGET_MAX_TOKENS", "10")),
+        )
+        _budgets[name] = budget
+    return budget
+
+
+def upstream_stats() -> dict:
+    """모든 업스트림의 서킷/재시도 예산 상태를 반환한다."""
+    return {
+        name: {
+            "circuit": breaker.stats(),
+            "retry_budget": _budgets[name].stats() if name in _budgets else None,
+        }
+        for name, breaker in _breakers.items()
+    }
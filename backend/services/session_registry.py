@@ -0,0 +1,133 @@
+"""
+KorailSessionRegistry - 사용자별 코레일 세션 저장소
+session_token을 키로 사용자마다 독립된 KorailService(코레일 세션, 만료 시각,
+예약 캐시)를 보관한다. 유휴 TTL과 LRU 방식으로 세션을 제거하여
+동시 사용자가 많아도 메모리 사용량이 일정 수준을 넘지 않도록 한다.
+"""
+
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from services.korail_service import KorailService
+
+logger = logging.getLogger(__name__)
+
+
+class KorailSessionRegistry:
+    """
+    session_token → KorailService 매핑 저장소.
+
+    - 최대 세션 수: KORAIL_SESSION_MAX (기본 500). 초과 시 가장 오래 사용되지 않은 세션 제거
+    - 유휴 TTL: KORAIL_SESSION_IDLE_TTL_SECONDS (기본 1800). 마지막 사용 이후 경과 시 제거
+    - 코레일 세션 자체가 만료된 항목은 조회 시점에 제거
+
+    이벤트 루프 스레드에서만 접근하므로 별도의 lock은 두지 않는다.
+    """
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = None,
+        idle_ttl_seconds: Optional[float] = None,
+    ):
+        self._max_sessions = max_sessions or int(
+            os.getenv("KORAIL_SESSION_MAX", "500")
+        )
+        self._idle_ttl = idle_ttl_seconds or float(
+            os.getenv("KORAIL_SESSION_IDLE_TTL_SECONDS", "1800")
+        )
+        # token -> (service, last_access)
+        self._sessions: "OrderedDict[str, tuple[KorailService, float]]" = OrderedDict()
+        self._evicted = 0
+
+        logger.info(
+            "[SessionRegistry] 초기화 완료 - max=%d, idle_ttl=%.0fs",
+            self._max_sessions, self._idle_ttl,
+        )
+
+    def register(self, token: str, service: KorailService) -> None:
+        """
+        로그인에 성공한 세션을 등록한다.
+
+        같은 서비스가 이전 토큰으로 등록되어 있으면(재로그인) 이전 토큰은 제거한다.
+        """
+        stale = [
+            old_token
+            for old_token, (registered, _) in self._sessions.items()
+            if registered is service and old_token != token
+        ]
+        for old_token in stale:
+            del self._sessions[old_token]
+
+        self._sessions[token] = (service, time.monotonic())
+        self._sessions.move_to_end(token)
+        self.prune()
+
+        while len(self._sessions) > self._max_sessions:
+            old_token, (old_service, _) = self._sessions.popitem(last=False)
+            self._close(old_service)
+            self._evicted += 1
+            logger.info(
+                "[SessionRegistry] LRU 제거 - token: %s***, 남은 세션: %d",
+                old_token[:6], len(self._sessions),
+            )
+
+    def get(self, token: str) -> Optional[KorailService]:
+        """
+        토큰에 해당하는 세션을 반환한다.
+
+        등록되지 않았거나 유휴 TTL/코레일 세션이 만료된 경우 None을 반환한다.
+        """
+        entry = self._sessions.get(token)
+        if entry is None:
+            return None
+
+        service, last_access = entry
+        now = time.monotonic()
+        if now - last_access > self._idle_ttl or not service.is_session_valid():
+            self.discard(token)
+            return None
+
+        self._sessions[token] = (service, now)
+        self._sessions.move_to_end(token)
+        return service
+
+    def discard(self, token: str) -> None:
+        """세션을 제거한다. 없는 토큰이면 무시한다."""
+        entry = self._sessions.pop(token, None)
+        if entry is not None:
+            self._close(entry[0])
+            self._evicted += 1
+
+    def prune(self) -> int:
+        """유휴 TTL이 지났거나 만료된 세션을 제거하고 제거 건수를 반환한다."""
+        now = time.monotonic()
+        expired = [
+            token
+            for token, (service, last_access) in self._sessions.items()
+            if now - last_access > self._idle_ttl or not service.is_session_valid()
+        ]
+        for token in expired:
+            self.discard(token)
+        return len(expired)
+
+    def stats(self) -> dict:
+        """현재 세션 수와 누적 제거 건수를 반환한다."""
+        return {
+            "sessions": len(self._sessions),
+            "max_sessions": self._max_sessions,
+            "idle_ttl_seconds": self._idle_ttl,
+            "evicted": self._evicted,
+        }
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    @staticmethod
+    def _close(service: KorailService) -> None:
+        try:
+            service.close()
+        except Exception as e:
+            logger.warning("[SessionRegistry] 세션 정리 실패: %s", str(e))
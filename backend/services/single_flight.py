@@ -0,0 +1,70 @@
+"""
+SingleFlight - 동일 요청 합치기 (request coalescing)
+같은 키로 동시에 들어온 요청은 업스트림 호출 하나만 실행하고
+나머지 호출자는 그 결과(또는 예외)를 함께 받는다.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    키별 in-flight 호출 중복 제거기.
+
+    - 먼저 도착한 호출(leader)이 업스트림 작업을 별도 Task로 시작한다.
+    - 작업이 끝나기 전에 같은 키로 들어온 호출(follower)은 같은 Task를 기다린다.
+    - 작업이 끝나면 키가 제거되므로 결과를 캐싱하지는 않는다.
+    - 호출자 하나가 취소되어도 공유 Task는 취소되지 않는다 (asyncio.shield).
+
+    이벤트 루프 스레드에서만 접근하므로 별도의 lock은 두지 않는다.
+    """
+
+    def __init__(self, name: str = "single-flight"):
+        self._name = name
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self._leaders = 0
+        self._followers = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        key에 대한 작업을 실행하거나, 이미 실행 중이면 그 결과를 기다린다.
+
+        Args:
+            key: 요청 식별 키 (동일 요청이면 같은 값)
+            func: 업스트림 호출 코루틴을 만드는 함수 (leader일 때만 호출됨)
+
+        Returns:
+            업스트림 호출 결과 (모든 호출자가 같은 객체를 공유)
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._on_done(k, t))
+            self._leaders += 1
+        else:
+            self._followers += 1
+            logger.debug("[%s] in-flight 요청 공유 - key: %s", self._name, key)
+
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 모든 호출자가 취소된 경우에도 예외가 "never retrieved"로 남지 않도록 조회
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        """누적 leader/follower 수와 현재 in-flight 수를 반환한다."""
+        return {
+            "inflight": len(self._inflight),
+            "leaders": self._leaders,
+            "followers": self._followers,
+        }
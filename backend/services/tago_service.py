@@ -3,14 +3,29 @@ TaGoService - 공공데이터포털(TAGO) 열차정보 API 서비스
 국토교통부 열차정보 서비스를 통한 열차 시간표 조회 기능을 제공한다.
 """
 
+import asyncio
 import logging
 import os
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Callable, Optional
 
 import httpx
 
 from models.schemas import TrainInfo
+from services.cache_service import TTLCache
+from services.cassette import get_cassette, tago_transport
+from services.http_client import HttpClientConfig, create_async_client, keep_warm
+from services.metrics import TAGO_TRUNCATED, track_upstream
+from services.retry_service import (
+    UPSTREAM_RETRY_BASE_DELAY,
+    UPSTREAM_RETRY_MAX,
+    UPSTREAM_RETRY_MAX_DELAY,
+    CircuitOpenError,
+    get_breaker,
+    get_retry_budget,
+    retry_with_backoff,
+)
+from services.timetable_index import TimetableIndex
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +35,9 @@ KST = timezone(timedelta(hours=9))
 # ──────────────────────────────────────────────
 # TAGO API 설정
 # ──────────────────────────────────────────────
-TAGO_BASE_URL = "http://apis.data.go.kr/1613000/TrainInfoService"
+TAGO_BASE_URL = os.getenv(
+    "TAGO_BASE_URL", "http://apis.data.go.kr/1613000/TrainInfoService"
+)
 
 # ──────────────────────────────────────────────
 # 역명 → NAT 코드 매핑 (주요 KTX 정차역)
@@ -159,14 +176,57 @@ class TaGoService:
     - 출/도착지 기반 열차 시간표 조회
     - 역명 → NAT 코드 변환
     - 차량종류 목록 조회
+
+    시간표 캐시:
+    TAGO 시간표는 노선/날짜별로 거의 바뀌지 않으므로
+    (depPlaceId, arrPlaceId, depPlandTime, trainGradeCode) 단위로 원본 item 목록을 캐싱한다.
+    시간 필터는 요청마다 적용하므로 캐시 항목 하나가 그날의 모든 출발시간 조회를 처리한다.
+    - TAGO_CACHE_TTL_SECONDS (기본 600): fresh 기간
+    - TAGO_CACHE_STALE_SECONDS (기본 3600): fresh 이후 stale 응답 허용 기간
+      (stale 응답 시 백그라운드에서 갱신)
+    - TAGO_CACHE_MAX_ENTRIES (기본 512): LRU 최대 항목 수
+
+    로컬 인덱스(TimetableIndex)가 주어지면 캐시 미스 시 네트워크보다 먼저 조회하고,
+    네트워크에서 받은 시간표도 인덱스에 기록한다.
+
+    HTTP 연결:
+    모든 조회가 하나의 httpx 클라이언트(연결 풀)를 공유한다. 풀 크기, keep-alive 유지 시간,
+    HTTP/2, 타임아웃은 TAGO_HTTP_* 환경변수로 조정한다 (services.http_client 참고).
+    start()/close()는 앱 lifespan에서 호출한다.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        index: Optional[TimetableIndex] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         self._api_key = api_key or os.getenv("TAGO_API_KEY", "")
         if not self._api_key:
             logger.warning("[TaGoService] TAGO_API_KEY가 설정되지 않았습니다")
 
-        self._client = httpx.AsyncClient(timeout=10.0)
+        # HTTP 클라이언트는 start() 또는 첫 요청 시 생성한다 (TAGO_HTTP_* 설정)
+        self._http_config = HttpClientConfig("TAGO")
+        self._client = client
+        self._warmup_task: Optional[asyncio.Task] = None
+        self._cache = TTLCache(
+            max_entries=int(os.getenv("TAGO_CACHE_MAX_ENTRIES", "512")),
+            ttl_seconds=float(os.getenv("TAGO_CACHE_TTL_SECONDS", "600")),
+            stale_seconds=float(os.getenv("TAGO_CACHE_STALE_SECONDS", "3600")),
+            name="tago-timetable",
+        )
+        self._index = index
+        # 연결 오류와 5xx만 장애로 센다 (4xx, resultCode 오류는 제외)
+        self._breaker = get_breaker(
+            "tago", (httpx.RequestError, httpx.HTTPStatusError),
+        )
+        self._retry_budget = get_retry_budget("tago")
+        # 페이지 조회 설정: 페이지 크기, 최대 페이지 수, 동시 요청 수
+        self._page_size = int(os.getenv("TAGO_PAGE_SIZE", "100"))
+        self._max_pages = int(os.getenv("TAGO_MAX_PAGES", "10"))
+        self._page_concurrency = int(os.getenv("TAGO_PAGE_CONCURRENCY", "4"))
+        # 진행 중인 백그라운드 갱신 (키 중복 방지 + Task 참조 유지)
+        self._refreshing: dict[tuple, asyncio.Task] = {}
         logger.info("[TaGoService] 서비스 초기화 완료")
 
     def _resolve_station(self, name: str) -> str:
@@ -217,25 +277,218 @@ class TaGoService:
             dep, dep_code, arr, arr_code, date,
         )
 
+        item_list = await self._get_items(dep_code, arr_code, date, train_grade_code)
+        if not item_list:
+            raise NoTrainsFoundError()
+
+        train_list: list[TrainInfo] = []
+        filter_hhmm = time[:4] if time else None  # HHmm 부분
+        for item in item_list:
+            try:
+                # 시간 필터: 지정된 시간 이후의 열차만 포함
+                # (캐시된 item은 날짜 전체이므로 요청마다 적용한다)
+                if filter_hhmm:
+                    dep_pland = str(item.get("depplandtime", ""))
+                    if len(dep_pland) >= 12:
+                        dep_hhmm = dep_pland[8:12]  # HHmm 부분
+                        if dep_hhmm < filter_hhmm:
+                            continue
+
+                train_list.append(self._parse_train_item(item))
+            except Exception as e:
+                logger.warning(
+                    "[TaGoService] 열차 정보 파싱 오류 (건너뜀): %s", e,
+                )
+                continue
+
+        if not train_list:
+            raise NoTrainsFoundError()
+
+        logger.info("[TaGoService] 조회 완료 - %d건", len(train_list))
+        return train_list
+
+    def cache_stats(self) -> dict:
+        """시간표 캐시 통계를 반환한다."""
+        return self._cache.stats()
+
+    async def _get_items(
+        self,
+        dep_code: str,
+        arr_code: str,
+        date: str,
+        train_grade_code: Optional[str],
+    ) -> list[dict]:
+        """
+        캐시를 거쳐 노선/날짜의 원본 item 목록을 반환한다.
+
+        fresh 항목은 그대로, stale 항목은 반환과 동시에 백그라운드 갱신을 예약하고,
+        캐시에 없으면 로컬 인덱스, 그다음 TAGO API 순으로 조회한다.
+        """
+        key = (dep_code, arr_code, date, train_grade_code or "")
+        entry = self._cache.get_entry(key)
+        if entry is not None:
+            items, is_fresh = entry
+            if not is_fresh:
+                self._schedule_refresh(key)
+            logger.info(
+                "[TaGoService] 캐시 %s - %s", "hit" if is_fresh else "stale hit", key,
+            )
+            return items
+
+        if self._index is not None:
+            items = self._index.get(dep_code, arr_code, date, train_grade_code)
+            if items is not None:
+                logger.info("[TaGoService] 로컬 인덱스 hit - %s", key)
+                self._cache.set(key, items)
+                return items
+
+        return await self.fetch_timetable(dep_code, arr_code, date, train_grade_code)
+
+    async def fetch_timetable(
+        self,
+        dep_code: str,
+        arr_code: str,
+        date: str,
+        train_grade_code: Optional[str] = None,
+        on_page: Optional[Callable[[], None]] = None,
+    ) -> list[dict]:
+        """
+        TAGO API에서 시간표를 받아 캐시와 로컬 인덱스에 기록한다.
+
+        일괄 수집 작업(TimetablePrefetcher)도 이 메서드를 사용한다.
+
+        Args:
+            on_page: 페이지를 요청할 때마다 호출된다 (API 호출 수 집계용)
+
+        Raises:
+            TaGoApiError: TAGO API 호출 실패
+        """
+        items = await self._fetch_items(dep_code, arr_code, date, train_grade_code, on_page)
+        self._cache.set((dep_code, arr_code, date, train_grade_code or ""), items)
+        if self._index is not None:
+            self._index.put(dep_code, arr_code, date, train_grade_code, items)
+        return items
+
+    def _schedule_refresh(self, key: tuple) -> None:
+        """stale 캐시 항목의 백그라운드 갱신을 예약한다 (키당 하나만 실행)."""
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(key))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _t, k=key: self._refreshing.pop(k, None))
+
+    async def _refresh(self, key: tuple) -> None:
+        dep_code, arr_code, date, grade = key
+        try:
+            await self.fetch_timetable(dep_code, arr_code, date, grade or None)
+            logger.info("[TaGoService] 캐시 백그라운드 갱신 완료 - %s", key)
+        except Exception as e:
+            # 갱신 실패 시 stale 항목을 그대로 유지한다
+            logger.warning("[TaGoService] 캐시 백그라운드 갱신 실패 - %s: %s", key, e)
+
+    async def _fetch_items(
+        self,
+        dep_code: str,
+        arr_code: str,
+        date: str,
+        train_grade_code: Optional[str],
+        on_page: Optional[Callable[[], None]] = None,
+    ) -> list[dict]:
+        """
+        TAGO API를 호출하여 원본 item 목록을 반환한다. 결과가 없으면 빈 목록.
+
+        첫 페이지의 totalCount로 전체 페이지 수를 계산하고,
+        나머지 페이지는 공유 httpx 클라이언트로 동시에 조회한 뒤 출발시각 순으로 합친다.
+
+        Raises:
+            TaGoApiError: TAGO API 호출 실패
+        """
         params: dict[str, str] = {
             "serviceKey": self._api_key,
             "depPlaceId": dep_code,
             "arrPlaceId": arr_code,
             "depPlandTime": date,
-            "numOfRows": "100",
-            "pageNo": "1",
+            "numOfRows": str(self._page_size),
             "_type": "json",
         }
         if train_grade_code:
             params["trainGradeCode"] = train_grade_code
 
+        body = await self._fetch_page(params, 1, on_page)
         try:
-            resp = await self._client.get(
-                f"{TAGO_BASE_URL}/getStrtpntAlocFndTrainInfo",
-                params=params,
+            total_count = int(body.get("totalCount", 0) or 0)
+        except (ValueError, TypeError):
+            total_count = 0
+        if total_count == 0:
+            return []
+
+        item_list = self._extract_items(body)
+
+        needed_pages = -(-total_count // self._page_size)
+        total_pages = min(needed_pages, self._max_pages)
+        if total_pages > 1:
+            semaphore = asyncio.Semaphore(self._page_concurrency)
+
+            async def fetch(page_no: int) -> list[dict]:
+                async with semaphore:
+                    return self._extract_items(await self._fetch_page(params, page_no, on_page))
+
+            pages = await asyncio.gather(
+                *(fetch(page_no) for page_no in range(2, total_pages + 1))
+            )
+            for page_items in pages:
+                item_list.extend(page_items)
+            item_list.sort(key=lambda item: str(item.get("depplandtime", "")))
+
+            logger.info(
+                "[TaGoService] 페이지 조회 완료 - totalCount=%d, %d페이지, %d건",
+                total_count, total_pages, len(item_list),
+            )
+
+        if needed_pages > total_pages:
+            TAGO_TRUNCATED.inc()
+            logger.warning(
+                "[TaGoService] 최대 페이지 수(%d) 초과로 일부만 조회 - %s -> %s %s,"
+                " totalCount=%d, %d건 반환 (TAGO_MAX_PAGES 또는 TAGO_PAGE_SIZE 조정 필요)",
+                self._max_pages, dep_code, arr_code, date, total_count, len(item_list),
+            )
+
+        return item_list
+
+    async def _fetch_page(
+        self,
+        params: dict[str, str],
+        page_no: int,
+        on_page: Optional[Callable[[], None]] = None,
+    ) -> dict:
+        """
+        TAGO API의 한 페이지를 조회하여 response.body를 반환한다.
+
+        연결 오류와 5xx 응답은 "tago" 서킷 브레이커에 기록되고,
+        재시도 예산 안에서 full jitter backoff로 재시도한다.
+
+        Raises:
+            TaGoApiError: TAGO API 호출 실패
+        """
+        if on_page is not None:
+            on_page()
+        try:
+            resp = await retry_with_backoff(
+                self._breaker.call,
+                self._request_page,
+                {**params, "pageNo": str(page_no)},
+                base_delay=UPSTREAM_RETRY_BASE_DELAY,
+                max_delay=UPSTREAM_RETRY_MAX_DELAY,
+                max_retries=UPSTREAM_RETRY_MAX,
+                retryable_exceptions=(httpx.RequestError, httpx.HTTPStatusError),
+                jitter=True,
+                budget=self._retry_budget,
             )
             resp.raise_for_status()
             data = resp.json()
+        except CircuitOpenError as e:
+            logger.warning("[TaGoService] 서킷 열림 - 호출 차단: %s", e)
+            raise TaGoApiError(detail="공공데이터 API 장애로 요청을 잠시 중단했습니다")
         except httpx.HTTPStatusError as e:
             logger.error("[TaGoService] HTTP 오류: %s", e)
             raise TaGoApiError(detail=f"API HTTP 오류: {e.response.status_code}")
@@ -257,46 +510,31 @@ class TaGoService:
             )
             raise TaGoApiError(detail=f"TAGO API 오류: [{result_code}] {result_msg}")
 
-        body = data.get("response", {}).get("body", {})
-        total_count = body.get("totalCount", 0)
-        if total_count == 0:
-            raise NoTrainsFoundError()
+        return data.get("response", {}).get("body", {})
 
+    async def _request_page(self, params: dict[str, str]) -> httpx.Response:
+        """TAGO API를 호출한다. 5xx 응답은 장애로 기록되도록 예외를 발생시킨다."""
+        async with track_upstream("tago", "fetch"):
+            resp = await self._http().get(
+                f"{TAGO_BASE_URL}/getStrtpntAlocFndTrainInfo", params=params,
+            )
+            if resp.status_code >= 500:
+                resp.raise_for_status()
+        return resp
+
+    @staticmethod
+    def _extract_items(body: dict) -> list[dict]:
+        """response.body에서 item 목록을 꺼낸다 (단일 항목 dict도 목록으로 변환)."""
         items = body.get("items", {})
         if not items or items == "":
-            raise NoTrainsFoundError()
+            return []
 
         item_list = items.get("item", [])
         # 단일 항목인 경우 리스트로 변환
         if isinstance(item_list, dict):
             item_list = [item_list]
 
-        train_list: list[TrainInfo] = []
-        for item in item_list:
-            try:
-                train_info = self._parse_train_item(item)
-
-                # 시간 필터: 지정된 시간 이후의 열차만 포함
-                if time:
-                    dep_pland = str(item.get("depplandtime", ""))
-                    if len(dep_pland) >= 12:
-                        dep_hhmm = dep_pland[8:12]  # HHmm 부분
-                        filter_hhmm = time[:4]  # HHmm 부분
-                        if dep_hhmm < filter_hhmm:
-                            continue
-
-                train_list.append(train_info)
-            except Exception as e:
-                logger.warning(
-                    "[TaGoService] 열차 정보 파싱 오류 (건너뜀): %s", e,
-                )
-                continue
-
-        if not train_list:
-            raise NoTrainsFoundError()
-
-        logger.info("[TaGoService] 조회 완료 - %d건", len(train_list))
-        return train_list
+        return list(item_list)
 
     @staticmethod
     def _parse_train_item(item: dict) -> TrainInfo:
@@ -342,6 +580,36 @@ class TaGoService:
         """전체 역명 → NAT 코드 매핑을 반환한다."""
         return dict(STATION_CODES)
 
+    def _http(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 (없으면 생성)"""
+        if self._client is None:
+            self._client = create_async_client(self._http_config, tago_transport)
+        return self._client
+
+    async def start(self):
+        """
+        HTTP 클라이언트를 만들고 TAGO 호스트로 연결을 미리 열어 둔다.
+
+        예열은 백그라운드에서 진행하므로 서버 시작을 지연시키지 않는다.
+        TAGO_HTTP_KEEP_WARM_SECONDS가 0이면 시작 시 한 번만 예열하므로,
+        예열한 연결은 요청이 없으면 keep-alive 유지 시간 뒤에 닫힌다.
+        카세트를 사용 중이면 (녹화/재생 모두) 예열 요청이 기록되거나 실패하지 않도록 예열하지 않는다.
+        """
+        client = self._http()
+        config = self._http_config
+        if get_cassette("tago") is not None or config.warm_connections <= 0:
+            return
+        self._warmup_task = asyncio.create_task(
+            keep_warm(client, TAGO_BASE_URL, config.warm_connections, config.keep_warm_interval)
+        )
+
     async def close(self):
-        """HTTP 클라이언트를 닫는다."""
-        await self._client.aclose()
+        """백그라운드 캐시 갱신과 연결 예열을 중단하고 HTTP 클라이언트를 닫는다."""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            self._warmup_task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
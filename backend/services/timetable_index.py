@@ -0,0 +1,279 @@
+"""
+TimetableIndex - TAGO 시간표 로컬 인덱스 (SQLite)
+역 쌍 × 날짜별 TAGO 시간표(원본 item 목록)를 로컬 SQLite에 저장하여
+미로그인 조회를 네트워크 호출 없이 처리한다.
+TimetablePrefetcher는 STATION_CODES의 모든 역 쌍에 대해 앞으로 N일치 시간표를
+일괄 수집하여 인덱스를 채우는 백그라운드 작업이다.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 한국 시간대 (KST = UTC+9)
+KST = timezone(timedelta(hours=9))
+
+
+class TimetableIndex:
+    """
+    (출발역 코드, 도착역 코드, 날짜, 차량종류코드) → 원본 item 목록 저장소.
+
+    - 경로: TAGO_INDEX_PATH (비어 있으면 인덱스 비활성화)
+    - 유효 기간: TAGO_INDEX_MAX_AGE_HOURS (기본 24). 수집 후 이 시간이 지난 항목은 무시
+
+    조회는 기본 키 조회 한 번이므로 이벤트 루프에서 직접 호출한다.
+    TestClient 등 다른 스레드에서도 접근할 수 있도록 lock으로 직렬화한다.
+    """
+
+    def __init__(self, path: str, max_age_seconds: Optional[float] = None):
+        self._path = path
+        self._max_age = (
+            max_age_seconds
+            if max_age_seconds is not None
+            else float(os.getenv("TAGO_INDEX_MAX_AGE_HOURS", "24")) * 3600
+        )
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS timetable (
+                    dep_code   TEXT NOT NULL,
+                    arr_code   TEXT NOT NULL,
+                    dep_date   TEXT NOT NULL,
+                    grade      TEXT NOT NULL DEFAULT '',
+                    items      TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (dep_code, arr_code, dep_date, grade)
+                ) WITHOUT ROWID
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_timetable_date ON timetable(dep_date)"
+            )
+            self._conn.commit()
+
+        logger.info("[TimetableIndex] 인덱스 열기 - %s", path)
+
+    @classmethod
+    def from_env(cls) -> Optional["TimetableIndex"]:
+        """TAGO_INDEX_PATH가 설정되어 있으면 인덱스를 생성한다. 없으면 None."""
+        path = os.getenv("TAGO_INDEX_PATH", "")
+        if not path:
+            return None
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return cls(path)
+
+    def get(
+        self, dep_code: str, arr_code: str, date: str, grade: Optional[str] = None
+    ) -> Optional[list[dict]]:
+        """저장된 item 목록을 반환한다. 없거나 유효 기간이 지났으면 None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT items, fetched_at FROM timetable "
+                "WHERE dep_code = ? AND arr_code = ? AND dep_date = ? AND grade = ?",
+                (dep_code, arr_code, date, grade or ""),
+            ).fetchone()
+        if row is None:
+            return None
+        items, fetched_at = row
+        if time.time() - fetched_at > self._max_age:
+            return None
+        return json.loads(items)
+
+    def put(
+        self,
+        dep_code: str,
+        arr_code: str,
+        date: str,
+        grade: Optional[str],
+        items: list[dict],
+    ) -> None:
+        """item 목록을 저장한다 (같은 키가 있으면 교체)."""
+        payload = json.dumps(items, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO timetable "
+                "(dep_code, arr_code, dep_date, grade, items, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (dep_code, arr_code, date, grade or "", payload, time.time()),
+            )
+            self._conn.commit()
+
+    def purge_before(self, date: str) -> int:
+        """date(YYYYMMDD) 이전 날짜의 항목을 삭제하고 삭제 건수를 반환한다."""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM timetable WHERE dep_date < ?", (date,)
+            )
+            self._conn.commit()
+            return cur.rowcount
+
+    def count(self) -> int:
+        """저장된 항목 수를 반환한다."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM timetable").fetchone()[0]
+
+    def close(self) -> None:
+        """DB 연결을 닫는다."""
+        with self._lock:
+            self._conn.close()
+
+
+class TimetablePrefetcher:
+    """
+    TAGO 시간표 일괄 수집 작업.
+
+    STATION_CODES의 모든 (출발, 도착) 역 쌍에 대해 오늘부터 N일치 시간표를 수집하여
+    TimetableIndex에 저장한다. 수집 주기마다 지난 날짜 항목은 정리한다.
+
+    - TAGO_PREFETCH_DAYS (기본 0): 수집할 일 수. 0이면 비활성화
+    - TAGO_PREFETCH_CONCURRENCY (기본 2): 동시 요청 수
+    - TAGO_PREFETCH_MAX_REQUESTS (기본 5000): 1회 수집당 최대 API 호출(페이지 요청) 수 (일일 쿼터 보호)
+    - TAGO_PREFETCH_INTERVAL_HOURS (기본 24): 수집 주기
+    """
+
+    def __init__(
+        self,
+        tago_service,
+        index: TimetableIndex,
+        days: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        max_requests: Optional[int] = None,
+        interval_seconds: Optional[float] = None,
+    ):
+        self._service = tago_service
+        self._index = index
+        self._days = days if days is not None else int(os.getenv("TAGO_PREFETCH_DAYS", "0"))
+        self._concurrency = concurrency or int(os.getenv("TAGO_PREFETCH_CONCURRENCY", "2"))
+        self._max_requests = max_requests or int(
+            os.getenv("TAGO_PREFETCH_MAX_REQUESTS", "5000")
+        )
+        self._interval = interval_seconds or float(
+            os.getenv("TAGO_PREFETCH_INTERVAL_HOURS", "24")
+        ) * 3600
+        self._task: Optional[asyncio.Task] = None
+        self._last_run: Optional[dict] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._days > 0
+
+    @staticmethod
+    def station_pairs() -> list[tuple[str, str]]:
+        """중복 코드를 제거한 모든 (출발역 코드, 도착역 코드) 쌍을 반환한다."""
+        from services.tago_service import STATION_CODES
+
+        codes = sorted(set(STATION_CODES.values()))
+        return list(itertools.permutations(codes, 2))
+
+    async def run_once(self) -> dict:
+        """
+        모든 역 쌍 × N일치 시간표를 한 번 수집한다.
+
+        가까운 날짜부터 수집하며, 실제 페이지 호출 수가 최대 요청 수에 이르면
+        남은 작업은 건너뛴다 (이미 진행 중인 작업이 있어 동시 수 × TAGO_MAX_PAGES만큼 넘을 수 있다).
+
+        Returns:
+            dict: 작업 요청/성공/실패/건너뜀 건수, API 호출 수와 소요 시간
+        """
+        today = datetime.now(KST).date()
+        dates = [
+            (today + timedelta(days=offset)).strftime("%Y%m%d")
+            for offset in range(self._days)
+        ]
+        jobs = [
+            (dep, arr, date)
+            for date in dates
+            for dep, arr in self.station_pairs()
+        ]
+
+        purged = self._index.purge_before(today.strftime("%Y%m%d"))
+        semaphore = asyncio.Semaphore(self._concurrency)
+        stats = {
+            "requested": 0, "succeeded": 0, "failed": 0, "skipped": 0,
+            "api_calls": 0, "purged": purged,
+        }
+        started = time.monotonic()
+
+        def count_page() -> None:
+            stats["api_calls"] += 1
+
+        async def fetch(dep: str, arr: str, date: str) -> None:
+            async with semaphore:
+                if stats["api_calls"] >= self._max_requests:
+                    stats["skipped"] += 1
+                    return
+                stats["requested"] += 1
+                try:
+                    await self._service.fetch_timetable(dep, arr, date, on_page=count_page)
+                    stats["succeeded"] += 1
+                except Exception as e:
+                    stats["failed"] += 1
+                    logger.warning(
+                        "[TimetablePrefetcher] 수집 실패 - %s -> %s %s: %s",
+                        dep, arr, date, e,
+                    )
+
+        logger.info(
+            "[TimetablePrefetcher] 수집 시작 - %d일, %d건 (동시 %d, 최대 API 호출 %d)",
+            self._days, len(jobs), self._concurrency, self._max_requests,
+        )
+        await asyncio.gather(*(fetch(*job) for job in jobs))
+
+        stats["elapsed_seconds"] = round(time.monotonic() - started, 1)
+        self._last_run = stats
+        if stats["skipped"]:
+            logger.warning(
+                "[TimetablePrefetcher] 최대 API 호출 수(%d) 도달 - %d/%d건 건너뜀"
+                " (TAGO_PREFETCH_MAX_REQUESTS 또는 TAGO_PREFETCH_DAYS 조정 필요)",
+                self._max_requests, stats["skipped"], len(jobs),
+            )
+        logger.info("[TimetablePrefetcher] 수집 완료 - %s", stats)
+        return stats
+
+    def start(self) -> None:
+        """주기적 수집 작업을 시작한다 (비활성화 상태면 무시)."""
+        if not self.enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._loop(), name="timetable-prefetch")
+
+    async def stop(self) -> None:
+        """주기적 수집 작업을 중단한다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error("[TimetablePrefetcher] 수집 작업 오류: %s", e)
+            await asyncio.sleep(self._interval)
+
+    def stats(self) -> dict:
+        """인덱스 크기와 마지막 수집 결과를 반환한다."""
+        return {
+            "enabled": self.enabled,
+            "entries": self._index.count(),
+            "last_run": self._last_run,
+        }
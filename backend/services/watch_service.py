@@ -0,0 +1,396 @@
+"""
+WatchService - 서버 측 좌석 감시 및 자동 예약 엔진
+클라이언트의 Timer.periodic 폴링 대신, 서버의 asyncio 스케줄러가
+설정된 주기로 KorailService.search_trains를 호출하고
+좌석이 생기는 즉시 (자동 예약이 켜져 있으면) 같은 이벤트 루프에서 예약을 시도한다.
+"""
+
+import asyncio
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from models.schemas import (
+    ReservationResponse,
+    TrainInfo,
+    WatchRequest,
+    WatchResponse,
+)
+from services.korail_service import (
+    AccountBlockedError,
+    KorailService,
+    KorailServiceError,
+    NoTrainsError,
+    RateLimitExceededError,
+    SessionExpiredError,
+    SoldOutError,
+)
+
+logger = logging.getLogger(__name__)
+
+# 한국 시간대 (KST = UTC+9)
+KST = timezone(timedelta(hours=9))
+
+# 감시 상태 (docs/feature_spec.md 5. 상태 전이도 기준)
+STATUS_SEARCHING = "searching"
+STATUS_RESERVING = "reserving"
+STATUS_FOUND = "found"
+STATUS_SUCCESS = "success"
+STATUS_FAILURE = "failure"
+STATUS_EXPIRED = "expired"
+STATUS_CANCELLED = "cancelled"
+
+ACTIVE_STATUSES = {STATUS_SEARCHING, STATUS_RESERVING}
+
+
+class WatchServiceError(Exception):
+    """WatchService 기본 예외"""
+
+    def __init__(self, error: str, code: str, detail: str):
+        self.error = error
+        self.code = code
+        self.detail = detail
+        super().__init__(detail)
+
+
+class WatchNotFoundError(WatchServiceError):
+    """감시 작업 없음"""
+
+    def __init__(self, detail: str = "감시 작업을 찾을 수 없습니다"):
+        super().__init__(error="NOT_FOUND", code="WATCH_001", detail=detail)
+
+
+class WatchLimitExceededError(WatchServiceError):
+    """감시 작업 수 초과"""
+
+    def __init__(self, detail: str = "동시에 실행할 수 있는 감시 작업 수를 초과했습니다"):
+        super().__init__(error="WATCH_LIMIT_EXCEEDED", code="WATCH_002", detail=detail)
+
+
+class _Watch:
+    """단일 감시 작업의 설정과 진행 상태."""
+
+    def __init__(self, owner: KorailService, request: WatchRequest):
+        now = datetime.now(KST)
+        self.watch_id = uuid.uuid4().hex[:12]
+        self.owner = owner
+        self.request = request
+        self.train_nos = {no.strip().lstrip("0") for no in request.train_nos}
+        self.status = STATUS_SEARCHING
+        self.created_at = now
+        self.expires_at = now + timedelta(minutes=request.max_duration_minutes)
+        self.finished_at: Optional[datetime] = None
+        self.last_checked_at: Optional[datetime] = None
+        self.poll_count = 0
+        self.consecutive_errors = 0
+        self.last_error: Optional[str] = None
+        self.matched_train: Optional[TrainInfo] = None
+        self.reservation: Optional[ReservationResponse] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ACTIVE_STATUSES
+
+    def finish(self, status: str, error: Optional[str] = None) -> None:
+        self.status = status
+        self.finished_at = datetime.now(KST)
+        if error is not None:
+            self.last_error = error
+
+    def to_response(self) -> WatchResponse:
+        req = self.request
+        return WatchResponse(
+            watch_id=self.watch_id,
+            status=self.status,
+            dep_station=req.dep_station,
+            arr_station=req.arr_station,
+            date=req.date,
+            time=req.time,
+            train_nos=req.train_nos,
+            seat_type=req.seat_type,
+            interval_seconds=req.interval_seconds,
+            auto_reserve=req.auto_reserve,
+            poll_count=self.poll_count,
+            created_at=self.created_at.isoformat(),
+            expires_at=self.expires_at.isoformat(),
+            last_checked_at=(
+                self.last_checked_at.isoformat() if self.last_checked_at else None
+            ),
+            matched_train=self.matched_train,
+            reservation=self.reservation,
+            last_error=self.last_error,
+        )
+
+
+class WatchService:
+    """
+    서버 측 좌석 감시 스케줄러.
+
+    감시 작업마다 asyncio Task 하나가 주기적으로 열차를 조회한다.
+    - 사용자별 최대 감시 수: WATCH_MAX_PER_SESSION (기본 5)
+    - 전체 최대 감시 수: WATCH_MAX_TOTAL (기본 200)
+    - 연속 오류 허용 횟수: WATCH_MAX_CONSECUTIVE_ERRORS (기본 3, 초과 시 중단)
+    - 종료된 감시 보관 시간: WATCH_RETENTION_SECONDS (기본 600)
+    """
+
+    def __init__(self):
+        self._max_per_session = int(os.getenv("WATCH_MAX_PER_SESSION", "5"))
+        self._max_total = int(os.getenv("WATCH_MAX_TOTAL", "200"))
+        self._max_consecutive_errors = int(
+            os.getenv("WATCH_MAX_CONSECUTIVE_ERRORS", "3")
+        )
+        self._retention = timedelta(
+            seconds=float(os.getenv("WATCH_RETENTION_SECONDS", "600"))
+        )
+        self._watches: dict[str, _Watch] = {}
+
+        logger.info(
+            "[WatchService] 초기화 완료 - 사용자별 %d건, 전체 %d건",
+            self._max_per_session, self._max_total,
+        )
+
+    async def create_watch(
+        self, owner: KorailService, request: WatchRequest
+    ) -> WatchResponse:
+        """
+        감시 작업을 등록하고 폴링을 시작한다.
+
+        Raises:
+            WatchLimitExceededError: 감시 작업 수 초과
+        """
+        self._prune()
+
+        active = [w for w in self._watches.values() if w.is_active]
+        owned = [w for w in active if w.owner is owner]
+        if len(owned) >= self._max_per_session or len(active) >= self._max_total:
+            raise WatchLimitExceededError()
+
+        watch = _Watch(owner, request)
+        self._watches[watch.watch_id] = watch
+        watch.task = asyncio.create_task(
+            self._poll(watch), name=f"watch-{watch.watch_id}"
+        )
+
+        logger.info(
+            "[WatchService] 감시 시작 - ID: %s, %s -> %s %s %s, 주기 %.1fs, 자동예약: %s",
+            watch.watch_id, request.dep_station, request.arr_station,
+            request.date, request.time, request.interval_seconds,
+            request.auto_reserve,
+        )
+        return watch.to_response()
+
+    def list_watches(self, owner: KorailService) -> list[WatchResponse]:
+        """사용자의 감시 작업 목록을 반환한다."""
+        self._prune()
+        return [
+            w.to_response() for w in self._watches.values() if w.owner is owner
+        ]
+
+    def get_watch(self, owner: KorailService, watch_id: str) -> WatchResponse:
+        """
+        감시 작업 상태를 반환한다.
+
+        Raises:
+            WatchNotFoundError: 감시 작업이 없거나 다른 사용자의 작업인 경우
+        """
+        return self._get_owned(owner, watch_id).to_response()
+
+    async def cancel_watch(self, owner: KorailService, watch_id: str) -> WatchResponse:
+        """
+        감시 작업을 중단한다.
+
+        Raises:
+            WatchNotFoundError: 감시 작업이 없거나 다른 사용자의 작업인 경우
+        """
+        watch = self._get_owned(owner, watch_id)
+        if watch.is_active:
+            watch.finish(STATUS_CANCELLED)
+            await self._stop_task(watch)
+            logger.info("[WatchService] 감시 중단 - ID: %s", watch_id)
+        return watch.to_response()
+
+    async def shutdown(self) -> None:
+        """실행 중인 모든 감시 작업을 중단한다."""
+        for watch in list(self._watches.values()):
+            if watch.is_active:
+                watch.finish(STATUS_CANCELLED)
+            await self._stop_task(watch)
+        logger.info("[WatchService] 전체 감시 작업 종료")
+
+    def _get_owned(self, owner: KorailService, watch_id: str) -> _Watch:
+        watch = self._watches.get(watch_id)
+        if watch is None or watch.owner is not owner:
+            raise WatchNotFoundError()
+        return watch
+
+    def _prune(self) -> None:
+        """보관 시간이 지난 종료된 감시 작업을 제거한다."""
+        cutoff = datetime.now(KST) - self._retention
+        expired = [
+            watch_id
+            for watch_id, w in self._watches.items()
+            if w.finished_at is not None and w.finished_at < cutoff
+        ]
+        for watch_id in expired:
+            del self._watches[watch_id]
+
+    @staticmethod
+    async def _stop_task(watch: _Watch) -> None:
+        task = watch.task
+        if task is None or task.done() or task is asyncio.current_task():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def _find_available(
+        self, watch: _Watch, trains: list[TrainInfo]
+    ) -> Optional[TrainInfo]:
+        """감시 조건에 맞고 좌석이 있는 첫 번째 열차를 찾는다."""
+        want_special = watch.request.seat_type.value == "special"
+        for train in trains:
+            if watch.train_nos and train.train_no.strip().lstrip("0") not in watch.train_nos:
+                continue
+            if want_special and train.special_seats:
+                return train
+            if not want_special and train.general_seats:
+                return train
+        return None
+
+    async def _poll(self, watch: _Watch) -> None:
+        """감시 작업 하나의 폴링 루프."""
+        req = watch.request
+        service = watch.owner
+
+        while watch.is_active:
+            # 세션 레지스트리에서 제거된 세션으로는 조회/예약하지 않는다
+            if service.is_closed:
+                watch.finish(STATUS_FAILURE, SessionExpiredError().detail)
+                logger.warning(
+                    "[WatchService] 감시 중단 (세션 종료) - ID: %s", watch.watch_id,
+                )
+                return
+
+            if datetime.now(KST) >= watch.expires_at:
+                watch.finish(STATUS_EXPIRED)
+                logger.info("[WatchService] 감시 만료 - ID: %s", watch.watch_id)
+                return
+
+            match: Optional[TrainInfo] = None
+            try:
+                trains = await service.search_trains(
+                    req.dep_station, req.arr_station, req.date, req.time,
+                )
+                match = self._find_available(watch, trains)
+                watch.consecutive_errors = 0
+            except NoTrainsError:
+                watch.consecutive_errors = 0
+            except (SessionExpiredError, AccountBlockedError) as e:
+                watch.finish(STATUS_FAILURE, e.detail)
+                logger.warning(
+                    "[WatchService] 감시 중단 (%s) - ID: %s", e.code, watch.watch_id,
+                )
+                return
+            except RateLimitExceededError:
+                # 계정 호출량 초과는 오류로 세지 않고 다음 주기에 다시 조회한다
+                logger.debug(
+                    "[WatchService] 호출량 초과, 이번 주기 건너뜀 - ID: %s", watch.watch_id,
+                )
+            except KorailServiceError as e:
+                watch.consecutive_errors += 1
+                watch.last_error = e.detail
+                logger.warning(
+                    "[WatchService] 조회 오류 %d/%d - ID: %s, %s",
+                    watch.consecutive_errors, self._max_consecutive_errors,
+                    watch.watch_id, e.detail,
+                )
+                if watch.consecutive_errors >= self._max_consecutive_errors:
+                    watch.finish(STATUS_FAILURE)
+                    return
+            except Exception as e:
+                # 예상하지 못한 오류로 Task가 끝나면 감시가 searching 상태로 남으므로 종료 처리한다
+                watch.finish(STATUS_FAILURE, "감시 중 알 수 없는 오류가 발생했습니다")
+                logger.exception(
+                    "[WatchService] 감시 중단 (예상하지 못한 오류) - ID: %s, %s",
+                    watch.watch_id, type(e).__name__,
+                )
+                return
+            finally:
+                watch.poll_count += 1
+                watch.last_checked_at = datetime.now(KST)
+
+            if match is not None:
+                watch.matched_train = match
+                if not req.auto_reserve:
+                    watch.finish(STATUS_FOUND)
+                    logger.info(
+                        "[WatchService] 좌석 발견 - ID: %s, 열차: %s",
+                        watch.watch_id, match.train_no,
+                    )
+                    return
+
+                if await self._reserve(watch, match):
+                    return
+
+            await asyncio.sleep(req.interval_seconds)
+
+    async def _reserve(self, watch: _Watch, train: TrainInfo) -> bool:
+        """
+        발견한 열차를 즉시 예약한다.
+
+        Returns:
+            bool: 감시가 종료되었으면 True (성공 또는 복구 불가능한 실패),
+                  매진 경쟁에서 밀려 계속 감시해야 하면 False
+        """
+        req = watch.request
+        watch.status = STATUS_RESERVING
+        logger.info(
+            "[WatchService] 좌석 발견, 즉시 예약 시도 - ID: %s, 열차: %s",
+            watch.watch_id, train.train_no,
+        )
+
+        try:
+            watch.reservation = await watch.owner.reserve(
+                train.train_no,
+                req.seat_type.value,
+                dep=req.dep_station,
+                arr=req.arr_station,
+                date=req.date,
+                time=req.time,
+                handle=train.handle,
+            )
+        except SoldOutError:
+            # 다른 예약자에게 좌석을 빼앗긴 경우 계속 감시한다
+            watch.status = STATUS_SEARCHING
+            logger.info("[WatchService] 예약 경쟁 실패, 감시 계속 - ID: %s", watch.watch_id)
+            return False
+        except (SessionExpiredError, AccountBlockedError) as e:
+            watch.finish(STATUS_FAILURE, e.detail)
+            return True
+        except KorailServiceError as e:
+            watch.status = STATUS_SEARCHING
+            watch.last_error = e.detail
+            logger.warning(
+                "[WatchService] 예약 실패, 감시 계속 - ID: %s, %s",
+                watch.watch_id, e.detail,
+            )
+            return False
+        except Exception as e:
+            watch.finish(STATUS_FAILURE, "예약 중 알 수 없는 오류가 발생했습니다")
+            logger.exception(
+                "[WatchService] 감시 중단 (예상하지 못한 예약 오류) - ID: %s, %s",
+                watch.watch_id, type(e).__name__,
+            )
+            return True
+
+        watch.finish(STATUS_SUCCESS)
+        logger.info(
+            "[WatchService] 자동 예약 성공 - ID: %s, 예약번호: %s",
+            watch.watch_id, watch.reservation.reservation_id,
+        )
+        return True
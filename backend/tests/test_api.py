@@ -5,6 +5,7 @@ FastAPI TestClient를 사용하여 각 API 엔드포인트의 요청/응답을 
 korail2 실제 호출은 하지 않으며, KorailService를 모킹하여 테스트한다.
 """
 
+import json
 import sys
 import os
 from datetime import datetime, timedelta, timezone
@@ -14,11 +15,19 @@ import pytest
 
 # backend 디렉토리를 import 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+# 예약 저장소는 파일 대신 메모리를 사용한다 (기본값은 data/reservations.sqlite3)
+os.environ.setdefault("RESERVATION_STORE_PATH", ":memory:")
 
 from fastapi.testclient import TestClient
 
 from main import app
-from api.deps import get_korail_service, verify_session
+from api.middleware import ProfilingMiddleware, get_profile_store, get_route_latency
+from api.deps import (
+    get_korail_service,
+    get_session_registry,
+    get_watch_service,
+    verify_session,
+)
 from services.korail_service import (
     KorailService,
     LoginFailedError,
@@ -26,8 +35,13 @@ from services.korail_service import (
     SoldOutError,
     KorailServerError,
     NoTrainsError,
+    RateLimitExceededError,
+    ReservationNotFoundError,
 )
 from models.schemas import TrainInfo, ReservationResponse
+from services.session_registry import KorailSessionRegistry
+from services.watch_service import WatchService, WatchLimitExceededError
+from models.schemas import WatchResponse
 
 # 한국 시간대
 KST = timezone(timedelta(hours=9))
@@ -100,6 +114,46 @@ class TestHealthCheck:
         assert data["status"] == "ok"
         assert "service" in data
 
+    def test_route_latency_uses_route_template(self, client, mock_service):
+        """라우트별 지연 시간은 경로 파라미터가 아닌 라우트 템플릿으로 집계한다."""
+        get_route_latency().clear()
+        mock_service.get_cancel_verification = MagicMock(return_value=None)
+
+        client.get("/api/reservation/R1/cancellation")
+        client.get("/api/reservation/R2/cancellation")
+        client.get("/no-such-path")
+        routes = client.get("/health").json()["routes"]
+
+        entry = routes["GET /api/reservation/{reservation_id}/cancellation"]
+        assert entry["count"] == 2
+        assert entry["p95_ms"] is not None
+        assert routes["GET <unmatched>"]["count"] == 1
+
+    def test_metrics_exposes_routes_and_error_codes(self, client, mock_service):
+        """/metrics는 라우트별 히스토그램과 에러 코드별 카운터를 내보낸다."""
+        mock_service.get_cancel_verification = MagicMock(return_value=None)
+        client.get("/api/reservation/R1/cancellation")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert (
+            'http_request_duration_seconds_count{method="GET",'
+            'route="/api/reservation/{reservation_id}/cancellation"}'
+        ) in response.text
+        assert 'api_errors_total{code="RESERVE_003"}' in response.text
+
+    @pytest.mark.asyncio
+    async def test_global_handler_maps_rate_limit_to_429(self):
+        """라우트에서 처리하지 못한 호출량 제한 오류는 429로 응답한다."""
+        from main import korail_exception_handler
+
+        response = await korail_exception_handler(MagicMock(), RateLimitExceededError())
+
+        assert response.status_code == 429
+        assert json.loads(response.body)["code"] == "SYSTEM_004"
+
 
 # ──────────────────────────────────────────────
 # POST /api/auth/login 테스트
@@ -195,6 +249,105 @@ class TestAuthLogin:
         assert "code" in detail
         assert "detail" in detail
 
+    def test_rate_limit_status(self, client, mock_service):
+        """현재 계정의 호출량 제한 상태를 반환한다."""
+        mock_service.rate_limit_stats.return_value = {
+            "rate_per_second": 1.0,
+            "burst": 5,
+            "reserved": 2,
+            "tokens": 3.5,
+            "high_waiting": 0,
+            "granted_high": 1,
+            "granted_low": 4,
+            "throttled": 2,
+            "timeouts": 0,
+        }
+
+        response = client.get("/api/auth/rate-limit")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["tokens"] == 3.5
+        assert data["throttled"] == 2
+
+
+class TestSessionVerification:
+    """토큰 기반 세션 검증 테스트"""
+
+    @pytest.fixture
+    def registry_client(self):
+        """세션 레지스트리만 교체한 TestClient를 반환한다 (verify_session은 실제 동작)."""
+        registry = KorailSessionRegistry(max_sessions=10, idle_ttl_seconds=60)
+
+        async def override_get_session_registry():
+            return registry
+
+        app.dependency_overrides[get_session_registry] = override_get_session_registry
+        yield TestClient(app), registry
+        app.dependency_overrides.clear()
+
+    def test_login_registers_session(self, registry_client):
+        """로그인 성공 시 발급된 토큰으로 세션이 등록된다."""
+        client, registry = registry_client
+        service = MagicMock(spec=KorailService)
+        service.login = AsyncMock(
+            return_value={
+                "session_token": "token_a",
+                "expires_at": "2026-02-02T23:59:59+09:00",
+                "message": "로그인 성공",
+            }
+        )
+
+        async def override_get_korail_service():
+            return service
+
+        app.dependency_overrides[get_korail_service] = override_get_korail_service
+
+        response = client.post(
+            "/api/auth/login",
+            json={"korail_id": "test_user", "korail_pw": "test_pass"},
+        )
+
+        assert response.status_code == 200
+        service.is_session_valid.return_value = True
+        assert registry.get("token_a") is service
+
+    def test_unknown_token_is_rejected(self, registry_client):
+        """등록되지 않은 토큰이면 401을 반환한다."""
+        client, registry = registry_client
+        service = MagicMock(spec=KorailService)
+        service.is_session_valid.return_value = True
+        registry.register("token_a", service)
+
+        response = client.get(
+            "/api/reservation",
+            headers={"Authorization": "Bearer token_b"},
+        )
+
+        assert response.status_code == 401
+        assert response.json()["detail"]["code"] == "AUTH_003"
+
+    def test_token_resolves_to_own_session(self, registry_client):
+        """토큰 소유자의 세션으로 요청이 처리된다."""
+        client, registry = registry_client
+        alice = MagicMock(spec=KorailService)
+        alice.is_session_valid.return_value = True
+        alice.list_reservations = AsyncMock(return_value=[])
+        bob = MagicMock(spec=KorailService)
+        bob.is_session_valid.return_value = True
+        bob.list_reservations = AsyncMock(return_value=[])
+        registry.register("token_alice", alice)
+        registry.register("token_bob", bob)
+
+        response = client.get(
+            "/api/reservation",
+            headers={"Authorization": "Bearer token_bob"},
+        )
+
+        assert response.status_code == 200
+        bob.list_reservations.assert_awaited_once()
+        alice.list_reservations.assert_not_awaited()
+
 
 # ──────────────────────────────────────────────
 # GET /api/trains/search 테스트
@@ -343,6 +496,128 @@ class TestTrainSearch:
         assert "code" in detail
         assert "detail" in detail
 
+    def test_batch_search_returns_result_per_query(
+        self, client, mock_service, sample_train_info,
+    ):
+        """일괄 조회는 조건별 결과와 에러를 요청 순서대로 반환한다."""
+
+        async def search(dep, arr, date, time):
+            if arr == "대전":
+                raise NoTrainsError(detail="조회 결과 없음")
+            return [sample_train_info]
+
+        mock_service.search_trains = AsyncMock(side_effect=search)
+        date = self._future_date()
+
+        response = client.post(
+            "/api/trains/search/batch",
+            headers={"Authorization": "Bearer test-token"},
+            json={
+                "queries": [
+                    {"dep": "서울", "arr": "부산", "date": date, "time": "090000"},
+                    {"dep": "서울", "arr": "대전", "date": date, "time": "090000"},
+                    {"dep": "서울", "arr": "서울", "date": date, "time": "090000"},
+                ],
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["status_code"] for r in results] == [200, 404, 400]
+        assert results[0]["trains"][0]["train_no"] == "KTX-101"
+        assert results[0]["error"] is None
+        assert results[1]["error"]["code"] == "SEARCH_002"
+        assert results[2]["error"]["code"] == "SEARCH_001"
+        assert mock_service.search_trains.await_count == 2
+
+    def test_batch_search_rejects_empty_queries(self, client):
+        """조회 조건이 없으면 422를 반환한다."""
+        response = client.post("/api/trains/search/batch", json={"queries": []})
+
+        assert response.status_code == 422
+
+    def test_range_search_streams_one_line_per_date(
+        self, client, mock_service, sample_train_info,
+    ):
+        """날짜 범위 조회는 날짜별 결과를 NDJSON 한 줄씩 반환한다."""
+        start = datetime.now(KST) + timedelta(days=7)
+        dates = [(start + timedelta(days=i)).strftime("%Y%m%d") for i in range(3)]
+
+        async def search(dep, arr, date, time):
+            if date == dates[1]:
+                raise NoTrainsError(detail="조회 결과 없음")
+            return [sample_train_info]
+
+        mock_service.search_trains = AsyncMock(side_effect=search)
+
+        response = client.get(
+            "/api/trains/search/range",
+            headers={"Authorization": "Bearer test-token"},
+            params={
+                "dep": "서울",
+                "arr": "부산",
+                "date_from": dates[0],
+                "date_to": dates[2],
+                "time": "090000",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        by_date = {line["date"]: line for line in lines}
+        assert sorted(by_date) == dates
+        assert by_date[dates[0]]["trains"][0]["train_no"] == "KTX-101"
+        assert by_date[dates[1]]["status_code"] == 404
+        assert by_date[dates[1]]["error"]["code"] == "SEARCH_002"
+
+    def test_range_search_rejects_too_wide_window(self, client):
+        """최대 일 수를 넘는 날짜 범위는 400을 반환한다."""
+        start = datetime.now(KST) + timedelta(days=1)
+        response = client.get(
+            "/api/trains/search/range",
+            params={
+                "dep": "서울",
+                "arr": "부산",
+                "date_from": start.strftime("%Y%m%d"),
+                "date_to": (start + timedelta(days=30)).strftime("%Y%m%d"),
+            },
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "SEARCH_001"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_korail_searches_are_not_shared_across_sessions(
+        self, sample_train_info
+    ):
+        """다른 세션의 동시 korail2 조회는 각자의 세션으로 실행된다."""
+        import asyncio
+
+        from api.routes.trains import _search
+        from services.single_flight import SingleFlight
+
+        flight = SingleFlight("test-search")
+        services = []
+        for token in ("token-a", "token-b"):
+            service = MagicMock(spec=KorailService)
+            service.session_token = token
+
+            async def search(*args):
+                await asyncio.sleep(0.01)
+                return [sample_train_info]
+
+            service.search_trains = AsyncMock(side_effect=search)
+            services.append(service)
+
+        await asyncio.gather(*(
+            _search("서울", "부산", "20260210", "090000", True, service, MagicMock(), flight)
+            for service in services
+        ))
+
+        for service in services:
+            service.search_trains.assert_awaited_once()
+
 
 # ──────────────────────────────────────────────
 # POST /api/reservation 테스트
@@ -477,3 +752,246 @@ class TestReservation:
         assert "error" in detail
         assert "code" in detail
         assert "detail" in detail
+
+
+    def test_cancel_returns_pending_verification(self, client, mock_service):
+        """취소 응답에 확인 상태가 포함되고, 확인 결과를 따로 조회할 수 있다."""
+        mock_service.cancel_reservation = AsyncMock(
+            return_value={
+                "reservation_id": "R20260202ABC",
+                "status": "cancelled",
+                "message": "예약이 취소되었습니다",
+                "cancelled_at": datetime.now(KST).isoformat(),
+                "verification": "pending",
+            }
+        )
+        mock_service.get_cancel_verification = MagicMock(return_value="confirmed")
+
+        response = client.delete("/api/reservation/R20260202ABC")
+        assert response.status_code == 200
+        assert response.json()["verification"] == "pending"
+
+        response = client.get("/api/reservation/R20260202ABC/cancellation")
+        assert response.status_code == 200
+        assert response.json() == {
+            "reservation_id": "R20260202ABC",
+            "verification": "confirmed",
+        }
+
+    def test_cancellation_status_unknown(self, client, mock_service):
+        """이 세션에서 취소한 예약이 아니면 404를 반환한다."""
+        mock_service.get_cancel_verification = MagicMock(return_value=None)
+
+        response = client.get("/api/reservation/R404/cancellation")
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["code"] == "RESERVE_003"
+
+
+    def test_cancel_batch_per_id_results(self, client, mock_service):
+        """일괄 취소는 항목별 상태 코드와 결과를 반환한다."""
+        mock_service.cancel_reservations = AsyncMock(
+            return_value=[
+                ("R1", {
+                    "reservation_id": "R1",
+                    "status": "cancelled",
+                    "message": "예약이 취소되었습니다",
+                    "cancelled_at": datetime.now(KST).isoformat(),
+                    "verification": "pending",
+                }),
+                ("R2", ReservationNotFoundError()),
+            ]
+        )
+
+        response = client.post(
+            "/api/reservation/cancel-batch",
+            json={"reservation_ids": ["R1", "R2"]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["cancelled"] == 1
+        assert [r["status_code"] for r in data["results"]] == [200, 404]
+        assert data["results"][0]["result"]["status"] == "cancelled"
+        assert data["results"][1]["error"]["code"] == "RESERVE_003"
+
+    def test_cancel_batch_empty_ids(self, client):
+        """예약 번호가 없으면 422를 반환한다."""
+        response = client.post(
+            "/api/reservation/cancel-batch", json={"reservation_ids": []},
+        )
+
+        assert response.status_code == 422
+
+
+# ──────────────────────────────────────────────
+# /api/watches 테스트
+# ──────────────────────────────────────────────
+
+
+class TestWatches:
+    """좌석 감시 API 테스트"""
+
+    def _future_date(self) -> str:
+        future = datetime.now(KST) + timedelta(days=7)
+        return future.strftime("%Y%m%d")
+
+    @pytest.fixture
+    def watch_service(self, client):
+        service = MagicMock(spec=WatchService)
+
+        async def override_get_watch_service():
+            return service
+
+        app.dependency_overrides[get_watch_service] = override_get_watch_service
+        return service
+
+    def _watch_response(self, date: str) -> WatchResponse:
+        now = datetime.now(KST)
+        return WatchResponse(
+            watch_id="w1",
+            status="searching",
+            dep_station="서울",
+            arr_station="부산",
+            date=date,
+            time="090000",
+            seat_type="general",
+            interval_seconds=10.0,
+            auto_reserve=True,
+            poll_count=0,
+            created_at=now.isoformat(),
+            expires_at=(now + timedelta(hours=1)).isoformat(),
+        )
+
+    def test_create_watch(self, client, watch_service, mock_service):
+        """감시 등록 시 watch_id와 상태를 반환한다."""
+        date = self._future_date()
+        watch_service.create_watch = AsyncMock(
+            return_value=self._watch_response(date)
+        )
+
+        response = client.post(
+            "/api/watches",
+            json={
+                "dep_station": "서울",
+                "arr_station": "부산",
+                "date": date,
+                "time": "090000",
+                "auto_reserve": True,
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["watch_id"] == "w1"
+        assert data["status"] == "searching"
+        owner, request = watch_service.create_watch.await_args.args
+        assert owner is mock_service
+        assert request.auto_reserve is True
+
+    def test_create_watch_invalid_station(self, client, watch_service):
+        """유효하지 않은 역명이면 400을 반환한다."""
+        response = client.post(
+            "/api/watches",
+            json={
+                "dep_station": "없는역",
+                "arr_station": "부산",
+                "date": self._future_date(),
+            },
+        )
+
+        assert response.status_code == 400
+        watch_service.create_watch.assert_not_called()
+
+    def test_create_watch_interval_too_short(self, client, watch_service):
+        """조회 주기가 너무 짧으면 422를 반환한다."""
+        response = client.post(
+            "/api/watches",
+            json={
+                "dep_station": "서울",
+                "arr_station": "부산",
+                "date": self._future_date(),
+                "interval_seconds": 0.5,
+            },
+        )
+
+        assert response.status_code == 422
+
+    def test_create_watch_limit_exceeded(self, client, watch_service):
+        """감시 작업 수 초과 시 429를 반환한다."""
+        watch_service.create_watch = AsyncMock(
+            side_effect=WatchLimitExceededError()
+        )
+
+        response = client.post(
+            "/api/watches",
+            json={
+                "dep_station": "서울",
+                "arr_station": "부산",
+                "date": self._future_date(),
+            },
+        )
+
+        assert response.status_code == 429
+        assert response.json()["detail"]["code"] == "WATCH_002"
+
+
+# ──────────────────────────────────────────────
+# 요청 프로파일링 / /api/admin 테스트
+# ──────────────────────────────────────────────
+
+
+class TestProfiling:
+    """요청 프로파일링 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def admin_token(self, monkeypatch):
+        monkeypatch.setenv("PROFILE_ADMIN_TOKEN", "secret")
+        get_profile_store().clear()
+
+    def _profiled_app(self):
+        from fastapi import FastAPI
+
+        inner = FastAPI()
+
+        @inner.get("/ping")
+        async def ping():
+            return {"ok": True}
+
+        inner.add_middleware(ProfilingMiddleware)
+        return TestClient(inner)
+
+    def test_profiles_only_with_matching_token(self):
+        """토큰이 일치하는 요청만 프로파일링하고 ID를 응답 헤더로 알려 준다."""
+        profiled = self._profiled_app()
+
+        assert "x-profile-id" not in profiled.get("/ping").headers
+        assert "x-profile-id" not in profiled.get(
+            "/ping", headers={"X-Profile-Token": "wrong"}
+        ).headers
+
+        response = profiled.get("/ping", headers={"X-Profile-Token": "secret"})
+
+        profile = get_profile_store().get(response.headers["x-profile-id"])
+        assert response.json() == {"ok": True}
+        assert profile["path"] == "/ping"
+        assert "cumulative" in profile["stats"]
+
+    def test_admin_profile_endpoint(self, client):
+        """관리자 토큰으로 저장된 프로파일을 조회하고, 토큰이 없으면 403을 반환한다."""
+        response = self._profiled_app().get("/ping", headers={"X-Profile-Token": "secret"})
+        profile_id = response.headers["x-profile-id"]
+
+        assert client.get(f"/api/admin/profiles/{profile_id}").status_code == 403
+
+        response = client.get(
+            f"/api/admin/profiles/{profile_id}", headers={"X-Admin-Token": "secret"},
+        )
+        assert response.status_code == 200
+        assert response.text.startswith("# GET /ping")
+
+        response = client.get(
+            "/api/admin/profiles/unknown", headers={"X-Admin-Token": "secret"},
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"]["code"] == "ADMIN_002"
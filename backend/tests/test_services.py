@@ -9,16 +9,73 @@ korail2 실제 호출은 하지 않으며, 모든 외부 의존성을 모킹한
 
 import sys
 import os
+import gzip
+import json
 import asyncio
+import threading
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 from unittest.mock import AsyncMock, patch, MagicMock, PropertyMock
 
+import httpx
 import pytest
 
 # backend 디렉토리를 import 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
-from services.retry_service import exponential_backoff, retry_with_backoff
+# 예약 저장소는 파일 대신 메모리를 사용한다 (기본값은 data/reservations.sqlite3)
+os.environ.setdefault("RESERVATION_STORE_PATH", ":memory:")
+
+from services.retry_service import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryBudget,
+    exponential_backoff,
+    retry_with_backoff,
+)
+from services.executor_service import KorailExecutor, ExecutorSaturatedError
+from services.session_registry import KorailSessionRegistry
+from services.single_flight import SingleFlight
+from services.cache_service import TTLCache
+from services.metrics import (
+    Counter,
+    Histogram,
+    TAGO_TRUNCATED,
+    UPSTREAM_DURATION,
+    UPSTREAM_ERRORS,
+    UPSTREAM_IN_FLIGHT,
+    render_metrics,
+    track_upstream,
+)
+from services.reservation_store import ReservationStore, owner_key
+from services.rate_limiter import (
+    AccountRateGovernor,
+    RateLimitTimeout,
+    TokenBucket,
+    get_account_governor,
+)
+from services.timetable_index import TimetableIndex, TimetablePrefetcher
+from korail2.korail2 import KORAIL_CANCEL, NoResultsError, SoldOutError as KorailSoldOutError
+from services.cassette import (
+    Cassette,
+    RecordingAdapter,
+    RecordingTransport,
+    ReplayAdapter,
+    ReplayTransport,
+)
+from services.http_client import HttpClientConfig, create_async_client, keep_warm, warm_up
+from services.korail_simulator import SeatWorld, SimulatedKorail, reset_world
+from services.tago_service import TaGoService, NoTrainsFoundError, TaGoApiError
+from services.watch_service import (
+    WatchService,
+    WatchLimitExceededError,
+    WatchNotFoundError,
+)
+from models.schemas import (
+    ReservationDetailResponse,
+    ReservationResponse,
+    TrainInfo,
+    WatchRequest,
+)
 from services.korail_service import (
     KorailService,
     KorailServiceError,
@@ -29,6 +86,11 @@ from services.korail_service import (
     KorailServerError,
     SoldOutError,
     ReservationNotFoundError,
+    RateLimitExceededError,
+    _match_indexes,
+    _reservation_generations,
+    _reservation_lists,
+    _train_handles,
 )
 
 # 한국 시간대
@@ -236,6 +298,127 @@ class TestRetryWithBackoff:
 
         assert result == 6
 
+    @pytest.mark.asyncio
+    async def test_full_jitter_delay_within_bound(self):
+        """jitter=True면 대기 시간은 0 ~ 지수 대기 시간 사이의 난수이다."""
+        mock_func = AsyncMock(side_effect=[ValueError(), ValueError(), "ok"])
+
+        with patch("services.retry_service.asyncio.sleep", new=AsyncMock()) as sleep, \
+                patch("services.retry_service.random.uniform", side_effect=lambda a, b: b / 2):
+            result = await retry_with_backoff(
+                mock_func, base_delay=1.0, max_delay=10.0, max_retries=2, jitter=True,
+            )
+
+        assert result == "ok"
+        assert [c.args[0] for c in sleep.await_args_list] == [0.5, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_budget_stops_retries(self):
+        """재시도 예산이 바닥나면 재시도 없이 즉시 예외를 전파한다."""
+        budget = RetryBudget(ratio=0, max_tokens=1)
+        mock_func = AsyncMock(side_effect=ValueError("실패"))
+
+        with pytest.raises(ValueError):
+            await retry_with_backoff(
+                mock_func, base_delay=0.001, max_retries=5, budget=budget,
+            )
+
+        # 최초 1회 + 예산 1회분 재시도
+        assert mock_func.await_count == 2
+        assert budget.stats()["exhausted"] == 1
+
+
+class TestCircuitBreaker:
+    """업스트림 서킷 브레이커 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_threshold_and_fails_fast(self):
+        """연속 실패가 임계치에 도달하면 열리고, 이후 호출은 함수를 실행하지 않는다."""
+        breaker = CircuitBreaker(
+            "test", (OSError,), failure_threshold=2, reset_timeout=30,
+        )
+        failing = AsyncMock(side_effect=OSError("연결 실패"))
+
+        for _ in range(2):
+            with pytest.raises(OSError):
+                await breaker.call(failing)
+
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(failing)
+        assert failing.await_count == 2
+        assert breaker.state == "open"
+        assert breaker.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_business_errors_do_not_open(self):
+        """failure_exceptions가 아닌 예외는 장애로 세지 않는다."""
+        breaker = CircuitBreaker(
+            "test", (OSError,), failure_threshold=1, reset_timeout=30,
+        )
+
+        with pytest.raises(ValueError):
+            await breaker.call(AsyncMock(side_effect=ValueError("매진")))
+
+        assert breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe(self):
+        """reset_timeout 이후 시험 호출 1건을 허용하고, 성공하면 닫힌다."""
+        breaker = CircuitBreaker(
+            "test", (OSError,), failure_threshold=1, reset_timeout=10,
+        )
+        with patch("services.retry_service.time.monotonic", return_value=100.0):
+            with pytest.raises(OSError):
+                await breaker.call(AsyncMock(side_effect=OSError()))
+
+        with patch("services.retry_service.time.monotonic", return_value=111.0):
+            assert breaker.state == "half_open"
+            # 시험 호출 실패 시 다시 열림
+            with pytest.raises(OSError):
+                await breaker.call(AsyncMock(side_effect=OSError()))
+            assert breaker.state == "open"
+
+        with patch("services.retry_service.time.monotonic", return_value=122.0):
+            assert await breaker.call(AsyncMock(return_value="ok")) == "ok"
+            assert breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_open_korail_circuit_fails_fast(self):
+        """코레일 서킷이 열려 있으면 워커 풀에 제출하지 않고 KorailServerError를 발생시킨다."""
+        service = _logged_in_service("token")
+        service._korail = MagicMock()
+        service._breaker = CircuitBreaker(
+            "korail-test", (OSError,), failure_threshold=1, reset_timeout=30,
+        )
+        service._breaker._record_failure()
+
+        with pytest.raises(KorailServerError) as exc_info:
+            await service.search_trains("서울", "부산", "20260210", "090000")
+
+        assert "장애" in exc_info.value.detail
+        service._executor.run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tago_5xx_is_retried(self):
+        """TAGO 5xx 응답은 재시도 예산 안에서 재시도한다."""
+        responses = [
+            httpx.Response(503),
+            httpx.Response(200, json=_tago_payload([_tago_item("101", "0800")])),
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return responses.pop(0)
+
+        service = _tago_service_with(handler)
+        service._retry_budget = RetryBudget(ratio=0, max_tokens=1)
+
+        with patch("services.retry_service.asyncio.sleep", new=AsyncMock()):
+            trains = await service.search_trains("서울", "부산", "20260210")
+
+        assert [t.train_no for t in trains] == ["101"]
+        assert service._breaker.stats()["consecutive_failures"] == 0
+        await service.close()
+
 
 # ──────────────────────────────────────────────
 # KorailService 테스트
@@ -372,6 +555,27 @@ class TestKorailServiceLogin:
             with pytest.raises(KorailServerError):
                 await service.login("test_id", "test_pw")
 
+    @pytest.mark.asyncio
+    async def test_login_uses_configured_client_class(self, monkeypatch):
+        """KORAIL_CLIENT로 지정한 대역 클래스로 로그인하고 조회/예약/취소한다."""
+        monkeypatch.setenv("KORAIL_CLIENT", "services.korail_simulator:SimulatedKorail")
+        monkeypatch.setenv("KORAIL_SIM_SOLD_OUT_RATIO", "0")
+        monkeypatch.setenv("KORAIL_SIM_EVENTS_PER_MINUTE", "0")
+        reset_world(seed=0, clock=lambda: 0.0)
+        service = KorailService(store=ReservationStore(":memory:"))
+
+        await service.login("bench", "bench")
+        trains = await service.search_trains("서울", "부산", "20260210", "000000")
+        result = await service.reserve(
+            trains[0].train_no, "general", "서울", "부산", "20260210", "000000",
+            handle=trains[0].handle,
+        )
+        cancelled = await service.cancel_reservation(result.reservation_id)
+        await asyncio.gather(*service._background_tasks)
+
+        assert type(service._korail).__name__ == "SimulatedKorail"
+        assert cancelled["status"] == "cancelled"
+
 
 class TestKorailServiceSession:
     """KorailService 세션 관리 테스트"""
@@ -526,3 +730,1721 @@ class TestKorailServiceHelpers:
         assert KorailService._has_seats("") is False
         assert KorailService._has_seats(False) is False
         assert KorailService._has_seats(0) is False
+
+
+# ──────────────────────────────────────────────
+# KorailExecutor 테스트
+# ──────────────────────────────────────────────
+
+
+class TestKorailExecutor:
+    """korail2 전용 워커 풀 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result(self):
+        """블로킹 함수의 결과를 그대로 반환한다."""
+        executor = KorailExecutor(max_workers=2, max_queue=4)
+
+        result = await executor.run(lambda a, b=0: a + b, 1, b=2)
+
+        assert result == 3
+        stats = executor.stats()
+        assert stats["completed"] == 1
+        assert stats["queue_depth"] == 0
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_propagates_exception(self):
+        """블로킹 함수의 예외를 그대로 전파하고 실패로 집계한다."""
+        executor = KorailExecutor(max_workers=1, max_queue=4)
+
+        def boom():
+            raise ValueError("실패")
+
+        with pytest.raises(ValueError):
+            await executor.run(boom)
+
+        assert executor.stats()["failed"] == 1
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_does_not_block_event_loop(self):
+        """느린 korail2 호출 중에도 이벤트 루프는 다른 작업을 처리한다."""
+        import threading
+
+        executor = KorailExecutor(max_workers=1, max_queue=4)
+        release = threading.Event()
+
+        task = asyncio.create_task(executor.run(release.wait, 5))
+        # 워커가 블로킹된 상태에서도 이벤트 루프 작업이 진행된다
+        await asyncio.sleep(0.01)
+        assert not task.done()
+        release.set()
+
+        assert await task is True
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        """대기열이 가득 차면 ExecutorSaturatedError를 발생시킨다."""
+        import threading
+
+        executor = KorailExecutor(max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        running = asyncio.create_task(executor.run(release.wait, 5))
+        await asyncio.sleep(0.01)
+        queued = asyncio.create_task(executor.run(lambda: "queued"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run(lambda: "rejected")
+
+        release.set()
+        await running
+        assert await queued == "queued"
+        assert executor.stats()["rejected"] == 1
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_queued_call_releases_queue_slot(self):
+        """대기 중에 취소되어 실행되지 않은 작업은 대기열 깊이에서 빠진다."""
+        import threading
+
+        executor = KorailExecutor(max_workers=1, max_queue=4)
+        release = threading.Event()
+
+        running = asyncio.create_task(executor.run(release.wait, 5))
+        await asyncio.sleep(0.01)
+        queued = asyncio.create_task(executor.run(lambda: "queued"))
+        await asyncio.sleep(0)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+        release.set()
+        await running
+        assert executor.stats()["queue_depth"] == 0
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_releases_queued_calls(self):
+        """shutdown으로 취소된 대기 작업도 대기열 깊이에서 빠진다."""
+        import threading
+
+        executor = KorailExecutor(max_workers=1, max_queue=4)
+        release = threading.Event()
+
+        running = asyncio.create_task(executor.run(release.wait, 5))
+        await asyncio.sleep(0.01)
+        queued = asyncio.create_task(executor.run(lambda: "queued"))
+        await asyncio.sleep(0)
+        executor.shutdown()
+        release.set()
+        await running
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+        assert executor.stats()["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_service_maps_saturation_to_server_error(self):
+        """KorailService는 대기열 포화를 KorailServerError로 변환한다."""
+        executor = MagicMock()
+        executor.run = AsyncMock(side_effect=ExecutorSaturatedError())
+        service = KorailService(executor=executor)
+        service._session_token = "test_token"
+        service._expires_at = datetime.now(KST) + timedelta(minutes=30)
+        service._korail = MagicMock()
+
+        with pytest.raises(KorailServerError):
+            await service.search_trains("서울", "부산", "20260210", "090000")
+
+
+# ──────────────────────────────────────────────
+# KorailSessionRegistry 테스트
+# ──────────────────────────────────────────────
+
+
+def _logged_in_service(token: str) -> KorailService:
+    """로그인된 상태의 KorailService를 만든다."""
+    service = KorailService(executor=MagicMock())
+    service._session_token = token
+    service._expires_at = datetime.now(KST) + timedelta(minutes=30)
+    return service
+
+
+class TestKorailSessionRegistry:
+    """사용자별 세션 레지스트리 테스트"""
+
+    def test_sessions_are_isolated_by_token(self):
+        """토큰마다 서로 다른 KorailService를 반환한다."""
+        registry = KorailSessionRegistry(max_sessions=10, idle_ttl_seconds=60)
+        alice = _logged_in_service("alice")
+        bob = _logged_in_service("bob")
+        registry.register("alice", alice)
+        registry.register("bob", bob)
+
+        assert registry.get("alice") is alice
+        assert registry.get("bob") is bob
+        assert registry.get("unknown") is None
+
+    def test_lru_eviction(self):
+        """최대 세션 수를 넘으면 가장 오래 사용되지 않은 세션을 제거한다."""
+        registry = KorailSessionRegistry(max_sessions=2, idle_ttl_seconds=60)
+        registry.register("a", _logged_in_service("a"))
+        registry.register("b", _logged_in_service("b"))
+        registry.get("a")  # a를 최근 사용으로 갱신
+        registry.register("c", _logged_in_service("c"))
+
+        assert registry.get("b") is None
+        assert registry.get("a") is not None
+        assert registry.get("c") is not None
+        assert len(registry) == 2
+
+    def test_idle_ttl_eviction(self):
+        """유휴 TTL이 지난 세션은 조회 시 제거된다."""
+        registry = KorailSessionRegistry(max_sessions=10, idle_ttl_seconds=60)
+        registry.register("a", _logged_in_service("a"))
+
+        with patch("services.session_registry.time.monotonic", return_value=1e12):
+            assert registry.get("a") is None
+        assert len(registry) == 0
+
+    def test_expired_korail_session_is_evicted(self):
+        """코레일 세션이 만료된 항목은 조회 시 제거된다."""
+        registry = KorailSessionRegistry(max_sessions=10, idle_ttl_seconds=60)
+        service = _logged_in_service("a")
+        registry.register("a", service)
+        service._expires_at = datetime.now(KST) - timedelta(minutes=1)
+
+        assert registry.get("a") is None
+
+    def test_relogin_replaces_previous_token(self):
+        """같은 서비스가 새 토큰으로 등록되면 이전 토큰은 더 이상 유효하지 않다."""
+        registry = KorailSessionRegistry(max_sessions=10, idle_ttl_seconds=60)
+        service = _logged_in_service("old")
+        registry.register("old", service)
+        registry.register("new", service)
+
+        assert registry.get("old") is None
+        assert registry.get("new") is service
+        assert len(registry) == 1
+
+
+# ──────────────────────────────────────────────
+# WatchService 테스트
+# ──────────────────────────────────────────────
+
+
+def _train(train_no: str, general: bool, special: bool = False) -> TrainInfo:
+    return TrainInfo(
+        train_no=train_no,
+        train_type="KTX",
+        dep_station="서울",
+        arr_station="부산",
+        dep_time="09:00",
+        arr_time="11:30",
+        general_seats=general,
+        special_seats=special,
+    )
+
+
+def _watch_request(**kwargs) -> WatchRequest:
+    params = {
+        "dep_station": "서울",
+        "arr_station": "부산",
+        "date": "20260210",
+        "time": "090000",
+        "interval_seconds": 3.0,
+    }
+    params.update(kwargs)
+    return WatchRequest(**params)
+
+
+def _watch_owner() -> MagicMock:
+    owner = MagicMock(spec=KorailService)
+    owner.is_closed = False
+    return owner
+
+
+async def _wait_until_finished(watch_service, owner, watch_id, timeout=1.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        status = watch_service.get_watch(owner, watch_id).status
+        if status not in ("searching", "reserving"):
+            return status
+        await asyncio.sleep(0.001)
+    raise AssertionError("감시 작업이 종료되지 않았습니다")
+
+
+class TestWatchService:
+    """서버 측 좌석 감시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_found_without_auto_reserve(self):
+        """좌석이 생기면 found 상태로 종료하고 열차 정보를 기록한다."""
+        owner = _watch_owner()
+        owner.search_trains = AsyncMock(
+            return_value=[_train("101", False), _train("103", True)]
+        )
+        watch_service = WatchService()
+
+        created = await watch_service.create_watch(owner, _watch_request())
+        status = await _wait_until_finished(watch_service, owner, created.watch_id)
+
+        assert status == "found"
+        watch = watch_service.get_watch(owner, created.watch_id)
+        assert watch.matched_train.train_no == "103"
+        assert watch.poll_count == 1
+
+    @pytest.mark.asyncio
+    async def test_auto_reserve_immediately(self):
+        """auto_reserve이면 좌석 발견 즉시 예약한다."""
+        owner = _watch_owner()
+        owner.search_trains = AsyncMock(return_value=[_train("101", True)])
+        owner.reserve = AsyncMock(
+            return_value=ReservationResponse(
+                reservation_id="R1",
+                status="success",
+                train=_train("101", True),
+                message="예약 성공",
+                reserved_at=datetime.now(KST).isoformat(),
+            )
+        )
+        watch_service = WatchService()
+
+        created = await watch_service.create_watch(
+            owner, _watch_request(auto_reserve=True)
+        )
+        status = await _wait_until_finished(watch_service, owner, created.watch_id)
+
+        assert status == "success"
+        owner.reserve.assert_awaited_once()
+        assert owner.reserve.await_args.args[0] == "101"
+        watch = watch_service.get_watch(owner, created.watch_id)
+        assert watch.reservation.reservation_id == "R1"
+
+    @pytest.mark.asyncio
+    async def test_train_filter_and_seat_type(self):
+        """지정한 열차 번호와 좌석 유형만 감시한다."""
+        owner = _watch_owner()
+        owner.search_trains = AsyncMock(
+            return_value=[
+                _train("101", True, False),
+                _train("105", True, True),
+            ]
+        )
+        watch_service = WatchService()
+
+        created = await watch_service.create_watch(
+            owner, _watch_request(train_nos=["0105"], seat_type="special")
+        )
+        await _wait_until_finished(watch_service, owner, created.watch_id)
+
+        watch = watch_service.get_watch(owner, created.watch_id)
+        assert watch.matched_train.train_no == "105"
+
+    @pytest.mark.asyncio
+    async def test_session_expired_stops_watch(self):
+        """세션이 만료되면 감시를 failure로 중단한다."""
+        owner = _watch_owner()
+        owner.search_trains = AsyncMock(side_effect=SessionExpiredError())
+        watch_service = WatchService()
+
+        created = await watch_service.create_watch(owner, _watch_request())
+        status = await _wait_until_finished(watch_service, owner, created.watch_id)
+
+        assert status == "failure"
+
+    @pytest.mark.asyncio
+    async def test_cancel_and_ownership(self):
+        """다른 사용자의 감시는 조회/중단할 수 없고, 소유자는 중단할 수 있다."""
+        owner = _watch_owner()
+        owner.search_trains = AsyncMock(side_effect=NoTrainsError())
+        other = _watch_owner()
+        watch_service = WatchService()
+
+        created = await watch_service.create_watch(owner, _watch_request())
+
+        with pytest.raises(WatchNotFoundError):
+            watch_service.get_watch(other, created.watch_id)
+
+        cancelled = await watch_service.cancel_watch(owner, created.watch_id)
+        assert cancelled.status == "cancelled"
+        assert watch_service.list_watches(other) == []
+
+    @pytest.mark.asyncio
+    async def test_per_session_limit(self):
+        """사용자별 최대 감시 수를 넘으면 WatchLimitExceededError를 발생시킨다."""
+        owner = _watch_owner()
+        owner.search_trains = AsyncMock(side_effect=NoTrainsError())
+        watch_service = WatchService()
+        watch_service._max_per_session = 1
+
+        await watch_service.create_watch(owner, _watch_request())
+        with pytest.raises(WatchLimitExceededError):
+            await watch_service.create_watch(owner, _watch_request())
+
+        await watch_service.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_closed_session_stops_watch_without_relogin(self):
+        """세션 레지스트리가 닫은 세션의 감시는 조회하지 않고 failure로 끝난다."""
+        owner = KorailService(store=ReservationStore(":memory:"))
+        owner._korail_id, owner._korail_pw = "user", "pw"
+        owner.login = AsyncMock()
+        owner.close()
+        watch_service = WatchService()
+
+        created = await watch_service.create_watch(owner, _watch_request())
+        status = await _wait_until_finished(watch_service, owner, created.watch_id)
+
+        assert status == "failure"
+        owner.login.assert_not_awaited()
+        with pytest.raises(SessionExpiredError):
+            await owner._ensure_session()
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_finishes_watch(self):
+        """예상하지 못한 예외로 감시 Task가 끝나도 searching 상태로 남지 않는다."""
+        owner = _watch_owner()
+        owner.search_trains = AsyncMock(side_effect=AttributeError("boom"))
+        watch_service = WatchService()
+
+        created = await watch_service.create_watch(owner, _watch_request())
+        status = await _wait_until_finished(watch_service, owner, created.watch_id)
+
+        assert status == "failure"
+
+
+# ──────────────────────────────────────────────
+# SingleFlight 테스트
+# ──────────────────────────────────────────────
+
+
+class TestSingleFlight:
+    """동일 요청 합치기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_upstream_call(self):
+        """동시에 들어온 같은 키의 호출은 업스트림을 한 번만 호출한다."""
+        flight = SingleFlight()
+        call_count = 0
+
+        async def upstream():
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return ["train"]
+
+        results = await asyncio.gather(
+            *(flight.do(("tago", "서울", "부산"), upstream) for _ in range(5))
+        )
+
+        assert call_count == 1
+        assert all(r is results[0] for r in results)
+        assert flight.stats() == {"inflight": 0, "leaders": 1, "followers": 4}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_are_not_shared(self):
+        """키가 다르면 각각 업스트림을 호출한다."""
+        flight = SingleFlight()
+        upstream = AsyncMock(return_value=[])
+
+        await asyncio.gather(
+            flight.do("a", upstream),
+            flight.do("b", upstream),
+        )
+
+        assert upstream.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared(self):
+        """업스트림 예외는 모든 호출자에게 전달된다."""
+        flight = SingleFlight()
+
+        async def upstream():
+            await asyncio.sleep(0.01)
+            raise NoTrainsError()
+
+        results = await asyncio.gather(
+            flight.do("k", upstream),
+            flight.do("k", upstream),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, NoTrainsError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_completed_call_is_not_cached(self):
+        """완료된 호출 결과는 재사용하지 않는다."""
+        flight = SingleFlight()
+        upstream = AsyncMock(return_value=[])
+
+        await flight.do("k", upstream)
+        await flight.do("k", upstream)
+
+        assert upstream.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_follower_cancellation_does_not_cancel_upstream(self):
+        """호출자 하나가 취소되어도 공유 작업은 계속 실행된다."""
+        flight = SingleFlight()
+
+        async def upstream():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.create_task(flight.do("k", upstream))
+        second = asyncio.create_task(flight.do("k", upstream))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done"
+
+
+# ──────────────────────────────────────────────
+# TTLCache / TAGO 시간표 캐시 테스트
+# ──────────────────────────────────────────────
+
+
+class TestTTLCache:
+    """LRU + TTL 캐시 테스트"""
+
+    def test_fresh_and_stale_entries(self):
+        """ttl 이내는 fresh, stale 구간은 stale, 그 이후는 만료된다."""
+        cache = TTLCache(max_entries=10, ttl_seconds=10, stale_seconds=20)
+        with patch("services.cache_service.time.monotonic", return_value=100.0):
+            cache.set("k", "v")
+
+        with patch("services.cache_service.time.monotonic", return_value=105.0):
+            assert cache.get_entry("k") == ("v", True)
+        with patch("services.cache_service.time.monotonic", return_value=125.0):
+            assert cache.get_entry("k") == ("v", False)
+            assert cache.get("k") is None
+        with patch("services.cache_service.time.monotonic", return_value=131.0):
+            assert cache.get_entry("k") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목을 제거한다."""
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+
+def _tago_item(train_no: str, dep_hhmm: str, date: str = "20260210") -> dict:
+    return {
+        "trainno": train_no,
+        "traingradename": "KTX",
+        "depplacename": "서울",
+        "arrplacename": "부산",
+        "depplandtime": int(f"{date}{dep_hhmm}00"),
+        "arrplandtime": int(f"{date}{dep_hhmm}00") + 23000,
+        "adultcharge": 59800,
+    }
+
+
+def _tago_payload(items: list[dict], total_count: Optional[int] = None) -> dict:
+    return {
+        "response": {
+            "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+            "body": {
+                "items": {"item": items} if items else "",
+                "numOfRows": 100,
+                "pageNo": 1,
+                "totalCount": len(items) if total_count is None else total_count,
+            },
+        }
+    }
+
+
+def _tago_service_with(handler) -> TaGoService:
+    """MockTransport를 사용하는 TaGoService를 만든다."""
+    service = TaGoService(api_key="test-key")
+    service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    # 프로세스 전역 서킷/재시도 예산 대신 테스트 전용 인스턴스 사용 (재시도 없음)
+    service._breaker = CircuitBreaker(
+        "tago-test", (httpx.RequestError, httpx.HTTPStatusError),
+        failure_threshold=100, reset_timeout=30,
+    )
+    service._retry_budget = RetryBudget(ratio=0, max_tokens=0)
+    return service
+
+
+class TestTaGoServiceCache:
+    """TAGO 시간표 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_one_cache_entry_serves_every_departure_time(self):
+        """시간 필터는 요청마다 적용되어 같은 날 다른 시간 조회도 캐시를 사용한다."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(
+                200,
+                json=_tago_payload([
+                    _tago_item("101", "0800"),
+                    _tago_item("103", "1000"),
+                    _tago_item("105", "1200"),
+                ]),
+            )
+
+        service = _tago_service_with(handler)
+
+        morning = await service.search_trains("서울", "부산", "20260210", "070000")
+        noon = await service.search_trains("서울", "부산", "20260210", "110000")
+
+        assert [t.train_no for t in morning] == ["101", "103", "105"]
+        assert [t.train_no for t in noon] == ["105"]
+        assert len(calls) == 1
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_empty_result_is_cached(self):
+        """열차가 없는 결과도 캐싱한다."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json=_tago_payload([]))
+
+        service = _tago_service_with(handler)
+
+        for _ in range(2):
+            with pytest.raises(NoTrainsFoundError):
+                await service.search_trains("서울", "부산", "20260210")
+
+        assert len(calls) == 1
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_api_error_is_not_cached(self):
+        """API 오류는 캐싱하지 않는다."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(500)
+
+        service = _tago_service_with(handler)
+
+        for _ in range(2):
+            with pytest.raises(TaGoApiError):
+                await service.search_trains("서울", "부산", "20260210")
+
+        assert len(calls) == 2
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_revalidating(self):
+        """stale 항목은 즉시 응답하고 백그라운드에서 갱신한다."""
+        responses = [
+            _tago_payload([_tago_item("101", "0800")]),
+            _tago_payload([_tago_item("101", "0800"), _tago_item("103", "0900")]),
+        ]
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json=responses[len(calls) - 1])
+
+        service = _tago_service_with(handler)
+        service._cache = TTLCache(max_entries=10, ttl_seconds=0, stale_seconds=60)
+
+        first = await service.search_trains("서울", "부산", "20260210")
+        stale = await service.search_trains("서울", "부산", "20260210")
+        await asyncio.gather(*service._refreshing.values())
+        refreshed = await service.search_trains("서울", "부산", "20260210")
+
+        assert len(first) == 1
+        assert len(stale) == 1
+        assert len(refreshed) == 2
+        assert len(calls) >= 2
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_fetches_remaining_pages_concurrently(self):
+        """totalCount가 한 페이지를 넘으면 나머지 페이지를 동시에 조회하여 합친다."""
+        pages = {
+            "1": [_tago_item("101", "0600"), _tago_item("103", "0700")],
+            "2": [_tago_item("105", "0800"), _tago_item("107", "0900")],
+            "3": [_tago_item("109", "1000")],
+        }
+        requested = []
+        active = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            page_no = request.url.params["pageNo"]
+            requested.append(page_no)
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(
+                200, json=_tago_payload(pages[page_no], total_count=5),
+            )
+
+        service = _tago_service_with(handler)
+        service._page_size = 2
+
+        trains = await service.search_trains("서울", "부산", "20260210", "000000")
+
+        assert sorted(requested) == ["1", "2", "3"]
+        assert peak == 2  # 첫 페이지 이후 2, 3페이지 동시 조회
+        assert [t.train_no for t in trains] == ["101", "103", "105", "107", "109"]
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_max_pages_truncation_is_reported(self):
+        """최대 페이지 수를 넘는 결과는 잘린 사실을 경고와 지표로 남긴다."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page_no = request.url.params["pageNo"]
+            return httpx.Response(
+                200, json=_tago_payload([_tago_item(f"1{page_no}1", "0600")], total_count=5),
+            )
+
+        service = _tago_service_with(handler)
+        service._page_size = 1
+        service._max_pages = 2
+        before = TAGO_TRUNCATED.value()
+
+        with patch("services.tago_service.logger") as mock_logger:
+            trains = await service.search_trains("서울", "부산", "20260210", "000000")
+
+        assert len(trains) == 2
+        assert TAGO_TRUNCATED.value() == before + 1
+        warning = mock_logger.warning.call_args.args
+        assert 5 in warning and 2 in warning  # totalCount, 반환 건수
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_page_error_fails_whole_fetch(self):
+        """페이지 하나라도 실패하면 부분 결과를 캐시하지 않고 TaGoApiError를 발생시킨다."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params["pageNo"] == "2":
+                return httpx.Response(500)
+            return httpx.Response(
+                200, json=_tago_payload([_tago_item("101", "0600")], total_count=2),
+            )
+
+        service = _tago_service_with(handler)
+        service._page_size = 1
+
+        with pytest.raises(TaGoApiError):
+            await service.search_trains("서울", "부산", "20260210", "000000")
+        assert len(service._cache) == 0
+        await service.close()
+
+
+# ──────────────────────────────────────────────
+# TimetableIndex / TimetablePrefetcher 테스트
+# ──────────────────────────────────────────────
+
+
+class TestTimetableIndex:
+    """TAGO 시간표 로컬 인덱스 테스트"""
+
+    def test_put_and_get(self):
+        """저장한 item 목록을 그대로 조회한다."""
+        index = TimetableIndex(":memory:", max_age_seconds=3600)
+        items = [_tago_item("101", "0800")]
+        index.put("NAT010000", "NAT014445", "20260210", None, items)
+
+        assert index.get("NAT010000", "NAT014445", "20260210") == items
+        assert index.get("NAT010000", "NAT014445", "20260211") is None
+        assert index.count() == 1
+
+    def test_expired_entry_is_ignored(self):
+        """유효 기간이 지난 항목은 조회되지 않는다."""
+        index = TimetableIndex(":memory:", max_age_seconds=60)
+        with patch("services.timetable_index.time.time", return_value=1000.0):
+            index.put("A", "B", "20260210", None, [])
+        with patch("services.timetable_index.time.time", return_value=1100.0):
+            assert index.get("A", "B", "20260210") is None
+
+    def test_purge_before(self):
+        """지난 날짜 항목을 삭제한다."""
+        index = TimetableIndex(":memory:", max_age_seconds=3600)
+        index.put("A", "B", "20260209", None, [])
+        index.put("A", "B", "20260210", None, [])
+
+        assert index.purge_before("20260210") == 1
+        assert index.count() == 1
+
+    @pytest.mark.asyncio
+    async def test_tago_service_answers_from_index(self):
+        """인덱스에 있는 시간표는 네트워크 호출 없이 응답한다."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(500)
+
+        index = TimetableIndex(":memory:", max_age_seconds=3600)
+        index.put("NAT010000", "NAT014445", "20260210", None, [_tago_item("101", "0800")])
+        service = _tago_service_with(handler)
+        service._index = index
+
+        trains = await service.search_trains("서울", "부산", "20260210")
+
+        assert [t.train_no for t in trains] == ["101"]
+        assert calls == []
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_network_result_is_written_to_index(self):
+        """네트워크에서 받은 시간표는 인덱스에도 기록된다."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=_tago_payload([_tago_item("101", "0800")]))
+
+        index = TimetableIndex(":memory:", max_age_seconds=3600)
+        service = _tago_service_with(handler)
+        service._index = index
+
+        await service.search_trains("서울", "부산", "20260210")
+
+        assert index.get("NAT010000", "NAT014445", "20260210") is not None
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_prefetcher_respects_request_budget(self):
+        """일괄 수집은 페이지 호출 수로 예산을 세고, 넘으면 남은 작업을 건너뛴다."""
+        outcomes = iter([2, TaGoApiError(), 1])
+
+        async def fetch_timetable(dep, arr, date, on_page=None):
+            outcome = next(outcomes)
+            on_page()
+            if isinstance(outcome, Exception):
+                raise outcome
+            for _ in range(outcome - 1):
+                on_page()
+            return []
+
+        tago = MagicMock()
+        tago.fetch_timetable = AsyncMock(side_effect=fetch_timetable)
+        index = TimetableIndex(":memory:", max_age_seconds=3600)
+        prefetcher = TimetablePrefetcher(
+            tago, index, days=2, concurrency=1, max_requests=4,
+        )
+
+        with patch("services.timetable_index.logger") as mock_logger:
+            stats = await prefetcher.run_once()
+
+        total_jobs = 2 * len(TimetablePrefetcher.station_pairs())
+        assert tago.fetch_timetable.await_count == 3
+        assert stats["api_calls"] == 4
+        assert stats["requested"] == 3
+        assert stats["succeeded"] == 2
+        assert stats["failed"] == 1
+        assert stats["skipped"] == total_jobs - 3
+        assert mock_logger.warning.call_count == 2
+
+    def test_station_pairs_are_unique(self):
+        """같은 NAT 코드를 가진 역명은 한 번만 수집한다."""
+        pairs = TimetablePrefetcher.station_pairs()
+
+        assert len(pairs) == len(set(pairs))
+        assert all(dep != arr for dep, arr in pairs)
+
+
+# ──────────────────────────────────────────────
+# AccountRateGovernor 테스트
+# ──────────────────────────────────────────────
+
+
+def _mock_korail_train(train_no: str = "101") -> MagicMock:
+    train = MagicMock()
+    train.train_no = train_no
+    train.train_type_name = "KTX"
+    train.dep_station_name = "서울"
+    train.arr_station_name = "부산"
+    train.dep_time = "090000"
+    train.arr_time = "113000"
+    train.has_general_seat.return_value = True
+    train.has_special_seat.return_value = False
+    return train
+
+
+class TestAccountRateGovernor:
+    """계정별 호출량 제한 테스트"""
+
+    def test_bucket_refills_at_rate(self):
+        """토큰은 초당 rate개씩 burst까지 채워진다."""
+        with patch("services.rate_limiter.time.monotonic", return_value=100.0):
+            bucket = TokenBucket(rate=2.0, burst=2.0)
+            assert bucket.try_acquire()
+            assert bucket.try_acquire()
+            assert not bucket.try_acquire()
+            assert bucket.wait_time() == pytest.approx(0.5)
+
+        with patch("services.rate_limiter.time.monotonic", return_value=100.5):
+            assert bucket.try_acquire()
+            assert not bucket.try_acquire()
+
+        with patch("services.rate_limiter.time.monotonic", return_value=200.0):
+            assert bucket.tokens == pytest.approx(2.0)
+
+    def test_searches_cannot_use_reserved_tokens(self):
+        """열차 조회는 예비 토큰을 남겨 두고, 예약/취소만 예비 토큰을 사용한다."""
+        with patch("services.rate_limiter.time.monotonic", return_value=100.0):
+            governor = AccountRateGovernor(
+                "tester", rate=0.001, burst=3, reserved=2, max_wait_seconds=0,
+            )
+            assert governor.try_acquire_low()
+            assert not governor.try_acquire_low()
+
+            asyncio.run(governor.acquire_high())
+            asyncio.run(governor.acquire_high())
+            with pytest.raises(RateLimitTimeout):
+                asyncio.run(governor.acquire_high())
+
+        stats = governor.stats()
+        assert stats["granted_low"] == 1
+        assert stats["granted_high"] == 2
+        assert stats["throttled"] == 1
+        assert stats["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_priority_call_waits_for_refill(self):
+        """예약/취소는 최대 대기 시간 안에서 토큰이 채워지기를 기다린다."""
+        governor = AccountRateGovernor(
+            "tester", rate=50.0, burst=1, reserved=0, max_wait_seconds=1,
+        )
+        await governor.acquire_high()
+
+        await asyncio.wait_for(governor.acquire_high(), timeout=1)
+
+        assert governor.stats()["granted_high"] == 2
+
+    def test_governor_is_shared_per_account(self):
+        """같은 계정의 세션은 하나의 관리자를 공유한다."""
+        first = get_account_governor("shared-account")
+        second = get_account_governor("shared-account")
+        other = get_account_governor("other-account")
+
+        assert first is second
+        assert first is not other
+
+    @pytest.mark.asyncio
+    async def test_over_budget_search_returns_last_result(self):
+        """호출량을 넘은 조회는 업스트림 대신 최근 조회 결과로 응답한다."""
+        service = _logged_in_service("token")
+        service._executor = KorailExecutor(max_workers=1, max_queue=4)
+        service._korail = MagicMock()
+        service._korail.search_train_allday.return_value = [_mock_korail_train()]
+        service._governor = AccountRateGovernor(
+            "tester", rate=0.001, burst=1, reserved=0,
+        )
+
+        first = await service.search_trains("서울", "부산", "20260210", "090000")
+        second = await service.search_trains("서울", "부산", "20260210", "090000")
+
+        assert second == first
+        assert service._korail.search_train_allday.call_count == 1
+        with pytest.raises(RateLimitExceededError):
+            await service.search_trains("서울", "대전", "20260210", "090000")
+        service._executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_each_upstream_attempt_uses_a_token(self):
+        """재시도한 조회는 시도마다 조회 토큰을 사용한다."""
+        service = _logged_in_service("token")
+        service._executor = KorailExecutor(max_workers=1, max_queue=4)
+        service._retry_budget = RetryBudget(ratio=0, max_tokens=1)
+        service._korail = MagicMock()
+        service._korail.search_train_allday.side_effect = [
+            ConnectionError("reset"), [_mock_korail_train()],
+        ]
+        service._governor = AccountRateGovernor(
+            "tester", rate=0.001, burst=10, reserved=0,
+        )
+
+        with patch("services.korail_service.UPSTREAM_RETRY_BASE_DELAY", 0):
+            await service.search_trains("서울", "부산", "20260210", "090000")
+
+        assert service._korail.search_train_allday.call_count == 2
+        assert service._governor.stats()["granted_low"] == 2
+        service._executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_reserve_charges_search_and_reserve_as_priority(self):
+        """핸들 없이 예약하면 재조회와 예약 모두 우선 토큰을 사용한다."""
+        _match_indexes.clear()
+        service = _logged_in_service("token")
+        service._executor = KorailExecutor(max_workers=1, max_queue=4)
+        service._korail = MagicMock()
+        service._korail.search_train_allday.return_value = [_mock_korail_train("101")]
+        service._korail.reserve.return_value = MagicMock(rsv_id="R1")
+        service._governor = AccountRateGovernor(
+            "tester", rate=0.001, burst=10, reserved=0,
+        )
+
+        await service.reserve("101", "general", "서울", "부산", "20260210", "090000")
+
+        stats = service._governor.stats()
+        assert stats["granted_high"] == 2
+        assert stats["granted_low"] == 0
+        service._executor.shutdown()
+
+
+# ──────────────────────────────────────────────
+# 열차 핸들 예약 테스트
+# ──────────────────────────────────────────────
+
+
+class TestTrainHandles:
+    """조회 결과 핸들로 재조회 없이 예약하는 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        _train_handles.clear()
+        _match_indexes.clear()
+        service = _logged_in_service("token")
+        service._executor = KorailExecutor(max_workers=1, max_queue=4)
+        service._korail = MagicMock()
+        service._korail.search_train_allday.return_value = [_mock_korail_train("101")]
+        service._korail.reserve.return_value = MagicMock(rsv_id="R1")
+        yield service
+        service._executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_reserve_with_handle_skips_search(self, service):
+        """유효한 핸들이면 재조회 없이 보관된 Train 객체로 예약한다."""
+        trains = await service.search_trains("서울", "부산", "20260210", "090000")
+        assert trains[0].handle
+
+        result = await service.reserve(
+            "101", "general", "서울", "부산", "20260210", handle=trains[0].handle,
+        )
+
+        assert result.reservation_id == "R1"
+        assert service._korail.search_train_allday.call_count == 1
+        reserved_train = service._korail.reserve.call_args.args[0]
+        assert reserved_train is service._korail.search_train_allday.return_value[0]
+
+    @pytest.mark.asyncio
+    async def test_unknown_handle_falls_back_to_search(self, service):
+        """핸들이 없거나 만료되었으면 검색 조건으로 재조회한다."""
+        await service.reserve(
+            "101", "general", "서울", "부산", "20260210", handle="expired",
+        )
+
+        assert service._korail.search_train_allday.call_count == 1
+        service._korail.reserve.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_sold_out_handle_is_not_used(self, service):
+        """조회 당시 좌석이 없던 Train 객체는 사용하지 않고 재조회한다."""
+        stale = _mock_korail_train("101")
+        stale.has_seat.return_value = False
+        service._korail.search_train_allday.return_value = [stale]
+        trains = await service.search_trains("서울", "부산", "20260210", "090000")
+        service._korail.search_train_allday.return_value = [_mock_korail_train("101")]
+
+        await service.reserve(
+            "101", "general", "서울", "부산", "20260210", handle=trains[0].handle,
+        )
+
+        assert service._korail.search_train_allday.call_count == 2
+        assert service._korail.reserve.call_args.args[0] is not stale
+
+    @pytest.mark.asyncio
+    async def test_repeated_reserve_reuses_match_index(self, service):
+        """핸들 없이 반복 예약해도 같은 조건의 조회는 한 번만 실행한다."""
+        service._korail.reserve.side_effect = [
+            SoldOutError(), SoldOutError(), MagicMock(rsv_id="R2"),
+        ]
+
+        for _ in range(2):
+            with pytest.raises(SoldOutError):
+                await service.reserve("101", "general", "서울", "부산", "20260210", "090000")
+        result = await service.reserve("101", "general", "서울", "부산", "20260210", "090000")
+
+        assert result.reservation_id == "R2"
+        assert service._korail.search_train_allday.call_count == 1
+        assert service._korail.reserve.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_match_index_falls_back_to_departure_time(self, service):
+        """열차 번호가 다르면 출발 HHmm으로 매칭한다."""
+        await service.reserve("KTX-999", "general", "서울", "부산", "20260210", "09:00")
+
+        reserved_train = service._korail.reserve.call_args.args[0]
+        assert reserved_train.train_no == "101"
+
+
+# ──────────────────────────────────────────────
+# ReservationStore 테스트
+# ──────────────────────────────────────────────
+
+
+def _reservation_detail(reservation_id: str, deadline: datetime) -> ReservationDetailResponse:
+    return ReservationDetailResponse(
+        reservation_id=reservation_id,
+        status="success",
+        train=_train("101", general=True),
+        reserved_at=datetime.now(KST).isoformat(),
+        payment_deadline=deadline.isoformat(),
+    )
+
+
+class TestReservationStore:
+    """예약 영속 저장소 테스트"""
+
+    def test_lookup_is_scoped_to_owner(self):
+        """다른 계정의 예약은 조회되지 않는다."""
+        store = ReservationStore(":memory:")
+        deadline = datetime.now(KST) + timedelta(minutes=10)
+        store.put("alice", _reservation_detail("R1", deadline))
+
+        assert store.get("alice", "R1").reservation_id == "R1"
+        assert store.get("bob", "R1") is None
+        store.close()
+
+    def test_from_env_defaults_to_data_file(self, tmp_path, monkeypatch):
+        """경로를 지정하지 않으면 data/reservations.sqlite3 파일에 저장한다."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("RESERVATION_STORE_PATH", raising=False)
+        store = ReservationStore.from_env()
+        store.close()
+
+        assert (tmp_path / "data" / "reservations.sqlite3").exists()
+
+    def test_sweep_expires_past_deadlines(self):
+        """결제 기한이 지난 예약은 조회되지 않고 sweep 시 삭제된다."""
+        store = ReservationStore(":memory:")
+        now = datetime.now(KST)
+        store.put("alice", _reservation_detail("OLD", now - timedelta(seconds=1)))
+        store.put("alice", _reservation_detail("NEW", now + timedelta(minutes=10)))
+
+        assert store.get("alice", "OLD") is None
+        assert store.sweep() == 1
+        assert store.count() == 1
+        assert store.next_deadline() == pytest.approx(
+            (now + timedelta(minutes=10)).timestamp()
+        )
+        store.close()
+
+    def test_survives_restart(self, tmp_path):
+        """파일 저장소는 다시 열어도 예약과 만료 일정이 유지된다."""
+        path = str(tmp_path / "reservations.sqlite3")
+        deadline = datetime.now(KST) + timedelta(minutes=10)
+        store = ReservationStore(path)
+        store.put("alice", _reservation_detail("R1", deadline))
+        store.close()
+
+        reopened = ReservationStore(path)
+
+        assert reopened.get("alice", "R1") is not None
+        assert reopened.next_deadline() == pytest.approx(deadline.timestamp())
+        reopened.close()
+
+    def test_replace_owner_drops_missing_reservations(self):
+        """예약 목록 갱신 시 목록에 없는 예약(결제/취소됨)은 제거된다."""
+        store = ReservationStore(":memory:")
+        deadline = datetime.now(KST) + timedelta(minutes=10)
+        store.put("alice", _reservation_detail("R1", deadline))
+        store.put("bob", _reservation_detail("R9", deadline))
+
+        store.replace_owner("alice", [_reservation_detail("R2", deadline)])
+
+        assert store.get("alice", "R1") is None
+        assert store.get("alice", "R2") is not None
+        assert store.get("bob", "R9") is not None
+        store.close()
+
+    def test_unknown_deadline_is_kept_across_refreshes(self):
+        """결제 기한을 모르는 예약은 목록을 다시 받아도 처음 정한 기한에 만료된다."""
+        store = ReservationStore(":memory:")
+        detail = _reservation_detail("R1", datetime.now(KST)).model_copy(
+            update={"payment_deadline": None}
+        )
+        with patch("services.reservation_store.time.time", return_value=1000.0):
+            store.replace_owner("alice", [detail])
+        with patch("services.reservation_store.time.time", return_value=1500.0):
+            store.replace_owner("alice", [detail])
+            store.put("alice", detail)
+
+        assert store.next_deadline() == 1000.0 + 600
+        assert store.stats()["pending_deadlines"] == 1
+        assert store.sweep(now=1000.0 + 601) == 1
+        store.close()
+
+    @pytest.mark.asyncio
+    async def test_get_reservation_uses_store(self):
+        """저장소에 있는 예약은 코레일 재조회 없이 반환한다."""
+        store = ReservationStore(":memory:")
+        service = KorailService(executor=MagicMock(), store=store)
+        service._session_token = "token"
+        service._expires_at = datetime.now(KST) + timedelta(minutes=30)
+        service._korail_id = "010-1234"
+        service._korail = MagicMock()
+        store.put(
+            owner_key("010-1234"),
+            _reservation_detail("R1", datetime.now(KST) + timedelta(minutes=10)),
+        )
+
+        detail = await service.get_reservation("R1")
+
+        assert detail.reservation_id == "R1"
+        service._korail.reservations.assert_not_called()
+        store.close()
+
+
+# ──────────────────────────────────────────────
+# 예약 목록 캐시 테스트
+# ──────────────────────────────────────────────
+
+
+def _mock_korail_reservation(rsv_id: str) -> MagicMock:
+    rsv = MagicMock()
+    rsv.rsv_id = rsv_id
+    rsv.train_no = "101"
+    rsv.train_type_name = "KTX"
+    rsv.dep_station_name = "서울"
+    rsv.arr_station_name = "부산"
+    rsv.dep_time = "090000"
+    rsv.arr_time = "113000"
+    rsv.rsv_date = "20260210"
+    rsv.pay_limit_date = None
+    return rsv
+
+
+class TestReservationListCache:
+    """계정별 예약 목록 캐시 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        _reservation_lists.clear()
+        _reservation_generations.clear()
+        service = KorailService(
+            executor=KorailExecutor(max_workers=2, max_queue=8),
+            store=ReservationStore(":memory:"),
+        )
+        service._session_token = "token"
+        service._expires_at = datetime.now(KST) + timedelta(minutes=30)
+        service._korail_id = "010-1234"
+        service._korail = MagicMock()
+        service._korail.reservations.return_value = [_mock_korail_reservation("R1")]
+        yield service
+        service._executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_call(self, service):
+        """동시 조회는 korail2 호출 하나로 합치고, 이후 조회는 캐시를 사용한다."""
+        results = await asyncio.gather(
+            *(service.list_reservations() for _ in range(5))
+        )
+        await service.list_reservations()
+
+        assert all(len(r) == 1 for r in results)
+        assert service._korail.reservations.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_reserve_invalidates_cache(self, service):
+        """예약 성공 후에는 예약 목록을 다시 조회한다."""
+        await service.list_reservations()
+        service._korail.search_train_allday.return_value = [_mock_korail_train("101")]
+        service._korail.reserve.return_value = MagicMock(rsv_id="R2")
+        service._korail.reservations.return_value = [
+            _mock_korail_reservation("R1"), _mock_korail_reservation("R2"),
+        ]
+
+        await service.reserve("101", "general", "서울", "부산", "20260210", "090000")
+        reservations = await service.list_reservations()
+
+        assert [r.reservation_id for r in reservations] == ["R1", "R2"]
+        assert service._korail.reservations.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_load_is_not_cached(self, service):
+        """무효화 전에 시작된 조회 결과는 캐시에 남기지 않는다."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_reservations():
+            started.set()
+            release.wait(timeout=2)
+            return [_mock_korail_reservation("OLD")]
+
+        service._korail.reservations.side_effect = slow_reservations
+        pending = asyncio.ensure_future(service.list_reservations())
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 2)
+
+        service._invalidate_reservations()
+        release.set()
+        await pending
+
+        assert len(_reservation_lists) == 0
+
+    @pytest.mark.asyncio
+    async def test_close_drops_generation_without_caching_stale_load(self, service):
+        """세션을 닫으면 계정의 무효화 세대를 지우고, 진행 중이던 조회는 캐시하지 않는다."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_reservations():
+            started.set()
+            release.wait(timeout=2)
+            return [_mock_korail_reservation("OLD")]
+
+        service._korail.reservations.side_effect = slow_reservations
+        pending = asyncio.ensure_future(service.list_reservations())
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 2)
+
+        service._invalidate_reservations()
+        service.close()
+        assert _reservation_generations == {}
+        release.set()
+        await asyncio.gather(pending, return_exceptions=True)
+
+        assert len(_reservation_lists) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_returns_before_verification(self, service):
+        """취소 응답은 확인 조회를 기다리지 않고, 확인 결과는 나중에 기록된다."""
+        await service.list_reservations()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_reservations():
+            started.set()
+            release.wait(timeout=2)
+            return []
+
+        service._korail.reservations.side_effect = slow_reservations
+        service._korail._session.get.return_value = MagicMock(
+            status_code=200, text='{"strResult": "SUCC"}',
+        )
+
+        result = await service.cancel_reservation("R1")
+
+        assert result["verification"] == "pending"
+        assert service.get_cancel_verification("R1") == "pending"
+
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 2)
+        release.set()
+        await asyncio.gather(*service._background_tasks)
+
+        assert service.get_cancel_verification("R1") == "confirmed"
+        assert service.get_cancel_verification("R9") is None
+
+    @pytest.mark.asyncio
+    async def test_cancel_verification_still_exists(self, service):
+        """재조회 목록에 예약이 남아 있으면 still_exists로 기록한다."""
+        await service.list_reservations()
+        service._korail._session.get.return_value = MagicMock(
+            status_code=200, text='{"strResult": "SUCC"}',
+        )
+
+        await service.cancel_reservation("R1")
+        await asyncio.gather(*service._background_tasks)
+
+        assert service.get_cancel_verification("R1") == "still_exists"
+
+    @pytest.mark.asyncio
+    async def test_cancel_batch_resolves_with_one_lookup(self, service):
+        """일괄 취소는 예약 목록을 한 번만 조회하고 항목별 결과를 반환한다."""
+        service._korail.reservations.return_value = [
+            _mock_korail_reservation("R1"), _mock_korail_reservation("R2"),
+        ]
+
+        def cancel(url, params):
+            if params["txtPnrNo"] == "R2":
+                return MagicMock(
+                    status_code=200,
+                    text='{"strResult": "FAIL", "h_msg_txt": "취소 불가"}',
+                )
+            return MagicMock(status_code=200, text='{"strResult": "SUCC"}')
+
+        service._korail._session.get.side_effect = cancel
+
+        outcomes = dict(await service.cancel_reservations(["R1", "R2", "R3", "R1"]))
+        await asyncio.gather(*service._background_tasks)
+
+        assert list(outcomes) == ["R1", "R2", "R3"]
+        assert outcomes["R1"]["status"] == "cancelled"
+        assert outcomes["R2"].code == "RESERVE_004"
+        assert outcomes["R3"].code == "RESERVE_003"
+        assert service._korail._session.get.call_count == 2
+        # 목록 조회 1회 + 취소 확인 조회 1회
+        assert service._korail.reservations.call_count == 2
+
+
+# ──────────────────────────────────────────────
+# Metrics 테스트
+# ──────────────────────────────────────────────
+
+
+class TestMetrics:
+    """Prometheus 지표 테스트"""
+
+    def test_histogram_renders_cumulative_buckets(self):
+        """버킷은 누적 개수로, _sum/_count와 함께 내보낸다."""
+        histogram = Histogram("op_seconds", "도움말", ("op",), buckets=(0.1, 1.0))
+        histogram.observe(0.05, "search")
+        histogram.observe(0.5, "search")
+        histogram.observe(3.0, "search")
+
+        lines = histogram.render()
+
+        assert '# TYPE op_seconds histogram' in lines
+        assert 'op_seconds_bucket{op="search",le="0.1"} 1' in lines
+        assert 'op_seconds_bucket{op="search",le="1"} 2' in lines
+        assert 'op_seconds_bucket{op="search",le="+Inf"} 3' in lines
+        assert 'op_seconds_count{op="search"} 3' in lines
+        assert histogram.quantile(0.5, "search") == 1.0
+        assert histogram.quantile(1.0, "search") == 3.0
+
+    def test_counter_escapes_label_values(self):
+        counter = Counter("errors_total", "도움말", ("code",))
+        counter.inc('A"1')
+        counter.inc('A"1')
+
+        assert 'errors_total{code="A\\"1"} 2' in counter.render()
+
+    @pytest.mark.asyncio
+    async def test_track_upstream_records_failures(self):
+        """실패한 호출도 지연 시간과 실패 수를 기록하고 in-flight 수를 되돌린다."""
+        UPSTREAM_DURATION.clear()
+        UPSTREAM_ERRORS.clear()
+
+        with pytest.raises(OSError):
+            async with track_upstream("korail", "cancel"):
+                raise OSError("reset")
+
+        assert UPSTREAM_DURATION.series("korail", "cancel").count == 1
+        assert UPSTREAM_ERRORS.value("korail", "cancel") == 1
+        assert UPSTREAM_IN_FLIGHT.value("korail") == 0
+
+    @pytest.mark.asyncio
+    async def test_korail_metrics_record_only_executed_upstream_calls(self):
+        """결과 없음은 실패로 세지 않고, 서킷 거부는 업스트림 호출로 기록하지 않는다."""
+        UPSTREAM_DURATION.clear()
+        UPSTREAM_ERRORS.clear()
+        service = KorailService(store=ReservationStore(":memory:"))
+        service._breaker = CircuitBreaker(
+            "korail-metrics-test", (OSError,), failure_threshold=1, reset_timeout=30,
+        )
+
+        def search_train_allday():
+            raise NoResultsError()
+
+        def reserve():
+            raise OSError("reset")
+
+        with pytest.raises(NoResultsError):
+            await service._run(search_train_allday)
+        with pytest.raises(OSError):
+            await service._run(reserve)
+        # 서킷이 열린 뒤의 호출은 워커에서 실행되지 않는다
+        with pytest.raises(KorailServerError):
+            await service._run(reserve)
+
+        assert UPSTREAM_DURATION.series("korail", "search").count == 1
+        assert UPSTREAM_ERRORS.value("korail", "search") == 0
+        assert UPSTREAM_DURATION.series("korail", "reserve").count == 1
+        assert UPSTREAM_ERRORS.value("korail", "reserve") == 1
+
+    def test_cache_metrics_aggregate_by_name(self):
+        """같은 이름의 캐시 통계는 합쳐서 내보낸다."""
+        caches = [TTLCache(max_entries=4, ttl_seconds=60, name="metrics-test") for _ in range(2)]
+        for cache in caches:
+            cache.set("k", 1)
+            cache.get("k")
+            cache.get("missing")
+
+        text = render_metrics()
+
+        assert 'cache_hits_total{cache="metrics-test"} 2' in text
+        assert 'cache_misses_total{cache="metrics-test"} 2' in text
+        assert 'cache_entries{cache="metrics-test"} 2' in text
+
+    def test_cache_counters_survive_cache_gc(self):
+        """사라진 캐시의 누적 통계도 유지되어 카운터가 줄지 않는다."""
+        cache = TTLCache(max_entries=4, ttl_seconds=60, name="metrics-gc-test")
+        cache.set("k", 1)
+        cache.get("k")
+        cache.get("missing")
+        assert 'cache_hits_total{cache="metrics-gc-test"} 1' in render_metrics()
+
+        del cache
+        survivor = TTLCache(max_entries=4, ttl_seconds=60, name="metrics-gc-test")
+        survivor.get("missing")
+
+        text = render_metrics()
+        assert 'cache_hits_total{cache="metrics-gc-test"} 1' in text
+        assert 'cache_misses_total{cache="metrics-gc-test"} 2' in text
+        assert 'cache_entries{cache="metrics-gc-test"} 0' in text
+
+
+class TestKorailSimulator:
+    """korail2 시뮬레이터 테스트"""
+
+    class Clock:
+        def __init__(self):
+            self.now = 0.0
+
+        def __call__(self) -> float:
+            return self.now
+
+    def _seat_history(self, seed: int) -> list:
+        clock = self.Clock()
+        korail = SimulatedKorail("sim", "pw", world=SeatWorld(seed=seed, clock=clock))
+        history = []
+        for minute in range(0, 60, 5):
+            clock.now = minute * 60
+            trains = korail.search_train_allday("서울", "부산", "20260210", include_no_seats=True)
+            history.append([(t.train_no, t.general_seat, t.special_seat) for t in trains])
+        return history
+
+    def test_same_seed_replays_same_inventory(self):
+        """같은 시드와 같은 호출 시각이면 좌석 변동이 같다."""
+        assert self._seat_history(7) == self._seat_history(7)
+        assert self._seat_history(7) != self._seat_history(8)
+
+    def test_search_train_allday_pages_like_korail2(self):
+        """search_train은 10개씩, allday는 페이지를 넘겨 하루 전체를 모은다."""
+        world = SeatWorld(seed=1, clock=lambda: 0.0)
+        korail = SimulatedKorail("sim", "pw", world=world)
+
+        page = korail.search_train("서울", "부산", "20260210", "000000", include_no_seats=True)
+        allday = korail.search_train_allday("서울", "부산", "20260210", include_no_seats=True)
+
+        assert len(page) == 10
+        assert len(allday) == world.trains_per_day
+        # 마지막 열차 이후 페이지까지 조회해야 끝을 안다 (korail2와 같음)
+        assert sum(1 for e in world.journal if e["op"] == "search") == 1 + 7
+
+    def test_reserve_and_cancel_update_inventory(self, monkeypatch):
+        """예약은 잔여석을 줄이고, 취소와 결제 기한 만료는 되돌린다."""
+        monkeypatch.setenv("KORAIL_SIM_SOLD_OUT_RATIO", "0")
+        monkeypatch.setenv("KORAIL_SIM_EVENTS_PER_MINUTE", "0")
+        clock = self.Clock()
+        world = reset_world(seed=3, clock=clock)
+        korail = SimulatedKorail("sim", "pw")
+        train = korail.search_train("서울", "부산", "20260210", "000000")[0]
+        inventory = world.inventory("서울", "부산", "20260210", train.train_no)
+        seats = inventory.available["general"]
+
+        first = korail.reserve(train, option="GENERAL_ONLY")
+        korail.reserve(train, option="GENERAL_ONLY")
+        assert inventory.available["general"] == seats - 2
+
+        korail._session.get(KORAIL_CANCEL, params={"txtPnrNo": first.rsv_id})
+        assert inventory.available["general"] == seats - 1
+
+        clock.now = world.pay_window + 1
+        with pytest.raises(NoResultsError):
+            korail.reservations()
+        assert inventory.available["general"] == seats
+
+    def test_journal_is_reproducible(self, monkeypatch):
+        """같은 시드와 시각이면 예약 번호와 날짜까지 호출 기록이 같다."""
+        monkeypatch.setenv("KORAIL_SIM_SOLD_OUT_RATIO", "0")
+
+        def run() -> tuple[list, list]:
+            world = SeatWorld(seed=5, clock=lambda: 60.0, start=datetime(2026, 2, 1, tzinfo=KST))
+            korail = SimulatedKorail("sim", "pw", world=world)
+            train = korail.search_train("서울", "부산", time="000000")[0]
+            rsv = korail.reserve(train)
+            return list(world.journal), [rsv.rsv_id, rsv.rsv_date, rsv.pay_limit_date]
+
+        first, second = run(), run()
+        assert first == second
+        assert first[0][1]["date"] == "20260201"
+        assert first[1][1] == "20260201"
+
+    def test_reserve_sold_out_after_search(self, monkeypatch):
+        """조회 후 다른 예약으로 좌석이 없어지면 SoldOutError."""
+        monkeypatch.setenv("KORAIL_SIM_SOLD_OUT_RATIO", "0")
+        monkeypatch.setenv("KORAIL_SIM_EVENTS_PER_MINUTE", "0")
+        world = SeatWorld(seed=3, clock=lambda: 0.0)
+        korail = SimulatedKorail("sim", "pw", world=world)
+        train = korail.search_train("서울", "부산", "20260210", "000000")[0]
+        world.inventory("서울", "부산", "20260210", train.train_no).available["general"] = 0
+
+        with pytest.raises(KorailSoldOutError):
+            korail.reserve(train, option="GENERAL_ONLY")
+
+
+class TestUpstreamCassette:
+    """업스트림 녹화/재생 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_tago_record_then_replay_without_api_key(self, tmp_path):
+        """녹화한 TAGO 응답을 serviceKey 없이 재생하고, 다른 날짜 조회도 같은 경로로 재생한다."""
+        path = str(tmp_path / "tago.jsonl.gz")
+        payload = _tago_payload([_tago_item("101", "0800")])
+        recorder = RecordingTransport(
+            Cassette(path, "record"),
+            inner=httpx.MockTransport(lambda request: httpx.Response(200, json=payload)),
+        )
+        async with httpx.AsyncClient(transport=recorder) as client:
+            await client.get(
+                "http://tago.test/getStrtpntAlocFndTrainInfo",
+                params={"serviceKey": "secret", "depPlandTime": "20260210"},
+            )
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert "secret" not in f.read()
+
+        replay = ReplayTransport(Cassette(path, "replay", speed=0))
+        async with httpx.AsyncClient(transport=replay) as client:
+            exact = await client.get(
+                "http://other.test/getStrtpntAlocFndTrainInfo",
+                params={"serviceKey": "other", "depPlandTime": "20260210"},
+            )
+            other_day = await client.get(
+                "http://other.test/getStrtpntAlocFndTrainInfo",
+                params={"depPlandTime": "20260301"},
+            )
+            with pytest.raises(httpx.ConnectError):
+                await client.get("http://other.test/unknown")
+
+        assert exact.json() == payload
+        assert other_day.json() == payload
+
+    def test_korail_record_scrubs_credentials(self, tmp_path):
+        """코레일 로그인 요청의 비밀번호와 응답의 세션 키/회원 정보를 지우고 녹화한다."""
+        import requests
+
+        class LoginAdapter(requests.adapters.BaseAdapter):
+            def send(self, request, **kwargs):
+                response = requests.Response()
+                response.status_code = 200
+                response._content = json.dumps({
+                    "strResult": "SUCC", "Key": "session-key",
+                    "strMbCrdNo": "12345678", "strCustNm": "홍길동",
+                }, ensure_ascii=False).encode("utf-8")
+                response.encoding = "utf-8"
+                return response
+
+            def close(self):
+                pass
+
+        path = str(tmp_path / "korail.jsonl.gz")
+        session = requests.Session()
+        session.mount("https://", RecordingAdapter(Cassette(path, "record"), inner=LoginAdapter()))
+        session.post(
+            "https://korail.test/login",
+            data={"txtMemberNo": "12345678", "txtPwd": "encrypted", "Device": "AD"},
+        )
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            recorded = f.read()
+        for secret in ("12345678", "encrypted", "session-key", "홍길동"):
+            assert secret not in recorded
+
+        session = requests.Session()
+        session.mount("https://", ReplayAdapter(Cassette(path, "replay", speed=0)))
+        replayed = session.post(
+            "https://korail.test/login",
+            data={"txtMemberNo": "87654321", "txtPwd": "other", "Device": "AD"},
+        ).json()
+
+        assert replayed["strResult"] == "SUCC"
+        assert replayed["Key"] == "***"
+
+
+class TestHttpClient:
+    """업스트림 HTTP 클라이언트 팩토리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_client_uses_configured_pool_and_timeouts(self, monkeypatch):
+        monkeypatch.setenv("TEST_HTTP_MAX_CONNECTIONS", "7")
+        monkeypatch.setenv("TEST_HTTP_MAX_KEEPALIVE", "5")
+        monkeypatch.setenv("TEST_HTTP_KEEPALIVE_EXPIRY_SECONDS", "90")
+        monkeypatch.setenv("TEST_HTTP_CONNECT_TIMEOUT_SECONDS", "2")
+        monkeypatch.setenv("TEST_HTTP_READ_TIMEOUT_SECONDS", "15")
+        monkeypatch.setenv("TEST_HTTP_POOL_TIMEOUT_SECONDS", "12")
+        # h2가 없으면 HTTP/1.1로 대체한다
+        monkeypatch.setenv("TEST_HTTP2", "true")
+
+        client = create_async_client(HttpClientConfig("TEST"))
+        pool = client._transport._pool
+
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 5
+        assert pool._keepalive_expiry == 90
+        assert client.timeout.connect == 2
+        assert client.timeout.read == 15
+        assert client.timeout.pool == 12
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_sends_concurrent_head_requests(self):
+        """예열은 연결 수만큼 HEAD 요청을 보내고, 실패는 무시한다."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            if len(calls) == 3:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(404)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            warmed = await warm_up(client, "http://tago.test/", 3)
+
+        assert calls == ["HEAD", "HEAD", "HEAD"]
+        assert warmed == 2
+
+    @pytest.mark.asyncio
+    async def test_keep_warm_repeats_until_cancelled(self):
+        """주기를 주면 keep-alive 유지 시간이 지나 닫힌 연결도 다시 예열한다."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            return httpx.Response(404)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await keep_warm(client, "http://tago.test/", 1, 0)
+            assert calls == ["HEAD"]
+
+            task = asyncio.create_task(keep_warm(client, "http://tago.test/", 1, 0.01))
+            while len(calls) < 4:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    @pytest.mark.asyncio
+    async def test_tago_service_skips_warm_up_while_recording(self, monkeypatch, tmp_path):
+        """카세트 녹화 중에는 예열 요청을 보내지 않는다."""
+        monkeypatch.setenv("UPSTREAM_CASSETTE_MODE", "record")
+        monkeypatch.setenv("UPSTREAM_CASSETTE_DIR", str(tmp_path))
+        service = TaGoService(api_key="test-key")
+
+        await service.start()
+
+        assert service._warmup_task is None
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_tago_service_creates_client_on_start_and_closes_it(self, monkeypatch):
+        monkeypatch.setenv("TAGO_HTTP_WARM_CONNECTIONS", "0")
+        service = TaGoService(api_key="test-key")
+        assert service._client is None
+
+        await service.start()
+        client = service._client
+        await service.close()
+
+        assert client is not None and client.is_closed
+        assert service._client is None